@@ -7,7 +7,6 @@ https://home-assistant.io/...
 import asyncio
 import logging
 from datetime import timedelta
-import time
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -20,13 +19,16 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     EVENT_HOMEASSISTANT_STARTED,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, SupportsResponse
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.storage import Store
 from .pybuspro.buspro import Buspro
 from custom_components.buspro.scheduler import Scheduler
 from .helpers import signal_buspro_ready
 from homeassistant.util import dt
-from .const import CONF_TIME_BROADCAST, DATA_BUSPRO
+from .const import CONF_BUS_BACKOFF, CONF_IO_THREAD, CONF_TELEGRAM_EVENTS, CONF_TIME_BROADCAST, DATA_BUSPRO, EVENT_BUSPRO_TELEGRAM
+from .pybuspro.core.metrics import operate_code_name
+from .pybuspro.core.telegram_filter import DEFAULT_MIN_INTERVAL, TelegramFilter, TelegramRule
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,13 +40,24 @@ DEFAULT_BROADCAST_PORT = 6000
 
 DEFAULT_CONF_NAME = ""
 
-DEFAULT_SCENE_NAME = "BUSPRO SCENE"
-DEFAULT_SEND_MESSAGE_NAME = "BUSPRO MESSAGE"
+# Platforms set up from a config entry, for the bus diagnostic sensors
+ENTRY_PLATFORMS = ["sensor"]
+
+SCENE_TABLE_STORAGE_KEY = f"{DATA_BUSPRO}.scene_table"
+SCENE_TABLE_STORAGE_VERSION = 1
+SCENE_TABLE_SAVE_DELAY = 30
 
 SERVICE_BUSPRO_SEND_MESSAGE = "send_message"
 SERVICE_BUSPRO_ACTIVATE_SCENE = "activate_scene"
 SERVICE_BUSPRO_UNIVERSAL_SWITCH = "set_universal_switch"
 SERVICE_BUSPRO_SYNC_TIME = "sync_time"
+SERVICE_BUSPRO_SET_CHANNEL_LEVELS = "set_channel_levels"
+SERVICE_BUSPRO_SEND_MESSAGES = "send_messages"
+SERVICE_BUSPRO_GET_STATS = "get_stats"
+SERVICE_BUSPRO_DUMP_FRAMES = "dump_frames"
+SERVICE_BUSPRO_START_CAPTURE = "start_capture"
+SERVICE_BUSPRO_STOP_CAPTURE = "stop_capture"
+SERVICE_BUSPRO_REPLAY_CAPTURE = "replay_capture"
 
 SERVICE_BUSPRO_ATTR_OPERATE_CODE = "operate_code"
 SERVICE_BUSPRO_ATTR_ADDRESS = "address"
@@ -52,6 +65,24 @@ SERVICE_BUSPRO_ATTR_PAYLOAD = "payload"
 SERVICE_BUSPRO_ATTR_SCENE_ADDRESS = "scene_address"
 SERVICE_BUSPRO_ATTR_SWITCH_NUMBER = "switch_number"
 SERVICE_BUSPRO_ATTR_STATUS = "status"
+SERVICE_BUSPRO_ATTR_TARGETS = "targets"
+SERVICE_BUSPRO_ATTR_RUNNING_TIME = "running_time"
+SERVICE_BUSPRO_ATTR_MESSAGES = "messages"
+SERVICE_BUSPRO_ATTR_DELAY = "delay"
+SERVICE_BUSPRO_ATTR_AWAIT_RESPONSE = "await_response"
+SERVICE_BUSPRO_ATTR_TIMEOUT = "timeout"
+SERVICE_BUSPRO_ATTR_ADDRESSES = "addresses"
+SERVICE_BUSPRO_ATTR_SUBNET = "subnet"
+SERVICE_BUSPRO_ATTR_COUNT = "count"
+SERVICE_BUSPRO_ATTR_PATH = "path"
+SERVICE_BUSPRO_ATTR_MAX_BYTES = "max_bytes"
+SERVICE_BUSPRO_ATTR_BACKUPS = "backups"
+SERVICE_BUSPRO_ATTR_SPEED = "speed"
+
+CONF_SOURCE = "source"
+CONF_TARGET = "target"
+CONF_OPERATE_CODE = "operate_code"
+CONF_MIN_INTERVAL = "min_interval"
 
 """{ "address": [1,74], "scene_address": [3,5] }"""
 SERVICE_BUSPRO_ACTIVATE_SCENE_SCHEMA = vol.Schema({
@@ -66,6 +97,14 @@ SERVICE_BUSPRO_SEND_MESSAGE_SCHEMA = vol.Schema({
     vol.Required(SERVICE_BUSPRO_ATTR_PAYLOAD): vol.Any([cv.positive_int]),
 })
 
+"""{ "messages": [{ "address": [1,74], "operate_code": [4,12], "payload": [1,75,0,3] }], "delay": 0, "await_response": true }"""
+SERVICE_BUSPRO_SEND_MESSAGES_SCHEMA = vol.Schema({
+    vol.Required(SERVICE_BUSPRO_ATTR_MESSAGES): [SERVICE_BUSPRO_SEND_MESSAGE_SCHEMA],
+    vol.Optional(SERVICE_BUSPRO_ATTR_DELAY, default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional(SERVICE_BUSPRO_ATTR_AWAIT_RESPONSE, default=False): cv.boolean,
+    vol.Optional(SERVICE_BUSPRO_ATTR_TIMEOUT, default=2.0): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=30)),
+})
+
 """{ "address": [1,100], "switch_number": 100, "status": 1 }"""
 SERVICE_BUSPRO_UNIVERSAL_SWITCH_SCHEMA = vol.Schema({
     vol.Required(SERVICE_BUSPRO_ATTR_ADDRESS): vol.Any([cv.positive_int]),
@@ -73,16 +112,58 @@ SERVICE_BUSPRO_UNIVERSAL_SWITCH_SCHEMA = vol.Schema({
     vol.Required(SERVICE_BUSPRO_ATTR_STATUS): vol.Any(cv.positive_int),
 })
 
-"""{ "address": [1,74] }"""
-SERVICE_BUSPRO_SYNC_TIME_SCHEMA = vol.Schema({
-    vol.Required(SERVICE_BUSPRO_ATTR_ADDRESS): vol.Any([cv.positive_int]),
+"""{ "address": [1,74] } or { "addresses": [[1,74],[1,75]] } or { "subnet": 1 }"""
+SERVICE_BUSPRO_SYNC_TIME_SCHEMA = vol.All(vol.Schema({
+    vol.Optional(SERVICE_BUSPRO_ATTR_ADDRESS): vol.Any([cv.positive_int]),
+    vol.Optional(SERVICE_BUSPRO_ATTR_ADDRESSES): [vol.All([cv.positive_int], vol.Length(min=2, max=2))],
+    vol.Optional(SERVICE_BUSPRO_ATTR_SUBNET): cv.positive_int,
+}), cv.has_at_least_one_key(SERVICE_BUSPRO_ATTR_ADDRESS, SERVICE_BUSPRO_ATTR_ADDRESSES, SERVICE_BUSPRO_ATTR_SUBNET))
+
+"""{ "targets": [[1,74,1,0],[1,74,2,0],[1,75,1,100]], "running_time": 0 }"""
+SERVICE_BUSPRO_SET_CHANNEL_LEVELS_SCHEMA = vol.Schema({
+    vol.Required(SERVICE_BUSPRO_ATTR_TARGETS): [vol.ExactSequence([
+        vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
+        vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=255)),
+        vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+    ])],
+    vol.Optional(SERVICE_BUSPRO_ATTR_RUNNING_TIME, default=0): cv.positive_int,
+})
+
+"""{ "count": 100 }"""
+SERVICE_BUSPRO_DUMP_FRAMES_SCHEMA = vol.Schema({
+    vol.Optional(SERVICE_BUSPRO_ATTR_COUNT): cv.positive_int,
+})
+
+"""{ "path": "/config/buspro_capture.bin", "max_bytes": 52428800, "backups": 3 }"""
+SERVICE_BUSPRO_START_CAPTURE_SCHEMA = vol.Schema({
+    vol.Optional(SERVICE_BUSPRO_ATTR_PATH): cv.string,
+    vol.Optional(SERVICE_BUSPRO_ATTR_MAX_BYTES, default=50 * 1024 * 1024): vol.All(vol.Coerce(int), vol.Range(min=64 * 1024)),
+    vol.Optional(SERVICE_BUSPRO_ATTR_BACKUPS, default=3): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+})
+
+"""{ "path": "/config/buspro_capture.bin", "speed": 10 }"""
+SERVICE_BUSPRO_REPLAY_CAPTURE_SCHEMA = vol.Schema({
+    vol.Required(SERVICE_BUSPRO_ATTR_PATH): cv.string,
+    vol.Optional(SERVICE_BUSPRO_ATTR_SPEED, default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+})
+
+"""{ "source": [1,20], "operate_code": [227,239], "min_interval": 0.5 }"""
+TELEGRAM_EVENT_SCHEMA = vol.Schema({
+    vol.Optional(CONF_SOURCE): vol.All([cv.positive_int], vol.Length(min=2, max=2)),
+    vol.Optional(CONF_TARGET): vol.All([cv.positive_int], vol.Length(min=2, max=2)),
+    vol.Optional(CONF_OPERATE_CODE): vol.All([vol.All(vol.Coerce(int), vol.Range(min=0, max=255))], vol.Length(min=2, max=2)),
+    vol.Optional(CONF_MIN_INTERVAL, default=DEFAULT_MIN_INTERVAL): vol.All(vol.Coerce(float), vol.Range(min=0)),
 })
 
 CONFIG_SCHEMA = vol.Schema({
     DATA_BUSPRO: vol.Schema({
         vol.Required(CONF_BROADCAST_ADDRESS): cv.string,
         vol.Required(CONF_BROADCAST_PORT): cv.port,
-        vol.Optional(CONF_NAME, default=DEFAULT_CONF_NAME): cv.string
+        vol.Optional(CONF_NAME, default=DEFAULT_CONF_NAME): cv.string,
+        vol.Optional(CONF_TELEGRAM_EVENTS): [TELEGRAM_EVENT_SCHEMA],
+        vol.Optional(CONF_IO_THREAD, default=False): cv.boolean,
+        vol.Optional(CONF_BUS_BACKOFF): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
     })
 }, extra=vol.ALLOW_EXTRA)
 
@@ -100,17 +181,25 @@ async def _setup_buspro(hass: HomeAssistant, config_data: dict) -> bool:
         
         host = config_data.get(CONF_BROADCAST_ADDRESS)
         port = config_data.get(CONF_BROADCAST_PORT)
-        await old_module.restart(host, port, time_broadcast)
+        # Not an optional restart argument: leaving bus_backoff out of the config turns it off
+        old_module.hdl.backoff_occupancy = config_data.get(CONF_BUS_BACKOFF)
+        await old_module.restart(host, port, time_broadcast, config_data.get(CONF_IO_THREAD))
+        # Also when the option was removed, so the old filters stop firing
+        old_module.set_telegram_events(config_data.get(CONF_TELEGRAM_EVENTS, []))
         
         return True
 
     host = config_data.get(CONF_BROADCAST_ADDRESS, DEFAULT_BROADCAST_ADDRESS)
     port = config_data.get(CONF_BROADCAST_PORT, DEFAULT_BROADCAST_PORT)
     time_broadcast = config_data.get(CONF_TIME_BROADCAST, True)
+    io_thread = config_data.get(CONF_IO_THREAD, False)
+    backoff_occupancy = config_data.get(CONF_BUS_BACKOFF)
 
-    module = BusproModule(hass, host, port, time_broadcast, existing_scheduler=scheduler)
+    module = BusproModule(hass, host, port, time_broadcast, existing_scheduler=scheduler, io_thread=io_thread,
+                          backoff_occupancy=backoff_occupancy)
     await module.start()
     module.register_services()
+    module.set_telegram_events(config_data.get(CONF_TELEGRAM_EVENTS, []))
     
     hass.data[DATA_BUSPRO] = module
     
@@ -132,9 +221,15 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     """Setup from Config Entry (UI)."""    
     if (not hass.is_running) and (DATA_BUSPRO in hass.data) and _LOGGER.isEnabledFor(logging.DEBUG):
         _LOGGER.debug("Home Assistant is starting and Buspro module already exists, skipping configuration")
-        return True
-        
-    return await _setup_buspro(hass, config_entry.data)
+    elif not await _setup_buspro(hass, config_entry.data):
+        return False
+
+    await hass.config_entries.async_forward_entry_setups(config_entry, ENTRY_PLATFORMS)
+    return True
+
+async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Unload the platforms of a Config Entry; the bus module is kept for the next setup."""
+    return await hass.config_entries.async_unload_platforms(config_entry, ENTRY_PLATFORMS)
 
 async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Reload Buspro integration when user clicks reload in frontend."""
@@ -151,23 +246,42 @@ async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
 
 class BusproModule:
-    def __init__(self, hass, host, port, time_broadcast=True, existing_scheduler=None):
+    def __init__(self, hass, host, port, time_broadcast=True, existing_scheduler=None, io_thread=False, backoff_occupancy=None):
         self.hass = hass
         self.connected = False        
         self.gateway_address_send_receive = ((host, port), ('', port))
-        self.hdl = Buspro(hass, self.gateway_address_send_receive, self.hass.loop)        
+        self.hdl = Buspro(self.gateway_address_send_receive, self.hass.loop, io_thread, backoff_occupancy)
         self.scheduler = existing_scheduler or Scheduler(hass)
         self.entity_lock = asyncio.Lock()
         self._time_sync_registered = False
         self._time_broadcast_enabled = time_broadcast
         self._time_broadcaster_unsub = None
+        self._telegram_filter = None
+        self._scene_table_store = Store(hass, SCENE_TABLE_STORAGE_VERSION, SCENE_TABLE_STORAGE_KEY)
+        self._scene_table_loaded = False
 
     async def start(self):
+        if not self._scene_table_loaded:
+            # Only on the first start; a restart keeps what was learned since
+            await self._load_scene_table()
+            self._scene_table_loaded = True
         await self.hdl.start()
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self.stop)
         self.connected = True
         await self._handle_time_broadcaster()
 
+    async def _load_scene_table(self):
+        """Load learned scene levels into the HDL instance and save them whenever they change."""
+        scene_table = self.hdl.scene_table
+        data = await self._scene_table_store.async_load()
+        if data:
+            scene_table.load(data)
+
+        def save_scene_table():
+            self._scene_table_store.async_delay_save(scene_table.as_dict, SCENE_TABLE_SAVE_DELAY)
+
+        scene_table.on_change = save_scene_table
+
     async def _handle_time_broadcaster(self):
         """Handle time broadcaster based on configuration."""
         if self._time_broadcast_enabled:
@@ -192,7 +306,7 @@ class BusproModule:
         await self.hdl.stop()
         self.connected = False
 
-    async def restart(self, host=None, port=None, time_broadcast=None):
+    async def restart(self, host=None, port=None, time_broadcast=None, io_thread=None):
         """Restart HDL connection with optional new configuration."""
         if host is not None or port is not None:
             old_host, old_port = self.gateway_address_send_receive[0]
@@ -205,10 +319,36 @@ class BusproModule:
         
         await self.stop()
         await asyncio.sleep(0.1)
-        
-        self.hdl = Buspro(self.hass, self.gateway_address_send_receive, self.hass.loop)
+
+        # Keep the client: devices hold a reference to it and their callbacks stay registered
+        self.hdl.gateway_address_send_receive = self.gateway_address_send_receive
+        if io_thread is not None:
+            self.hdl.io_thread = io_thread
         await self.start()
 
+    def set_telegram_events(self, rules):
+        """Fire EVENT_BUSPRO_TELEGRAM for received telegrams matching the telegram_events config."""
+        if self._telegram_filter is not None:
+            self.hdl.unregister_telegram_filter(self._telegram_filter)
+            self._telegram_filter = None
+        telegram_filter = TelegramFilter(
+            [TelegramRule(rule.get(CONF_SOURCE), rule.get(CONF_TARGET), rule.get(CONF_OPERATE_CODE),
+                          rule.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)) for rule in rules],
+            self.hass.loop.time)
+        if telegram_filter:
+            self.hdl.register_telegram_filter(telegram_filter, self._fire_telegram_event)
+            self._telegram_filter = telegram_filter
+
+    def _fire_telegram_event(self, telegram):
+        operate_code = telegram.udp_data[21:23]
+        self.hass.bus.async_fire(EVENT_BUSPRO_TELEGRAM, {
+            CONF_SOURCE: list(telegram.source_address),
+            CONF_TARGET: list(telegram.target_address),
+            CONF_OPERATE_CODE: list(operate_code),
+            "operate_code_name": operate_code_name((operate_code[0] << 8) | operate_code[1]),
+            "payload": list(telegram.payload or []),
+        })
+
     async def entity_initialized(self, entity):
         async with self.entity_lock:
             if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -218,54 +358,123 @@ class BusproModule:
 
     async def service_activate_scene(self, call):
         """Service for activation a __scene"""
-        from .pybuspro.devices.scene import Scene
+        from .pybuspro.devices.commands import activate_scene
 
         attr_address = call.data.get(SERVICE_BUSPRO_ATTR_ADDRESS)
-        attr_scene_address = call.data.get(SERVICE_BUSPRO_ATTR_SCENE_ADDRESS)
-        scene = Scene(self.hass, attr_address, attr_scene_address, DEFAULT_SCENE_NAME)
-        await scene.run()
+        area_number, scene_number = call.data.get(SERVICE_BUSPRO_ATTR_SCENE_ADDRESS)
+        await activate_scene(self.hdl, attr_address, area_number, scene_number)
 
     async def service_send_message(self, call):
         """Service for send an arbitrary message"""
-        from .pybuspro.devices.generic import Generic
+        from .pybuspro.devices.commands import send_message
 
         attr_address = call.data.get(SERVICE_BUSPRO_ATTR_ADDRESS)
         attr_payload = call.data.get(SERVICE_BUSPRO_ATTR_PAYLOAD)
         attr_operate_code = call.data.get(SERVICE_BUSPRO_ATTR_OPERATE_CODE)
-        generic = Generic(self.hass, attr_address, attr_payload, attr_operate_code, DEFAULT_SEND_MESSAGE_NAME)
-        await generic.run()
+        await send_message(self.hdl, attr_address, attr_operate_code, attr_payload)
+
+    async def service_send_messages(self, call):
+        """Service for sending a list of arbitrary messages, returning the outcome of each"""
+        from .pybuspro.devices.commands import send_messages
+
+        messages = call.data.get(SERVICE_BUSPRO_ATTR_MESSAGES)
+        outcomes = await send_messages(
+            self.hdl,
+            [(message[SERVICE_BUSPRO_ATTR_ADDRESS], message[SERVICE_BUSPRO_ATTR_OPERATE_CODE], message[SERVICE_BUSPRO_ATTR_PAYLOAD])
+             for message in messages],
+            delay=call.data.get(SERVICE_BUSPRO_ATTR_DELAY),
+            await_response=call.data.get(SERVICE_BUSPRO_ATTR_AWAIT_RESPONSE),
+            timeout=call.data.get(SERVICE_BUSPRO_ATTR_TIMEOUT),
+        )
+        return {
+            "results": [
+                {
+                    SERVICE_BUSPRO_ATTR_ADDRESS: message[SERVICE_BUSPRO_ATTR_ADDRESS],
+                    SERVICE_BUSPRO_ATTR_OPERATE_CODE: message[SERVICE_BUSPRO_ATTR_OPERATE_CODE],
+                    **outcome,
+                }
+                for message, outcome in zip(messages, outcomes)
+            ]
+        }
+
+    def stats(self):
+        """Return the bus stats together with the scheduler counters."""
+        stats = self.hdl.stats()
+        stats["scheduler"] = {"skipped_busy": self.scheduler.skipped_busy}
+        return stats
+
+    async def service_get_stats(self, call):
+        """Service returning bus metrics"""
+        return self.stats()
+
+    async def service_dump_frames(self, call):
+        """Service returning the most recent raw frames, oldest first"""
+        return {"frames": self.hdl.frame_log.export(call.data.get(SERVICE_BUSPRO_ATTR_COUNT))}
+
+    async def service_start_capture(self, call):
+        """Service recording all bus traffic to a binary capture file"""
+        path = call.data.get(SERVICE_BUSPRO_ATTR_PATH) or self.hass.config.path("buspro_capture.bin")
+        await self.hdl.start_capture(
+            path,
+            max_bytes=call.data.get(SERVICE_BUSPRO_ATTR_MAX_BYTES),
+            backup_count=call.data.get(SERVICE_BUSPRO_ATTR_BACKUPS))
+        _LOGGER.info(f"Capturing bus traffic to {path}")
+
+    async def service_stop_capture(self, call):
+        await self.hdl.stop_capture()
+
+    async def service_replay_capture(self, call):
+        """Service replaying a capture file through the decode and dispatch path, returning throughput figures
+
+        The replay runs on a client of its own with no devices, so the live devices and metrics
+        never see it. That leaves no entity updates to time, and the process peak RSS is Home
+        Assistant's own, so the update stage, the rate including it and peak_rss_kb are left out.
+        """
+        replay_client = Buspro(self.gateway_address_send_receive, self.hass.loop)
+        result = await replay_client.replay(
+            call.data.get(SERVICE_BUSPRO_ATTR_PATH),
+            speed=call.data.get(SERVICE_BUSPRO_ATTR_SPEED))
+        del result["busy_frames_per_second"], result["peak_rss_kb"], result["stages_us_per_frame"]["update"]
+        return result
 
     async def service_set_universal_switch(self, call):
-        from .pybuspro.devices.universal_switch import UniversalSwitch
+        from .pybuspro.devices.commands import set_universal_switch
 
         attr_address = call.data.get(SERVICE_BUSPRO_ATTR_ADDRESS)
         attr_switch_number = call.data.get(SERVICE_BUSPRO_ATTR_SWITCH_NUMBER)
-        universal_switch = UniversalSwitch(self.hass, attr_address, attr_switch_number)
-
         status = call.data.get(SERVICE_BUSPRO_ATTR_STATUS)
-        if status == 1:
-            await universal_switch.set_on()
-        else:
-            await universal_switch.set_off()
+        await set_universal_switch(self.hdl, attr_address, attr_switch_number, status == 1)
 
     async def service_sync_time(self, call):
-        """Service for synchronizing time with a device"""
-        from .pybuspro.devices.control import _ModifySystemDateandTime
-        import time
-        
-        device_address = call.data.get(SERVICE_BUSPRO_ATTR_ADDRESS)
-        
-        try:            
-            telegram = _ModifySystemDateandTime(self.hass, device_address)
-            wait_seconds = 1 - (time.time() % 1)
-            await asyncio.sleep(wait_seconds)            
-            telegram.custom_datetime = dt.now()
-            
-            await telegram.send()
+        """Service for synchronizing time with one or many devices, aligned once"""
+        from .pybuspro.devices.commands import sync_time
+
+        device_addresses = []
+        if SERVICE_BUSPRO_ATTR_ADDRESS in call.data:
+            device_addresses.append(tuple(call.data[SERVICE_BUSPRO_ATTR_ADDRESS]))
+        device_addresses.extend(tuple(address) for address in call.data.get(SERVICE_BUSPRO_ATTR_ADDRESSES, []))
+        if SERVICE_BUSPRO_ATTR_SUBNET in call.data:
+            subnet_id = call.data[SERVICE_BUSPRO_ATTR_SUBNET]
+            device_addresses.extend(sorted(address for address in self.hdl.registered_addresses if address[0] == subnet_id))
+        device_addresses = list(dict.fromkeys(device_addresses))
+
+        try:
+            results = await sync_time(self.hdl, device_addresses, dt.now)
             if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Time synced with device {device_address}, set to {telegram.custom_datetime}")
+                _LOGGER.debug(f"Time synced with {len(device_addresses)} devices: {results}")
+            return {"results": results}
         except Exception as e:
-            _LOGGER.error(f"Error syncing time with device {device_address}: {e}")
+            _LOGGER.error(f"Error syncing time with devices {device_addresses}: {e}")
+            return {"results": []}
+
+    async def service_set_channel_levels(self, call):
+        """Service for setting many light or switch channels in one batch"""
+        from .pybuspro.devices.channel_group import set_channel_levels
+
+        targets = [((subnet_id, device_id), channel_number, level)
+                   for subnet_id, device_id, channel_number, level in call.data.get(SERVICE_BUSPRO_ATTR_TARGETS)]
+        running_time = call.data.get(SERVICE_BUSPRO_ATTR_RUNNING_TIME)
+        await set_channel_levels(self.hdl, targets, running_time)
 
     def register_services(self):
 
@@ -281,6 +490,44 @@ class BusproModule:
             self.service_send_message,
             schema=SERVICE_BUSPRO_SEND_MESSAGE_SCHEMA)
 
+        """ send_messages """
+        self.hass.services.async_register(
+            DATA_BUSPRO, SERVICE_BUSPRO_SEND_MESSAGES,
+            self.service_send_messages,
+            schema=SERVICE_BUSPRO_SEND_MESSAGES_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL)
+
+        """ get_stats """
+        self.hass.services.async_register(
+            DATA_BUSPRO, SERVICE_BUSPRO_GET_STATS,
+            self.service_get_stats,
+            supports_response=SupportsResponse.ONLY)
+
+        """ dump_frames """
+        self.hass.services.async_register(
+            DATA_BUSPRO, SERVICE_BUSPRO_DUMP_FRAMES,
+            self.service_dump_frames,
+            schema=SERVICE_BUSPRO_DUMP_FRAMES_SCHEMA,
+            supports_response=SupportsResponse.ONLY)
+
+        """ start_capture """
+        self.hass.services.async_register(
+            DATA_BUSPRO, SERVICE_BUSPRO_START_CAPTURE,
+            self.service_start_capture,
+            schema=SERVICE_BUSPRO_START_CAPTURE_SCHEMA)
+
+        """ stop_capture """
+        self.hass.services.async_register(
+            DATA_BUSPRO, SERVICE_BUSPRO_STOP_CAPTURE,
+            self.service_stop_capture)
+
+        """ replay_capture """
+        self.hass.services.async_register(
+            DATA_BUSPRO, SERVICE_BUSPRO_REPLAY_CAPTURE,
+            self.service_replay_capture,
+            schema=SERVICE_BUSPRO_REPLAY_CAPTURE_SCHEMA,
+            supports_response=SupportsResponse.ONLY)
+
         """ universal_switch """
         self.hass.services.async_register(
             DATA_BUSPRO, SERVICE_BUSPRO_UNIVERSAL_SWITCH,
@@ -291,7 +538,14 @@ class BusproModule:
         self.hass.services.async_register(
             DATA_BUSPRO, SERVICE_BUSPRO_SYNC_TIME,
             self.service_sync_time,
-            schema=SERVICE_BUSPRO_SYNC_TIME_SCHEMA)
+            schema=SERVICE_BUSPRO_SYNC_TIME_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL)
+
+        """ set_channel_levels """
+        self.hass.services.async_register(
+            DATA_BUSPRO, SERVICE_BUSPRO_SET_CHANNEL_LEVELS,
+            self.service_set_channel_levels,
+            schema=SERVICE_BUSPRO_SET_CHANNEL_LEVELS_SCHEMA)
 
 
     def _register_time_broadcaster(self):
@@ -302,7 +556,7 @@ class BusproModule:
         async def broadcast_time(_now=None):
             """Broadcast time at the start of each minute."""
             try:
-                telegram = _BroadcastSystemDateandTimeEveryMinute(self.hass, (255, 255))
+                telegram = _BroadcastSystemDateandTimeEveryMinute(self.hdl, (255, 255))
                 telegram.custom_datetime = dt.now().replace(second=0, microsecond=0) + timedelta(minutes=1)
                 await telegram.send()
             except Exception as e:
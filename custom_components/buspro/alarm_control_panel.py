@@ -78,6 +78,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     """Set up the HDL Buspro alarm control panel devices."""
     if not await wait_for_buspro(hass):
         return False
+    buspro = hass.data[DATA_BUSPRO].hdl
     
     devices = []
 
@@ -90,7 +91,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         scan_interval = device_config.get(CONF_SCAN_INTERVAL, 0)        
         subnet_id, device_id, area_id = map(int, match.groups())
         
-        device = Security(hass, (subnet_id, device_id), area_id, name)
+        device = Security(buspro, (subnet_id, device_id), area_id, name)
         panel = HDLBusproAlarmPanel(hass, device, name, scan_interval)
         devices.append(panel)
 
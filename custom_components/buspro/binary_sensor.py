@@ -20,7 +20,7 @@ from homeassistant.core import callback
 from custom_components.buspro.helpers import wait_for_buspro
 from custom_components.buspro.pybuspro.devices.sensor import SensorType
 from .pybuspro.helpers.enums import DeviceFamily, validate_device_family
-from .pybuspro.devices.sensor import Sensor, SensorType
+from .pybuspro.devices.sensor import get_shared_sensor, SensorType
 from ..buspro import DATA_BUSPRO
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,6 +49,7 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
     
     if not await wait_for_buspro(hass):
         return False    
+    buspro = hass.data[DATA_BUSPRO].hdl
     devices = []
 
     for device_config in config[CONF_DEVICES]:
@@ -82,17 +83,17 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
         
         if sensor_type == SensorType.DRY_CONTACT:
             switch_number = int(address2[2]) if len(address2) > 2 else 1
-            sensor = Sensor(hass, device_address, device_family=device_family, sensor_type=sensor_type.value, name=name, switch_number=switch_number)
+            sensor = get_shared_sensor(buspro, device_address, device_family=device_family, sensor_type=sensor_type.value, switch_number=switch_number)
         elif sensor_type == SensorType.SINGLE_CHANNEL:
             channel_number = int(address2[2])
-            sensor = Sensor(hass, device_address, device_family=device_family, sensor_type=sensor_type.value, name=name, channel_number=channel_number)
+            sensor = get_shared_sensor(buspro, device_address, device_family=device_family, sensor_type=sensor_type.value, channel_number=channel_number)
         elif sensor_type == SensorType.UNIVERSAL_SWITCH:
             universal_switch_number = int(address2[2])
-            sensor = Sensor(hass, device_address, device_family=device_family, sensor_type=sensor_type.value, name=name, universal_switch_number=universal_switch_number)
+            sensor = get_shared_sensor(buspro, device_address, device_family=device_family, sensor_type=sensor_type.value, universal_switch_number=universal_switch_number)
         else: 
-            sensor = Sensor(hass, device_address, device_family=device_family, sensor_type=sensor_type.value, name=name)
+            sensor = get_shared_sensor(buspro, device_address, device_family=device_family, sensor_type=sensor_type.value)
 
-        devices.append(BusproBinarySensor(hass, sensor, sensor_type, scan_interval, device_class))
+        devices.append(BusproBinarySensor(hass, sensor, name, sensor_type, scan_interval, device_class))
 
     async_add_entites(devices)
 
@@ -101,10 +102,11 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
 class BusproBinarySensor(BinarySensorEntity):
     """Representation of a Buspro binary sensor."""
 
-    def __init__(self, hass, device, sensor_type, scan_interval, device_class=None):
+    def __init__(self, hass, device, name, sensor_type, scan_interval, device_class=None):
         """Initialize the Buspro binary sensor."""
         self._hass = hass
         self._device = device
+        self._name = name
         self._sensor_type = sensor_type
         self._scan_interval = scan_interval
         self._custom_device_class = device_class
@@ -115,7 +117,7 @@ class BusproBinarySensor(BinarySensorEntity):
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
         if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug(f"Added binary sensor '{self._device.name}' scan interval {self.scan_interval}")
+            _LOGGER.debug(f"Added binary sensor '{self._name}' scan interval {self.scan_interval}")
         await self._hass.data[DATA_BUSPRO].entity_initialized(self)
 
     @callback
@@ -134,6 +136,8 @@ class BusproBinarySensor(BinarySensorEntity):
         """Return true if the binary sensor is on."""
         if self._sensor_type == SensorType.MOTION:
             return self._device.movement
+        elif self._sensor_type == SensorType.SONIC:
+            return self._device.sonic
         elif self._sensor_type == SensorType.DRY_CONTACT_1:
             return self._device.dry_contact_1_is_on
         elif self._sensor_type == SensorType.DRY_CONTACT_2:
@@ -157,7 +161,7 @@ class BusproBinarySensor(BinarySensorEntity):
     @property
     def name(self):
         """Return the name of the binary sensor."""
-        return self._device.name
+        return self._name
 
     @property
     def unique_id(self):
@@ -36,7 +36,7 @@ from homeassistant.core import callback
 
 from custom_components.buspro.helpers import wait_for_buspro
 from custom_components.buspro.pybuspro.devices.climate import Climate, ClimateDeviceType, WorkType
-from custom_components.buspro.pybuspro.devices.sensor import Sensor
+from custom_components.buspro.pybuspro.devices.sensor import get_shared_sensor, SensorType
 
 from ..buspro import DATA_BUSPRO
 from .pybuspro.helpers.enums import OperationMode
@@ -106,6 +106,7 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
     """Set up Buspro climate devices."""
     if not await wait_for_buspro(hass):
         return False    
+    buspro = hass.data[DATA_BUSPRO].hdl
     devices = []
 
     for device_config in config[CONF_DEVICES]:
@@ -144,7 +145,7 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
             channel_info = f", channel {channel_number}" if channel_number is not None else ""
             _LOGGER.debug(f"Adding climate '{name}' with address {device_address}{channel_info}, device type '{device_type.value}'")
 
-        climate = Climate(hass, device_address, name, device_type, channel_number)
+        climate = Climate(buspro, device_address, name, device_type, channel_number)
 
         relay_sensor = None
         relay_address = device_config[CONF_RELAY_ADDRESS]
@@ -156,7 +157,7 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
                 
             relay_device_address = (int(relay_address2[0]), int(relay_address2[1]))
             relay_channel_number = int(relay_address2[2])
-            relay_sensor = Sensor(hass, relay_device_address, channel_number=relay_channel_number)
+            relay_sensor = get_shared_sensor(buspro, relay_device_address, sensor_type=SensorType.SINGLE_CHANNEL, channel_number=relay_channel_number)
 
         hvac_modes = device_config[CONF_HVAC_MODES]  # Přidáno
         devices.append(BusproClimate(hass, climate, preset_modes, relay_sensor, scan_interval, hvac_modes))  # Upraveno
@@ -178,9 +179,6 @@ class BusproClimate(ClimateEntity):
         self._mode = self._device.mode  # 1/3/4
 
         self._relay_sensor = relay_sensor
-        self._relay_sensor_is_on = None
-        if self._relay_sensor is not None:
-            self._relay_sensor_is_on = self._relay_sensor.single_channel_is_on
 
         self._enable_turn_on_off_backwards_compatibility = False
         self._attr_supported_features = (
@@ -213,6 +211,14 @@ class BusproClimate(ClimateEntity):
         
         self._device.register_device_updated_cb(after_update_callback)    
 
+        if self._relay_sensor is not None:
+            async def after_relay_update_callback(device, should_reschedule=True):
+                """Call after the shared relay sensor was updated."""
+                if self.hass is not None:
+                    self.async_write_ha_state()
+
+            self._relay_sensor.register_device_updated_cb(after_relay_update_callback)
+
 
     @property
     def should_poll(self):
@@ -280,7 +286,7 @@ class BusproClimate(ClimateEntity):
         if not self._is_on:
             return HVACAction.OFF
             
-        if self._relay_sensor_is_on is None or self._relay_sensor_is_on:
+        if self._relay_sensor is None or self._relay_sensor.single_channel_is_on:
             return HVACAction.HEATING
             
         return HVACAction.IDLE
@@ -3,4 +3,8 @@ CONF_HOST = "host"
 CONF_PORT = "port"
 HUMIDITY = "humidity"
 CONF_INVERT = "invert" 
-CONF_TIME_BROADCAST = "time_broadcast"
\ No newline at end of file
+CONF_TIME_BROADCAST = "time_broadcast"
+CONF_TELEGRAM_EVENTS = "telegram_events"
+EVENT_BUSPRO_TELEGRAM = "buspro_telegram"
+CONF_IO_THREAD = "io_thread"
+CONF_BUS_BACKOFF = "bus_backoff"
\ No newline at end of file
@@ -57,6 +57,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 
     if not await wait_for_buspro(hass):
         return False
+    buspro = hass.data[DATA_BUSPRO].hdl
 
     devices = []
 
@@ -69,7 +70,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         invert = device_config[CONF_INVERT]
         subnet_id, device_id, channel = map(int, match.groups())
         
-        device = Cover(hass, (subnet_id, device_id), channel)
+        device = Cover(buspro, (subnet_id, device_id), channel)
         
         devices.append(HDLBusproCover(
             hass,
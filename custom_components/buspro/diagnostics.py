@@ -0,0 +1,19 @@
+"""Diagnostics support for Buspro."""
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_BUSPRO
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry: ConfigEntry) -> dict:
+    """Return bus statistics and the most recent raw frames."""
+    module = hass.data.get(DATA_BUSPRO)
+    if module is None:
+        return {"config": dict(config_entry.data), "connected": False}
+
+    return {
+        "config": dict(config_entry.data),
+        "connected": module.connected,
+        "stats": module.stats(),
+        "recent_frames": module.hdl.frame_log.export(),
+    }
@@ -12,9 +12,11 @@ import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.components.light import (
     LightEntity, 
+    LightEntityFeature,
     ColorMode, 
     PLATFORM_SCHEMA, 
-    ATTR_BRIGHTNESS
+    ATTR_BRIGHTNESS,
+    ATTR_TRANSITION
 )
 from homeassistant.const import (CONF_NAME, CONF_DEVICES, CONF_SCAN_INTERVAL)
 from homeassistant.core import callback
@@ -28,6 +30,8 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_DEVICE_RUNNING_TIME = 0
 DEFAULT_PLATFORM_RUNNING_TIME = 0
 DEFAULT_DIMMABLE = True
+# Longest running time _SingleChannelControl can carry (255 minutes 59 seconds)
+MAX_RUNNING_TIME = 255 * 60 + 59
 
 DEVICE_SCHEMA = vol.Schema({
     vol.Optional("running_time", default=DEFAULT_DEVICE_RUNNING_TIME): cv.positive_int,
@@ -48,6 +52,7 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
 
     if not await wait_for_buspro(hass):
         return False
+    buspro = hass.data[DATA_BUSPRO].hdl
     
     devices = []
     platform_running_time = int(config["running_time"])
@@ -60,7 +65,7 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
 
         if device_running_time == 0:
             device_running_time = platform_running_time
-        if dimmable:
+        if not dimmable:
             device_running_time = 0
 
         address2 = address.split('.')
@@ -69,7 +74,7 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Adding light '{}' with address {} and channel number {}".format(name, device_address, channel_number))
 
-        light = Light(hass, device_address, channel_number, name)
+        light = Light(buspro, device_address, channel_number, name)
         devices.append(BusproLight(hass, light, device_running_time, dimmable,scan_interval))
 
     async_add_entites(devices)
@@ -97,6 +102,11 @@ class BusproLight(LightEntity):
         """Return the color mode of the light."""
         return ColorMode.BRIGHTNESS if self._dimmable else ColorMode.ONOFF
 
+    @property
+    def supported_features(self):
+        """Flag supported features; dimmers ramp natively using the module running time."""
+        return LightEntityFeature.TRANSITION if self._dimmable else LightEntityFeature(0)
+
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
         if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -155,11 +165,18 @@ class BusproLight(LightEntity):
         if not self.is_on and self._device.previous_brightness is not None and brightness == 100:
             brightness = self._device.previous_brightness
 
-        await self._device.set_brightness(brightness, self._running_time)
+        await self._device.set_brightness(brightness, self._running_time_for(kwargs))
 
     async def async_turn_off(self, **kwargs):
         """Instruct the light to turn off."""
-        await self._device.set_off(self._running_time)
+        await self._device.set_off(self._running_time_for(kwargs))
+
+    def _running_time_for(self, kwargs):
+        """Return the running time for a command, taken from the HA transition if one was requested."""
+        transition = kwargs.get(ATTR_TRANSITION)
+        if transition is None or not self._dimmable:
+            return self._running_time
+        return min(max(int(round(transition)), 0), MAX_RUNNING_TIME)
 
     @property
     def unique_id(self):
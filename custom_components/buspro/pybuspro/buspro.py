@@ -4,16 +4,29 @@ import asyncio
 import logging
 
 from .helpers.enums import *
+from .core.metrics import BusMetrics
+from .core.latency import LatencyHistograms
+from .core.utilisation import BusUtilisation
+from .core.frame_log import FrameLog
+from .core.capture import CaptureRecorder
+from .core.replay import replay_capture
+from .core.subscription import Subscription, POLICY_DROP_OLDEST, DEFAULT_MAXSIZE
+from .helpers.telegram_helper import TelegramHelper
 from .transport.network_interface import NetworkInterface
+from .devices.optimistic import new_optimistic_stats
+from .devices.scene_table import SceneTable
 _LOGGER = logging.getLogger(__name__)
 
 # ip, port = gateway_address
 # subnet_id, device_id, channel = device_address
 class Buspro:
 
-    def __init__(self, hass, gateway_address_send_receive, loop_=None):
+    def __init__(self, gateway_address_send_receive, loop_=None, io_thread=False, backoff_occupancy=None):
         self.loop = loop_ or asyncio.get_event_loop()
-        self._hass = hass
+        # Receive, CRC check and decode on a dedicated thread instead of the event loop
+        self.io_thread = io_thread
+        # Bus occupancy percentage at or above which sending and periodic reads slow down (None: never)
+        self.backoff_occupancy = backoff_occupancy
         self.state_updater = None
         self.started = False
         self.network_interface = None
@@ -22,6 +35,17 @@ class Buspro:
 
         self.callback_all_messages = None        
         self._telegram_received_cbs = {}
+        self._shared_devices = {}
+        self._response_waiters = {}
+        self._subscriptions = ()
+        self._telegram_filters = ()
+        self.optimistic_stats = new_optimistic_stats()
+        self.scene_table = SceneTable()
+        self.metrics = BusMetrics()
+        self.latency = LatencyHistograms()
+        self.utilisation = BusUtilisation()
+        self.frame_log = FrameLog()
+        self.capture = None
 
         self.gateway_address_send_receive = gateway_address_send_receive
         if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -39,12 +63,20 @@ class Buspro:
 
     # noinspection PyUnusedLocal
     async def start(self):
-        self.network_interface = NetworkInterface(self._hass, self.gateway_address_send_receive)
-        self.network_interface.register_callback(self._callback_all_messages)
+        self.network_interface = self._new_network_interface()
         await self.network_interface.start()
         self.started = True
 
+    def _new_network_interface(self):
+        network_interface = NetworkInterface(self.gateway_address_send_receive, self.loop, self.metrics, self.latency,
+                                             self.utilisation, self.frame_log, self.logger, self.io_thread)
+        network_interface.register_callback(self._callback_all_messages)
+        network_interface.udp_client.recorder = self.capture
+        network_interface.send_queue.backoff_occupancy = self.backoff_occupancy
+        return network_interface
+
     async def stop(self):
+        await self.stop_capture()
         await self._stop_network_interface()
         self.started = False
 
@@ -52,9 +84,33 @@ class Buspro:
         if self.telegram_logger.isEnabledFor(logging.DEBUG):
             self.telegram_logger.debug(telegram)
 
+        # A failing consumer hook is logged; it must not keep the telegram from the devices
         if self.callback_all_messages is not None:
-            self.callback_all_messages(telegram)
-        
+            try:
+                self.callback_all_messages(telegram)
+            except Exception:
+                _LOGGER.exception(f"callback_all_messages failed for {telegram}")
+
+        if self._response_waiters:
+            self._resolve_response_waiters(telegram)
+
+        for subscription in self._subscriptions:
+            try:
+                subscription.offer(telegram)
+            except Exception:
+                _LOGGER.exception(f"Subscription failed to take {telegram}")
+
+        for telegram_filter, callback in self._telegram_filters:
+            try:
+                if telegram_filter.accept(telegram):
+                    callback(telegram)
+            except Exception:
+                _LOGGER.exception(f"Telegram filter callback failed for {telegram}")
+
+        self.dispatch_device_telegram(telegram)
+
+    def dispatch_device_telegram(self, telegram):
+        """Pass a telegram to the device callbacks registered for its source address."""
         callbacks_to_call = []
         
         if telegram.source_address in self._telegram_received_cbs:
@@ -101,3 +157,133 @@ class Buspro:
             except ValueError:                
                 pass
 
+    def subscribe(self, source=None, target=None, opcodes=None, maxsize=DEFAULT_MAXSIZE, policy=POLICY_DROP_OLDEST, key=None):
+        """Return a Subscription to iterate with `async for` over the received telegrams that match.
+
+        source and target are a (subnet, device) address or a list of them, opcodes a collection of
+        OperateCode; None matches everything. Each subscription has its own queue of at most maxsize
+        telegrams. With POLICY_DROP_OLDEST a full queue drops its oldest telegram, with
+        POLICY_LATEST_PER_KEY only the newest telegram per key(telegram) is kept, by default one per
+        source address and operate code. Subscriptions survive stop() and start().
+        """
+        subscription = Subscription(self.loop, self._unsubscribe, source, target, opcodes, maxsize, policy, key)
+        self._subscriptions = self._subscriptions + (subscription,)
+        return subscription
+
+    def _unsubscribe(self, subscription):
+        self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+
+    def register_telegram_filter(self, telegram_filter, callback):
+        """Call callback(telegram) for every received telegram a TelegramFilter accepts."""
+        self._telegram_filters = self._telegram_filters + ((telegram_filter, callback),)
+
+    def unregister_telegram_filter(self, telegram_filter):
+        self._telegram_filters = tuple(entry for entry in self._telegram_filters if entry[0] is not telegram_filter)
+
+    async def start_capture(self, path, **kwargs):
+        """Record all traffic to a binary capture file; kwargs are passed to CaptureRecorder."""
+        await self.stop_capture()
+        self.capture = CaptureRecorder(path, self.loop, **kwargs)
+        if self.network_interface is not None:
+            self.network_interface.udp_client.recorder = self.capture
+
+    async def stop_capture(self):
+        if self.capture is None:
+            return
+        if self.network_interface is not None and self.network_interface.udp_client is not None:
+            self.network_interface.udp_client.recorder = None
+        capture, self.capture = self.capture, None
+        await capture.close()
+
+    async def replay(self, path, speed=None, trace_memory=False):
+        """Replay the received frames of a capture file through the receive path; see replay_capture().
+
+        Only for an instance that is never started, typically a separate Buspro created for the
+        replay: a network interface is created for the replay only and never started, so nothing
+        is sent and telegrams queued by devices are dropped afterwards. Replaying into a running
+        instance would feed recorded levels to live devices and mix them into the live metrics.
+        """
+        if self.network_interface is not None:
+            raise RuntimeError("Replay needs a Buspro instance that is not started")
+        self.network_interface = self._new_network_interface()
+        try:
+            return await replay_capture(self.network_interface, path, speed, trace_memory)
+        finally:
+            self.network_interface = None
+
+    def stats(self):
+        """Return bus metrics together with send queue, optimistic state and scene table counters."""
+        stats = self.metrics.snapshot()
+        send_queue = self.network_interface.send_queue if self.network_interface is not None else None
+        stats["send_queue"] = {
+            "depth": len(send_queue) if send_queue is not None else 0,
+            "sent": send_queue.sent if send_queue is not None else 0,
+            "coalesced": send_queue.coalesced if send_queue is not None else 0,
+            "backoffs": send_queue.backoffs if send_queue is not None else 0,
+        }
+        for window, occupancy in self.utilisation.snapshot().items():
+            stats[f"bus_occupancy_{window}"] = occupancy
+        stats["optimistic"] = dict(self.optimistic_stats)
+        stats["learned_scenes"] = len(self.scene_table)
+        stats["subscriptions"] = {
+            "active": len(self._subscriptions),
+            "queued": sum(len(subscription) for subscription in self._subscriptions),
+            "dropped": sum(subscription.dropped for subscription in self._subscriptions),
+        }
+        stats["telegram_filters"] = {
+            "passed": sum(telegram_filter.passed for telegram_filter, _ in self._telegram_filters),
+            "rate_limited": sum(telegram_filter.rate_limited for telegram_filter, _ in self._telegram_filters),
+        }
+        stats["latency"] = self.latency.snapshot()
+        return stats
+
+    @property
+    def registered_addresses(self):
+        """Addresses of all modules with a registered device callback."""
+        return list(self._telegram_received_cbs)
+
+    def expect_response(self, source_address, operate_code):
+        """Return a future resolved with (telegram, loop time received) for the next telegram from
+        source_address carrying operate_code.
+
+        operate_code is the raw two-byte code, so codes missing from OperateCode can be awaited too.
+        Call discard_response if the future is abandoned before it resolves.
+        """
+        future = self.loop.create_future()
+        key = (tuple(source_address), bytes(operate_code))
+        self._response_waiters.setdefault(key, []).append(future)
+        return future
+
+    def discard_response(self, source_address, operate_code, future):
+        key = (tuple(source_address), bytes(operate_code))
+        waiters = self._response_waiters.get(key)
+        if waiters is not None and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._response_waiters[key]
+
+    def _resolve_response_waiters(self, telegram):
+        if telegram.udp_data is None:
+            return
+        key = (telegram.source_address, bytes(telegram.udp_data[TelegramHelper.IDX_OP_CODE:TelegramHelper.IDX_OP_CODE + 2]))
+        waiters = self._response_waiters.get(key)
+        if not waiters:
+            return
+        future = waiters.pop(0)
+        if not waiters:
+            del self._response_waiters[key]
+        if not future.done():
+            future.set_result((telegram, self.loop.time()))
+
+    def get_shared_device(self, key, factory):
+        """Return the device model registered under key, creating it with factory on first use."""
+        device = self._shared_devices.get(key)
+        if device is None:
+            device = factory()
+            self._shared_devices[key] = device
+        return device
+
+    @property
+    def shared_devices(self):
+        return self._shared_devices
+
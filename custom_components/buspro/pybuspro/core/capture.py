@@ -0,0 +1,177 @@
+"""Binary capture of raw bus traffic.
+
+A capture file starts with a header (magic, wall-clock and monotonic time at creation) followed by
+append-only records. Each record is a fixed little-endian prefix with the frame length, monotonic
+timestamp, direction and IPv4 address and port, followed by the raw UDP frame:
+
+    <H frame length> <d monotonic seconds> <B direction> <4s IPv4> <H port> <frame bytes>
+
+Records are buffered on the event loop and written by a single worker thread, so the loop never
+waits on the disk. Files rotate at a size limit like logging's RotatingFileHandler
+(capture.bin, capture.bin.1, ...). read_capture() memory-maps a file for fast sequential reads.
+"""
+import logging
+import mmap
+import os
+import socket
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .frame_log import DIRECTION_RX, DIRECTION_TX
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b"HDLCAP1\n"
+_FILE_HEADER = struct.Struct("<8sdd")
+_RECORD_HEADER = struct.Struct("<HdB4sH")
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+# Buffered bytes that trigger a write, and the longest time a record waits in the buffer
+FLUSH_BYTES = 64 * 1024
+FLUSH_INTERVAL_SECONDS = 1.0
+
+_NO_ADDRESS = (b"\x00\x00\x00\x00", 0)
+
+
+def _pack_address(address):
+    if not address:
+        return _NO_ADDRESS
+    try:
+        return socket.inet_aton(address[0]), address[1]
+    except (OSError, TypeError, IndexError):
+        return _NO_ADDRESS
+
+
+class CaptureRecorder:
+    """Append every rx/tx frame to a rotating binary capture file."""
+
+    def __init__(self, path, loop, max_bytes=DEFAULT_MAX_BYTES, backup_count=DEFAULT_BACKUP_COUNT):
+        self.path = path
+        self._loop = loop
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._buffer = bytearray()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="buspro_capture")
+        self._file = None
+        self._flush_timer = None
+        self._closed = False
+        self._addresses = {}    # (ip, port) -> packed form, the gateway is nearly always the same
+        self.records = 0
+
+    def record(self, direction, frame, address=None):
+        if self._closed:
+            return
+        packed = self._addresses.get(address)
+        if packed is None:
+            packed = _pack_address(address)
+            if len(self._addresses) < 64:
+                self._addresses[address] = packed
+        ip, port = packed
+        self._buffer += _RECORD_HEADER.pack(len(frame), time.monotonic(), direction, ip, port)
+        self._buffer += frame
+        self.records += 1
+        if len(self._buffer) >= FLUSH_BYTES:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = self._loop.call_later(FLUSH_INTERVAL_SECONDS, self._flush)
+
+    def record_rx(self, frame, address):
+        self.record(DIRECTION_RX, frame, address)
+
+    def record_tx(self, frame, address):
+        self.record(DIRECTION_TX, frame, address)
+
+    def _flush(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._buffer:
+            return None
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        return self._loop.run_in_executor(self._executor, self._write, chunk)
+
+    async def close(self):
+        """Write what is buffered, close the file and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        pending = self._flush()
+        if pending is not None:
+            await pending
+        await self._loop.run_in_executor(self._executor, self._close_file)
+        self._executor.shutdown(wait=False)
+
+    # Writer thread
+
+    def _write(self, chunk):
+        try:
+            if self._file is None:
+                self._open()
+            elif self._max_bytes and self._file.tell() + len(chunk) > self._max_bytes:
+                self._rotate()
+            self._file.write(chunk)
+            self._file.flush()
+        except OSError as e:
+            _LOGGER.error(f"Error writing capture {self.path}: {e}")
+
+    def _open(self):
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        self._file = open(self.path, "ab")
+        if not exists:
+            self._file.write(_FILE_HEADER.pack(CAPTURE_MAGIC, time.time(), time.monotonic()))
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        if self._backup_count > 0:
+            for index in range(self._backup_count - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_capture(path):
+    """Yield (monotonic time, direction, (ip, port), frame) for every record of a capture file.
+
+    The file is memory-mapped and frames are returned as bytes. The creation times in the file
+    header are read with read_capture_header().
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < _FILE_HEADER.size:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, _, _ = _FILE_HEADER.unpack_from(data, 0)
+            if magic != CAPTURE_MAGIC:
+                raise ValueError(f"{path} is not a Buspro capture")
+            offset = _FILE_HEADER.size
+            end = len(data)
+            unpack_from = _RECORD_HEADER.unpack_from
+            header_size = _RECORD_HEADER.size
+            while offset + header_size <= end:
+                length, timestamp, direction, ip, port = unpack_from(data, offset)
+                offset += header_size
+                if offset + length > end:
+                    break
+                yield timestamp, direction, (socket.inet_ntoa(ip), port), data[offset:offset + length]
+                offset += length
+
+
+def read_capture_header(path):
+    """Return (wall-clock time, monotonic time) at which a capture file was created."""
+    with open(path, "rb") as file:
+        magic, created, created_monotonic = _FILE_HEADER.unpack(file.read(_FILE_HEADER.size))
+    if magic != CAPTURE_MAGIC:
+        raise ValueError(f"{path} is not a Buspro capture")
+    return created, created_monotonic
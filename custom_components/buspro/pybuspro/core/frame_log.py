@@ -0,0 +1,69 @@
+"""Ring buffer of the most recent raw frames."""
+import time
+from array import array
+from datetime import datetime, timezone
+
+from .metrics import operate_code_name
+
+# Frames kept by default
+DEFAULT_CAPACITY = 500
+# Largest HDL UDP frame: 16 byte header plus a data package of at most 255 bytes
+MAX_FRAME_LENGTH = 16 + 255
+
+DIRECTION_RX = 0
+DIRECTION_TX = 1
+_DIRECTION_NAMES = ("rx", "tx")
+
+
+class FrameLog:
+    """Fixed-size log of the last frames received from and sent to the gateway.
+
+    All storage is allocated up front: one bytearray with a slot of MAX_FRAME_LENGTH bytes per
+    frame and parallel arrays for timestamp, direction and length. Recording a frame is a copy
+    into a memoryview slice and three array stores; nothing is decoded or formatted until export().
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._data = bytearray(capacity * MAX_FRAME_LENGTH)
+        self._view = memoryview(self._data)
+        self._times = array('d', bytes(capacity * array('d').itemsize))
+        self._directions = array('B', bytes(capacity))
+        self._lengths = array('H', bytes(capacity * array('H').itemsize))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def record(self, direction, frame):
+        index = self._next
+        length = min(len(frame), MAX_FRAME_LENGTH)
+        start = index * MAX_FRAME_LENGTH
+        self._view[start:start + length] = frame if length == len(frame) else frame[:length]
+        self._times[index] = time.time()
+        self._directions[index] = direction
+        self._lengths[index] = length
+        self._next = (index + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def export(self, count=None):
+        """Return the last count frames (all by default), oldest first, as JSON-friendly dicts."""
+        count = self._count if count is None else min(count, self._count)
+        frames = []
+        for offset in range(count, 0, -1):
+            index = (self._next - offset) % self.capacity
+            start = index * MAX_FRAME_LENGTH
+            frame = bytes(self._data[start:start + self._lengths[index]])
+            entry = {
+                "time": datetime.fromtimestamp(self._times[index], timezone.utc).isoformat(),
+                "direction": _DIRECTION_NAMES[self._directions[index]],
+                "data": frame.hex(),
+            }
+            if len(frame) >= 25:
+                entry["source"] = f"{frame[17]}.{frame[18]}"
+                entry["operate_code"] = operate_code_name((frame[21] << 8) | frame[22])
+                entry["target"] = f"{frame[23]}.{frame[24]}"
+            frames.append(entry)
+        return frames
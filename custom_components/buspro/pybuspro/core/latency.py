@@ -0,0 +1,88 @@
+"""Round-trip latency histograms per module and request operate code."""
+import time
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+from .metrics import operate_code_name
+
+# Upper bucket edges in milliseconds; the last bucket holds everything slower
+BUCKET_EDGES_MS = (5, 10, 20, 30, 50, 75, 100, 150, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000)
+_BUCKET_COUNT = len(BUCKET_EDGES_MS) + 1
+
+# Requests unanswered after this many seconds are not matched any more
+MAX_PENDING_SECONDS = 5.0
+# Requests remembered per (module, response operate code) while waiting for responses
+MAX_PENDING_PER_KEY = 16
+
+_BROADCAST_DEVICE = 255
+
+
+class LatencyHistograms:
+    """Fixed-bucket round-trip histograms keyed by (module address, request operate code).
+
+    request_sent() stamps each frame leaving for a module; response_received() matches a frame
+    from that module carrying the request code + 1 (the HDL response convention) to the oldest
+    pending request and records the elapsed time. Each histogram is one array of bucket counts.
+    """
+
+    def __init__(self):
+        self._pending = {}      # (address, response code) -> deque of send times
+        self._histograms = {}   # (address, request code) -> array('L') of bucket counts
+        self._max_ms = {}
+
+    def request_sent(self, target_address, operate_code, sent_at=None):
+        if target_address[1] == _BROADCAST_DEVICE:
+            return
+        key = (target_address, (operate_code + 1) & 0xFFFF)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = deque(maxlen=MAX_PENDING_PER_KEY)
+        pending.append(time.monotonic() if sent_at is None else sent_at)
+
+    def response_received(self, source_address, operate_code, received_at=None):
+        pending = self._pending.get((source_address, operate_code))
+        if not pending:
+            return
+        received_at = time.monotonic() if received_at is None else received_at
+        while pending:
+            elapsed = received_at - pending.popleft()
+            if elapsed <= MAX_PENDING_SECONDS:
+                self._record((source_address, (operate_code - 1) & 0xFFFF), elapsed * 1000)
+                return
+
+    def _record(self, key, elapsed_ms):
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = array('L', bytes(_BUCKET_COUNT * array('L').itemsize))
+        histogram[bisect_left(BUCKET_EDGES_MS, elapsed_ms)] += 1
+        if elapsed_ms > self._max_ms.get(key, 0.0):
+            self._max_ms[key] = elapsed_ms
+
+    @staticmethod
+    def _percentile(histogram, count, fraction, max_ms):
+        """Estimate a percentile by interpolating inside its bucket; the top bucket ends at max_ms."""
+        rank = fraction * count
+        cumulative = 0
+        for index, bucket in enumerate(histogram):
+            if bucket and cumulative + bucket >= rank:
+                lower = BUCKET_EDGES_MS[index - 1] if index > 0 else 0
+                upper = min(BUCKET_EDGES_MS[index], max_ms) if index < len(BUCKET_EDGES_MS) else max_ms
+                return round(lower + (upper - lower) * (rank - cumulative) / bucket, 1)
+            cumulative += bucket
+        return round(max_ms, 1)
+
+    def snapshot(self):
+        """Return count, estimated p50/p95/p99 and max in milliseconds per key."""
+        result = {}
+        for (address, code), histogram in sorted(self._histograms.items()):
+            count = sum(histogram)
+            max_ms = self._max_ms[(address, code)]
+            result[f"{address[0]}.{address[1]} {operate_code_name(code)}"] = {
+                "count": count,
+                "p50_ms": self._percentile(histogram, count, 0.50, max_ms),
+                "p95_ms": self._percentile(histogram, count, 0.95, max_ms),
+                "p99_ms": self._percentile(histogram, count, 0.99, max_ms),
+                "max_ms": round(max_ms, 1),
+            }
+        return result
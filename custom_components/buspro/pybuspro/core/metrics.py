@@ -0,0 +1,106 @@
+"""Bus traffic counters."""
+import time
+
+from ..helpers.enums import OperateCode
+
+# Minimum seconds between the samples rates are computed from
+RATE_WINDOW_SECONDS = 60.0
+
+_OPERATE_CODE_NAMES = {int.from_bytes(code.value, "big"): code.name for code in OperateCode}
+
+
+def operate_code_name(code):
+    """Return the OperateCode name of a 16-bit operate code, or its hex form if unknown."""
+    return _OPERATE_CODE_NAMES.get(code) or f"0x{code:04X}"
+
+
+class BusMetrics:
+    """Plain counters for the traffic of one bus.
+
+    Counters are bare attributes and dicts updated without locks; the receive path costs a few
+    dict and integer updates per frame. They are updated on the event loop, except crc_failures
+    and dropped_frames, which the I/O thread updates when io_thread is enabled. Each counter
+    still has a single writer, so no increment is lost; the loop only reads those two. Rates are
+    derived lazily in snapshot() and cover the last completed window of at least
+    RATE_WINDOW_SECONDS, or the time since start until the first window completes.
+    """
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.frames_received = 0
+        self.bytes_received = 0
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.crc_failures = 0
+        self.unknown_opcodes = 0
+        # Received frames that could not be decoded for reasons other than CRC, or that the I/O
+        # thread dropped because the event loop fell behind
+        self.dropped_frames = 0
+        self.dispatch_seconds = 0.0
+        self.dispatch_max_seconds = 0.0
+        self.opcodes = {}   # 16-bit operate code -> frames received
+        self.sources = {}   # (subnet_id, device_id) -> frames received
+        self._sample = None
+        self._rates = {}
+
+    def record_received(self, operate_code, source_address, dispatch_seconds):
+        """Count a decoded frame; operate_code is the 16-bit code from the frame."""
+        opcodes = self.opcodes
+        opcodes[operate_code] = opcodes.get(operate_code, 0) + 1
+        sources = self.sources
+        sources[source_address] = sources.get(source_address, 0) + 1
+        self.dispatch_seconds += dispatch_seconds
+        if dispatch_seconds > self.dispatch_max_seconds:
+            self.dispatch_max_seconds = dispatch_seconds
+
+    def record_sent(self, length):
+        self.frames_sent += 1
+        self.bytes_sent += length
+
+    def _rates_since_sample(self):
+        now = time.monotonic()
+        current = (self.frames_received, self.frames_sent, dict(self.opcodes), dict(self.sources))
+        if self._sample is None:
+            self._sample = (self.started_at, (0, 0, {}, {}))
+        sampled_at, previous = self._sample
+        elapsed = now - sampled_at
+        if elapsed <= 0:
+            return self._rates
+        if not self._rates or elapsed >= RATE_WINDOW_SECONDS:
+            received, sent, opcodes, sources = previous
+            self._rates = {
+                "received_per_second": round((current[0] - received) / elapsed, 2),
+                "sent_per_second": round((current[1] - sent) / elapsed, 2),
+                "opcodes": {code: round((count - opcodes.get(code, 0)) / elapsed, 2) for code, count in current[2].items()},
+                "sources": {address: round((count - sources.get(address, 0)) / elapsed, 2) for address, count in current[3].items()},
+            }
+            if elapsed >= RATE_WINDOW_SECONDS:
+                self._sample = (now, current)
+        return self._rates
+
+    def snapshot(self):
+        """Return all counters and rates as a JSON-friendly dict."""
+        rates = self._rates_since_sample()
+        decoded = sum(self.opcodes.values())
+        return {
+            "uptime_seconds": round(time.monotonic() - self.started_at),
+            "frames_received": self.frames_received,
+            "bytes_received": self.bytes_received,
+            "frames_sent": self.frames_sent,
+            "bytes_sent": self.bytes_sent,
+            "received_per_second": rates.get("received_per_second", 0.0),
+            "sent_per_second": rates.get("sent_per_second", 0.0),
+            "crc_failures": self.crc_failures,
+            "unknown_opcodes": self.unknown_opcodes,
+            "dropped_frames": self.dropped_frames,
+            "dispatch_average_ms": round(self.dispatch_seconds / decoded * 1000, 3) if decoded else 0.0,
+            "dispatch_max_ms": round(self.dispatch_max_seconds * 1000, 3),
+            "opcodes": {
+                operate_code_name(code): {"count": count, "per_second": rates.get("opcodes", {}).get(code, 0.0)}
+                for code, count in sorted(self.opcodes.items(), key=lambda item: -item[1])
+            },
+            "sources": {
+                f"{address[0]}.{address[1]}": {"count": count, "per_second": rates.get("sources", {}).get(address, 0.0)}
+                for address, count in sorted(self.sources.items(), key=lambda item: -item[1])
+            },
+        }
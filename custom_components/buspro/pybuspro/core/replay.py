@@ -0,0 +1,105 @@
+"""Replay of captured bus traffic through the receive path."""
+import asyncio
+import resource
+import time
+import tracemalloc
+from itertools import islice
+
+from .capture import read_capture
+from .frame_log import DIRECTION_RX
+
+# Records read from the capture file per executor call
+READ_BATCH_RECORDS = 1000
+
+
+def _read_batch(records):
+    """Return the next READ_BATCH_RECORDS records, an empty list at the end of the file."""
+    return list(islice(records, READ_BATCH_RECORDS))
+
+
+async def replay_capture(network_interface, path, speed=None, trace_memory=False):
+    """Feed the received frames of a capture file into network_interface as if read from the socket.
+
+    Frames go through NetworkInterface._udp_request_received, so decoding, the Buspro callback,
+    device callbacks and the entity update tasks they schedule all run as they do live, and are
+    counted in the bus metrics like live traffic. Sent frames in the capture are skipped.
+
+    The file is opened and read in batches in the default executor, so the loop never waits on
+    disk. speed is a multiple of real time (1.0 keeps the recorded spacing); None or 0 replays as
+    fast as possible. After every frame the loop is given one pass to run the tasks the frame
+    scheduled, which is timed as the update stage. Decode is the time spent in
+    _udp_request_received outside the callback, dispatch the time inside it.
+
+    With trace_memory, tracemalloc reports the peak Python allocation during the replay; it slows
+    everything down, so stage times from such a run are not comparable with untraced ones.
+    """
+    metrics = network_interface._metrics
+    receive = network_interface._udp_request_received
+    loop = asyncio.get_running_loop()
+    perf_counter = time.perf_counter
+
+    tracing = trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    if trace_memory:
+        tracemalloc.reset_peak()
+
+    frames = 0
+    receive_seconds = 0.0
+    update_seconds = 0.0
+    dispatch_before = metrics.dispatch_seconds if metrics is not None else 0.0
+    first_timestamp = None
+    records = read_capture(path)
+    started = loop.time()
+    wall_started = perf_counter()
+    try:
+        while True:
+            batch = await loop.run_in_executor(None, _read_batch, records)
+            if not batch:
+                break
+            for timestamp, direction, address, frame in batch:
+                if direction != DIRECTION_RX:
+                    continue
+                if speed:
+                    if first_timestamp is None:
+                        first_timestamp = timestamp
+                    delay = started + (timestamp - first_timestamp) / speed - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                stage_started = perf_counter()
+                receive(frame, address)
+                stage_ended = perf_counter()
+                await asyncio.sleep(0)
+                receive_seconds += stage_ended - stage_started
+                update_seconds += perf_counter() - stage_ended
+                frames += 1
+        # Let the tasks scheduled by the last frames finish
+        stage_started = perf_counter()
+        await asyncio.sleep(0)
+        update_seconds += perf_counter() - stage_started
+        elapsed = perf_counter() - wall_started
+        peak_traced = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        await loop.run_in_executor(None, records.close)
+        if tracing:
+            tracemalloc.stop()
+
+    dispatch_seconds = metrics.dispatch_seconds - dispatch_before if metrics is not None else 0.0
+    decode_seconds = receive_seconds - dispatch_seconds if metrics is not None else receive_seconds
+    busy_seconds = receive_seconds + update_seconds
+    result = {
+        "frames": frames,
+        "elapsed_seconds": round(elapsed, 3),
+        "frames_per_second": round(frames / elapsed, 1) if elapsed > 0 else 0.0,
+        "busy_frames_per_second": round(frames / busy_seconds, 1) if busy_seconds > 0 else 0.0,
+        "stages_us_per_frame": {
+            "decode": round(decode_seconds / frames * 1e6, 2) if frames else 0.0,
+            "dispatch": round(dispatch_seconds / frames * 1e6, 2) if frames and metrics is not None else None,
+            "update": round(update_seconds / frames * 1e6, 2) if frames else 0.0,
+        },
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+    if trace_memory:
+        result["peak_traced_kb"] = round(peak_traced / 1024, 1)
+    return result
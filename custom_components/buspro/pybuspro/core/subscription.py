@@ -0,0 +1,137 @@
+"""Asynchronous telegram subscriptions with bounded per-subscriber queues.
+
+Buspro.subscribe() returns a Subscription that is filled from the receive path and drained by
+an `async for` loop. Offering a telegram is a filter check and an O(1) queue store that never
+waits, so a slow consumer loses its own oldest telegrams instead of delaying decoding, device
+callbacks or other subscribers.
+"""
+from collections import OrderedDict, deque
+
+# Queue policies: keep the newest telegrams, or only the newest telegram per key
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICY_LATEST_PER_KEY = "latest_per_key"
+POLICIES = (POLICY_DROP_OLDEST, POLICY_LATEST_PER_KEY)
+
+DEFAULT_MAXSIZE = 256
+
+
+def default_key(telegram):
+    """Key of POLICY_LATEST_PER_KEY: one pending telegram per module and operate code."""
+    return telegram.source_address, telegram.operate_code
+
+
+def _address_set(addresses):
+    """None, or a frozenset of (subnet, device) tuples from one address or an iterable of them."""
+    if addresses is None:
+        return None
+    addresses = list(addresses)
+    if addresses and isinstance(addresses[0], int):
+        addresses = [addresses]
+    return frozenset(tuple(address) for address in addresses)
+
+
+class Subscription:
+    """Bounded queue of the telegrams matching a source, target and operate code filter.
+
+    Iterate it with `async for`; leaving the loop, close() or `async with` unsubscribes.
+    dropped counts telegrams discarded because the consumer fell behind.
+    """
+
+    def __init__(self, loop, on_close, source=None, target=None, opcodes=None,
+                 maxsize=DEFAULT_MAXSIZE, policy=POLICY_DROP_OLDEST, key=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown subscription policy {policy!r}, expected one of {POLICIES}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._loop = loop
+        self._on_close = on_close
+        self.sources = _address_set(source)
+        self.targets = _address_set(target)
+        self.opcodes = frozenset(opcodes) if opcodes is not None else None
+        self.maxsize = maxsize
+        self.policy = policy
+        self._key = key or default_key
+        self._latest = policy == POLICY_LATEST_PER_KEY
+        self._queue = OrderedDict() if self._latest else deque(maxlen=maxsize)
+        self._waiter = None
+        self.closed = False
+        self.delivered = 0
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._queue)
+
+    def matches(self, telegram):
+        return ((self.sources is None or telegram.source_address in self.sources)
+                and (self.targets is None or telegram.target_address in self.targets)
+                and (self.opcodes is None or telegram.operate_code in self.opcodes))
+
+    def offer(self, telegram):
+        """Queue telegram if it matches; called from the receive path and never blocks."""
+        if not self.matches(telegram):
+            return
+        queue = self._queue
+        if self._latest:
+            key = self._key(telegram)
+            if key in queue:
+                # Replaced in place, so a busy key cannot push quieter keys out of the queue
+                self.dropped += 1
+            elif len(queue) >= self.maxsize:
+                self.dropped += 1
+                queue.popitem(last=False)
+            queue[key] = telegram
+        else:
+            if len(queue) == self.maxsize:
+                self.dropped += 1
+            queue.append(telegram)
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def get_nowait(self):
+        """Return the oldest queued telegram, None if the queue is empty."""
+        queue = self._queue
+        if not queue:
+            return None
+        self.delivered += 1
+        if self._latest:
+            return queue.popitem(last=False)[1]
+        return queue.popleft()
+
+    async def get(self):
+        """Wait for the next telegram; None once the subscription is closed."""
+        while not self._queue:
+            if self.closed:
+                return None
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self.get_nowait()
+
+    def close(self):
+        """Unsubscribe; an iterating consumer gets the telegrams still queued, then stops."""
+        if self.closed:
+            return
+        self.closed = True
+        self._on_close(self)
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def __aiter__(self):
+        try:
+            while True:
+                telegram = await self.get()
+                if telegram is None:
+                    return
+                yield telegram
+        finally:
+            self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
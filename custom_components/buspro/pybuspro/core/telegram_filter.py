@@ -0,0 +1,113 @@
+"""Indexed (source, target, operate code) filter with a per-key rate limit.
+
+Rules are compiled into one dict per combination of the fields they specify, so matching a
+telegram costs one lookup per combination in use, and a telegram whose operate code (or source,
+when every rule names one) no rule mentions is rejected by a single set lookup.
+"""
+from .metrics import operate_code_name
+from ..helpers.telegram_helper import TelegramHelper
+
+# Minimum seconds between two matches of the same (source, target, operate code) by default
+DEFAULT_MIN_INTERVAL = 0.2
+
+_IDX_OP_CODE = TelegramHelper.IDX_OP_CODE
+
+
+class TelegramRule:
+    """One filter entry; None in source, target or operate_code matches any value."""
+
+    __slots__ = ("source", "target", "operate_code", "min_interval")
+
+    def __init__(self, source=None, target=None, operate_code=None, min_interval=DEFAULT_MIN_INTERVAL):
+        self.source = tuple(source) if source is not None else None
+        self.target = tuple(target) if target is not None else None
+        if operate_code is not None and not isinstance(operate_code, int):
+            # [high, low] as in the send_message service, or an OperateCode
+            operate_code = int.from_bytes(bytes(getattr(operate_code, "value", operate_code)), "big")
+        self.operate_code = operate_code
+        self.min_interval = min_interval
+
+    @property
+    def mask(self):
+        return self.source is not None, self.target is not None, self.operate_code is not None
+
+    def __repr__(self):
+        operate_code = operate_code_name(self.operate_code) if self.operate_code is not None else None
+        return f"TelegramRule(source={self.source}, target={self.target}, operate_code={operate_code}, min_interval={self.min_interval})"
+
+
+def _key(mask, source, target, operate_code):
+    has_source, has_target, has_operate_code = mask
+    return (source if has_source else None, target if has_target else None, operate_code if has_operate_code else None)
+
+
+class TelegramFilter:
+    """Decide which received telegrams pass a set of TelegramRule, at most once per min_interval per key.
+
+    The rate limit applies per actual (source, target, operate code), so a wildcard rule limits
+    every module it matches separately. Runs on the event loop; clock is loop.time.
+    """
+
+    def __init__(self, rules, clock):
+        self.rules = list(rules)
+        self._clock = clock
+        tables = {}
+        for rule in self.rules:
+            tables.setdefault(rule.mask, {}).setdefault(_key(rule.mask, rule.source, rule.target, rule.operate_code), rule)
+        # Most specific combinations first, so the narrowest rule decides the rate limit
+        self._tables = sorted(tables.items(), key=lambda item: -sum(item[0]))
+        self._operate_codes = None
+        self._sources = None
+        if self.rules and all(rule.operate_code is not None for rule in self.rules):
+            self._operate_codes = frozenset(rule.operate_code for rule in self.rules)
+        elif self.rules and all(rule.source is not None for rule in self.rules):
+            self._sources = frozenset(rule.source for rule in self.rules)
+        self._last_passed = {}
+        self.passed = 0
+        self.rate_limited = 0
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def match(self, telegram):
+        """Return the rule telegram matches, None if it matches none. Does not apply the rate limit."""
+        udp_data = telegram.udp_data
+        if udp_data is None:
+            return None
+        return self._lookup(telegram, (udp_data[_IDX_OP_CODE] << 8) | udp_data[_IDX_OP_CODE + 1])
+
+    def _lookup(self, telegram, operate_code):
+        if self._operate_codes is not None and operate_code not in self._operate_codes:
+            return None
+        source = telegram.source_address
+        if self._sources is not None and source not in self._sources:
+            return None
+        target = telegram.target_address
+        for mask, table in self._tables:
+            rule = table.get(_key(mask, source, target, operate_code))
+            if rule is not None:
+                return rule
+        return None
+
+    def accept(self, telegram):
+        """Return True if telegram matches a rule and its key is not rate limited."""
+        udp_data = telegram.udp_data
+        if udp_data is None:
+            return False
+        operate_code = (udp_data[_IDX_OP_CODE] << 8) | udp_data[_IDX_OP_CODE + 1]
+        # Inlined first stage of _lookup, the path nearly every telegram takes
+        if self._operate_codes is not None and operate_code not in self._operate_codes:
+            return False
+        rule = self._lookup(telegram, operate_code)
+        if rule is None:
+            return False
+        if rule.min_interval > 0:
+            key = (telegram.source_address, telegram.target_address, operate_code)
+            now = self._clock()
+            last = self._last_passed.get(key)
+            if last is not None and now - last < rule.min_interval:
+                self.rate_limited += 1
+                return False
+            self._last_passed[key] = now
+        self.passed += 1
+        return True
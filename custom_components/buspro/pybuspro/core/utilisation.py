@@ -0,0 +1,52 @@
+"""Bus occupancy estimate against the 9600 baud capacity of the HDL bus."""
+import time
+from array import array
+
+from ..transport.send_queue import bus_frame_seconds
+
+# Longest window occupancy can be asked for, in seconds
+MAX_WINDOW_SECONDS = 60
+# One slot more than the longest window for the second in progress
+_SLOTS = MAX_WINDOW_SECONDS + 1
+# Windows reported by snapshot()
+WINDOWS = (1, 10, 60)
+
+
+class BusUtilisation:
+    """Rolling estimate of how busy the bus is.
+
+    Every frame seen on either side of the gateway adds the time it occupies the bus to the
+    bucket of the whole second it was seen in. Buckets are two fixed arrays indexed by second
+    modulo their length; a slot still holding an older second is reset on first use.
+    occupancy(window) covers the last window complete seconds, so it does not dip at the start
+    of every second.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._busy = array('d', bytes(_SLOTS * array('d').itemsize))
+        self._seconds = array('q', [-1]) * _SLOTS
+
+    def add_frame(self, udp_frame_length, now=None):
+        """Account for a frame of udp_frame_length bytes (as carried over UDP) seen on the bus."""
+        second = int(self._clock() if now is None else now)
+        slot = second % _SLOTS
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._busy[slot] = 0.0
+        self._busy[slot] += bus_frame_seconds(udp_frame_length)
+
+    def occupancy(self, window=1, now=None):
+        """Return the percentage of bus capacity used over the last window complete seconds."""
+        window = max(1, min(int(window), MAX_WINDOW_SECONDS))
+        current = int(self._clock() if now is None else now)
+        busy = 0.0
+        for second in range(current - window, current):
+            slot = second % _SLOTS
+            if self._seconds[slot] == second:
+                busy += self._busy[slot]
+        return round(min(busy / window * 100, 100.0), 1)
+
+    def snapshot(self):
+        now = self._clock()
+        return {f"{window}s": self.occupancy(window, now) for window in WINDOWS}
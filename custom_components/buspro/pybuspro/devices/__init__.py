@@ -7,6 +7,9 @@ from .sensor import Sensor
 from .switch import Switch
 from .button import Button
 from .cover import Cover
+from .energy_meter import EnergyMeter
+from .channel_group import set_channel_levels
+from .module_status import ModuleStatus
 from .universal_switch import UniversalSwitch
 from .sensor import SensorType, DeviceFamily, Sensor
 
@@ -19,6 +22,9 @@ __all__ = [
     'Switch',
     'Button',
     'Cover',
+    'EnergyMeter',
+    'set_channel_levels',
+    'ModuleStatus',
     'UniversalSwitch',
     'SensorType',
     'DeviceFamily'
@@ -0,0 +1,56 @@
+"""Group commands for light and switch channels spread over several modules."""
+import asyncio
+import logging
+
+from .control import _SingleChannelControl
+from ..helpers.generics import Generics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def set_channel_levels(buspro, targets, running_time_seconds=0):
+    """Set many channels at once and return the loop time the last frame reached the wire.
+
+    targets is an iterable of ((subnet_id, device_id), channel_number, level). All frames are
+    encoded before any is queued, ordered by module and channel, and queued back-to-back so the
+    paced queue sends them as one batch. A later target for the same channel replaces an earlier
+    one. HDL has no all-channel or multi-channel level command, so each channel still costs one
+    frame; broadcast targets would address every module on the subnet and are not used. A module
+    scene sets several channels with one frame, but only to levels programmed into the module.
+
+    This is an ordering and batching convenience, not a speed-up: the paced queue sends the frames
+    at bus speed either way, so the last channel is set no sooner than with one set_brightness
+    call per channel. What it adds is one call, a deterministic order and one completion time.
+
+    Returns None if nothing was sent.
+    """
+    levels = {}
+    for device_address, channel_number, level in targets:
+        levels[(tuple(device_address), channel_number)] = level
+    if not levels:
+        return None
+
+    (minutes, seconds) = Generics.calculate_minutes_seconds(running_time_seconds)
+    telegrams = []
+    coalesce_keys = []
+    for (device_address, channel_number), level in sorted(levels.items()):
+        scc = _SingleChannelControl(buspro, device_address)
+        scc.channel_number = channel_number
+        scc.channel_level = level
+        scc.running_time_minutes = minutes
+        scc.running_time_seconds = seconds
+        telegrams.append(scc.telegram)
+        coalesce_keys.append(scc.coalesce_key)
+
+    network_interface = buspro.network_interface
+    if network_interface is None:
+        _LOGGER.warning("Network interface is not ready")
+        return None
+
+    futures = await network_interface.send_telegrams(telegrams, coalesce_keys)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(f"Queued group command for {len(telegrams)} channels")
+
+    sent_times = await asyncio.gather(*(future for future in futures if future is not None))
+    sent_times = [sent_time for sent_time in sent_times if sent_time is not None]
+    return max(sent_times, default=None)
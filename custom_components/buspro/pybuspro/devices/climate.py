@@ -19,9 +19,9 @@ class ClimateDeviceType(Enum):
 class Climate(Device):
     """Representation of HDL Buspro climate device."""
 
-    def __init__(self, hass, device_address, name="", device_type=ClimateDeviceType.PANEL, channel_number=None):
+    def __init__(self, buspro, device_address, name="", device_type=ClimateDeviceType.PANEL, channel_number=None):
         """Initialize climate device."""
-        super().__init__(hass, device_address, name)
+        super().__init__(buspro, device_address, name)
         self._device_type = device_type
         self._channel_number = channel_number
         self._temperature = None
@@ -31,7 +31,7 @@ class Climate(Device):
         self._work_type = WorkType
 
         self._device_address = device_address
-        self._hass = hass
+        self._buspro = buspro
 
         self._temperature_type = None   # Celsius/Fahrenheit
         self._status = None             # On/Off
@@ -47,7 +47,7 @@ class Climate(Device):
         self._watering_time = 0
 
         self.register_telegram_received_cb(self._telegram_received_cb)
-        self._hass.loop.create_task(self.read_status())
+        self._buspro.loop.create_task(self.read_status())
 
     def _telegram_received_cb(self, telegram):
         if telegram.operate_code == OperateCode.DLPReadFloorHeatingStatusResponse:
@@ -119,7 +119,7 @@ class Climate(Device):
 
     async def _controlFHM(self) -> None:
         if self._device_type == ClimateDeviceType.FLOOR_HEATING:
-            control = _FHMControlFloorHeatingStatus(self._hass, self._device_address)
+            control = _FHMControlFloorHeatingStatus(self._buspro, self._device_address)
             control.work_type = self._work_type
             control.channel_number = self._channel_number
             control.temperature_type = self._temperature_type
@@ -245,11 +245,11 @@ class Climate(Device):
     async def read_status(self):
         """Read status from the device."""
         if self._device_type == ClimateDeviceType.FLOOR_HEATING:
-            fhmrfhs = _FHMReadFloorHeatingStatus(self._hass, self._device_address) 
+            fhmrfhs = _FHMReadFloorHeatingStatus(self._buspro, self._device_address) 
             fhmrfhs.channel_number = self._channel_number     
             await fhmrfhs.send()                
         elif self._device_type == ClimateDeviceType.DLP:
-            rfhs = _ReadFloorHeatingStatus(self._hass, self._device_address) 
+            rfhs = _ReadFloorHeatingStatus(self._buspro, self._device_address) 
             await rfhs.send()
 
     async def set_work_type(self, work_type: WorkType) -> None:
@@ -0,0 +1,148 @@
+"""Stateless one-shot commands.
+
+These encode and queue a single frame without creating a Device, so nothing is registered on
+the bus and no status reads are scheduled. Use them for fire-and-forget actions such as
+integration services; use the Device classes for anything that tracks state.
+"""
+import asyncio
+import time
+
+from .control import _GenericControl, _ModifySystemDateandTime, _SceneControl, _UniversalSwitch
+from ..helpers.enums import OnOff, OperateCode
+
+# Seconds to wait for a module to answer a telegram sent with send_messages(await_response=True)
+DEFAULT_RESPONSE_TIMEOUT = 2.0
+
+
+async def activate_scene(buspro, device_address, area_number, scene_number):
+    """Run a scene on a module."""
+    scene_control = _SceneControl(buspro, device_address)
+    scene_control.area_number = area_number
+    scene_control.scene_number = scene_number
+    return await scene_control.send()
+
+
+async def set_universal_switch(buspro, device_address, switch_number, on):
+    """Switch a universal switch on a module on or off."""
+    universal_switch = _UniversalSwitch(buspro, device_address)
+    universal_switch.switch_number = switch_number
+    universal_switch.switch_status = OnOff.ON if on else OnOff.OFF
+    return await universal_switch.send()
+
+
+async def send_message(buspro, device_address, operate_code, payload):
+    """Send an arbitrary telegram; operate_code is an OperateCode or its two bytes."""
+    generic_control = _GenericControl(buspro, device_address)
+    generic_control.operate_code = operate_code
+    generic_control.payload = payload
+    return await generic_control.send()
+
+
+def response_operate_code(operate_code):
+    """Return the raw operate code of the response to operate_code (HDL responses are request + 1)."""
+    raw = operate_code.value if isinstance(operate_code, OperateCode) else bytes(operate_code)
+    return ((int.from_bytes(raw, "big") + 1) & 0xFFFF).to_bytes(2, "big")
+
+
+async def send_messages(buspro, messages, delay=0, await_response=False, timeout=DEFAULT_RESPONSE_TIMEOUT):
+    """Send a list of (device_address, operate_code, payload) telegrams and report each outcome.
+
+    Without a delay all telegrams are encoded up front and queued back-to-back; with a delay each
+    one is queued delay seconds after the previous one went out. With await_response each telegram
+    waits up to timeout seconds, counted from its wire time, for the response from its target.
+
+    Returns one dict per message, in order, with "status" of "failed", "sent", "response" or
+    "timeout", and the response payload when one arrived.
+    """
+    if buspro.network_interface is None:
+        return [{"status": "failed"} for _ in messages]
+
+    telegrams = []
+    for device_address, operate_code, payload in messages:
+        generic_control = _GenericControl(buspro, device_address)
+        generic_control.operate_code = operate_code
+        generic_control.payload = payload
+        telegrams.append(generic_control.telegram)
+
+    waiters = [None] * len(telegrams)
+    if await_response:
+        for index, telegram in enumerate(telegrams):
+            waiters[index] = buspro.expect_response(telegram.target_address, response_operate_code(telegram.operate_code))
+
+    if delay > 0:
+        sent_futures = []
+        for telegram in telegrams:
+            future = await buspro.network_interface.send_telegram(telegram)
+            sent_futures.append(future)
+            if future is not None:
+                await future
+            await asyncio.sleep(delay)
+    else:
+        sent_futures = await buspro.network_interface.send_telegrams(telegrams)
+
+    return await asyncio.gather(*(
+        _outcome(buspro, telegram, sent_future, waiter, timeout)
+        for telegram, sent_future, waiter in zip(telegrams, sent_futures, waiters)
+    ))
+
+
+async def _outcome(buspro, telegram, sent_future, waiter, timeout):
+    sent_at = await _sent_time(sent_future)
+    if sent_at is None:
+        if waiter is not None:
+            buspro.discard_response(telegram.target_address, response_operate_code(telegram.operate_code), waiter)
+        return {"status": "failed"}
+    if waiter is None:
+        return {"status": "sent"}
+
+    try:
+        remaining = max(sent_at + timeout - buspro.loop.time(), 0)
+        response, received_at = await asyncio.wait_for(waiter, remaining)
+    except asyncio.TimeoutError:
+        buspro.discard_response(telegram.target_address, response_operate_code(telegram.operate_code), waiter)
+        return {"status": "timeout"}
+    return {
+        "status": "response",
+        "response_time": round(received_at - sent_at, 3),
+        "payload": list(response.payload),
+    }
+
+
+async def sync_time(buspro, device_addresses, clock):
+    """Set the clock of many modules to one aligned time and report each frame's wire drift.
+
+    Waits once for the next whole second, reads clock() (a callable returning a datetime), and
+    encodes every _ModifySystemDateandTime frame with that same time before queueing them
+    back-to-back. Returns one dict per address with the time that was set and the seconds between
+    the alignment point and the frame reaching the wire, or None if it was not sent.
+    """
+    if buspro.network_interface is None:
+        return [{"address": list(device_address), "drift": None} for device_address in device_addresses]
+
+    await asyncio.sleep(1 - (time.time() % 1))
+    aligned_at = buspro.loop.time()
+    now = clock()
+
+    telegrams = []
+    for device_address in device_addresses:
+        modify_time = _ModifySystemDateandTime(buspro, device_address)
+        modify_time.custom_datetime = now
+        telegrams.append(modify_time.telegram)
+
+    futures = await buspro.network_interface.send_telegrams(telegrams)
+    sent_times = await asyncio.gather(*(_sent_time(future) for future in futures))
+
+    return [
+        {
+            "address": list(device_address),
+            "time": now.replace(microsecond=0).isoformat(),
+            "drift": None if sent_at is None else round(sent_at - aligned_at, 3),
+        }
+        for device_address, sent_at in zip(device_addresses, sent_times)
+    ]
+
+
+async def _sent_time(future):
+    if future is None:
+        return None
+    return await future
@@ -1,14 +1,12 @@
 import logging
 
-from custom_components.buspro.const import DATA_BUSPRO
-
 from ..core.telegram import Telegram
 from ..helpers.enums import OperateCode
 _LOGGER = logging.getLogger(__name__)
 
 class _Control:
-    def __init__(self, hass, device_address):
-        self._hass = hass
+    def __init__(self, buspro, device_address):
+        self._buspro = buspro
         self.subnet_id = device_address[0]
         self.device_id = device_address[1]
         #if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -181,19 +179,22 @@ class _Control:
     def telegram(self):
         return self.build_telegram_from_control(self)
 
+    @property
+    def coalesce_key(self):
+        """Key under which a newer queued control replaces an older one, None to always send."""
+        return None
+
     async def send(self):
         """Send telegram through network interface."""
         try:
-            await self._hass.data[DATA_BUSPRO].hdl.network_interface.send_telegram(self.telegram)
+            return await self._buspro.network_interface.send_telegram(self.telegram, self.coalesce_key)
             
         except AttributeError as e:
             if self.telegram is None:
                 _LOGGER.warning("Cannot send empty telegram")
-            elif DATA_BUSPRO not in self._hass.data:
-                _LOGGER.warning("Buspro module is not initialized")
-            elif not self._hass.data[DATA_BUSPRO].hdl:
+            elif not self._buspro:
                 _LOGGER.warning("HDL instance is not initialized")
-            elif not self._hass.data[DATA_BUSPRO].hdl.network_interface:
+            elif not self._buspro.network_interface:
                 _LOGGER.warning("Network interface is not ready")
             else:
                 _LOGGER.warning(f"Cannot send telegram - component not fully initialized: {e}")
@@ -202,83 +203,93 @@ class _Control:
 
 
 class _GenericControl(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
 
         self.payload = None
         self.operate_code = None
 
 
 class _SingleChannelControl(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
 
         self.channel_number = None
         self.channel_level = None
         self.running_time_minutes = None
         self.running_time_seconds = None
 
+    @property
+    def coalesce_key(self):
+        # Only the latest level for a channel matters
+        return (OperateCode.SingleChannelControl, self.subnet_id, self.device_id, self.channel_number)
+
 
 class _SceneControl(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
 
         self.area_number = None
         self.scene_number = None
 
 
 class _ReadStatusOfChannels(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
         # no more properties
 
+    @property
+    def coalesce_key(self):
+        # One response carries every channel, so one queued read per module is enough
+        return (OperateCode.ReadStatusOfChannels, self.subnet_id, self.device_id)
+
 
 class _UniversalSwitch(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
 
         self.switch_number = None
         self.switch_status = None
 
 
 class _ReadStatusOfUniversalSwitch(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
 
         self.switch_number = None
 
 class _ReadStatusOfSwitch(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
 
 
 class _Read12in1SensorStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
         # no more properties
 
 
 class _ReadSensorsInOneStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
         # no more properties
 
 
 class _ReadTemperatureStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
         self.channel_number = None
 
 
 class _ReadFloorHeatingStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
         # no more properties
 
 
 class _ControlFloorHeatingStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
 
         self.temperature_type = None
         self.status = None
@@ -290,83 +301,83 @@ class _ControlFloorHeatingStatus(_Control):
 
 
 class _ReadDryContactStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
 
         self.switch_number = None
 
 
 class _PanelControl(_Control):
     """Panel control command."""    
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
                 
         self.remark = None
         self.key_number = None
         self.key_status = None
 
 class _ReadPanelStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
                 
         self.remark = None
         self.key_number = None
         
 class _CurtainSwitchControl(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
                 
         self.channel = None
         self.state = None
 
 class _CurtainReadStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
                         
         self.channel = None
         
 
 class _ReadSecurityModule(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
                         
         self.area = None
 
 class _ArmSecurityModule(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
                         
         self.area = None
         self.arm_type = None
         
 class _AlarmSecurityModule(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
                         
         self.area = None
         
 
 class _ModifySystemDateandTime(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
         self.custom_datetime = None
 
 class _BroadcastSystemDateandTimeEveryMinute(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
         self.custom_datetime = None
 
 
 
 class _FHMReadFloorHeatingStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
         self.channel_number = None
 
 
 class _FHMControlFloorHeatingStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)
         self.channel_number = None
         self.work_type = None
         self.status = None
@@ -379,26 +390,26 @@ class _FHMControlFloorHeatingStatus(_Control):
 
 
 class _ReadVoltageStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)        
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)        
         self.channel_number = None
 
 class _ReadCurrentStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)        
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)        
         self.channel_number = None
 
 class _ReadPowerStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)        
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)        
         self.channel_number = None
 
 class _ReadPowerFactorStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)        
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)        
         self.channel_number = None
 
 class _ReadElectricityStatus(_Control):
-    def __init__(self, hass, device_address):
-        super().__init__(hass, device_address)        
+    def __init__(self, buspro, device_address):
+        super().__init__(buspro, device_address)        
         self.channel_number = None
@@ -1,17 +1,14 @@
 ﻿import asyncio
 
-from custom_components.buspro.const import DATA_BUSPRO
-
-
 from .control import _ReadStatusOfChannels
 
 
 class Device(object):
-    def __init__(self, hass, device_address, name=""):
+    def __init__(self, buspro, device_address, name=""):
         # device_address = (subnet_id, device_id, ...)
 
         self._device_address = device_address
-        self._hass = hass
+        self._buspro = buspro
         self._name = name
         self.device_updated_cbs = []
 
@@ -20,7 +17,7 @@ class Device(object):
         return self._name
 
     def register_telegram_received_cb(self, telegram_received_cb):
-        self._hass.data[DATA_BUSPRO].hdl.register_telegram_received_device_cb(
+        self._buspro.register_telegram_received_device_cb(
             telegram_received_cb, 
             self._device_address
         )
@@ -46,17 +43,17 @@ class Device(object):
 
     def _call_device_updated(self, should_reschedule=True):
         """Call device updated with scheduler reset flag."""
-        asyncio.ensure_future(self._device_updated(should_reschedule), loop=self._hass.data[DATA_BUSPRO].hdl.loop)
+        asyncio.ensure_future(self._device_updated(should_reschedule), loop=self._buspro.loop)
 
     def _call_read_current_status_of_channels(self, run_from_init=False):
         async def read_current_state_of_channels():
             if run_from_init:
                 await asyncio.sleep(5)
             
-            read_status_of_channels = _ReadStatusOfChannels(self._hass, self._device_address)
+            read_status_of_channels = _ReadStatusOfChannels(self._buspro, self._device_address)
             await read_status_of_channels.send()
 
         asyncio.ensure_future(
             read_current_state_of_channels(), 
-            loop=self._hass.data[DATA_BUSPRO].hdl.loop
+            loop=self._buspro.loop
         )
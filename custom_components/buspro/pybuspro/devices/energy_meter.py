@@ -0,0 +1,182 @@
+"""HDL Buspro energy meter device implementation."""
+import asyncio
+import logging
+import math
+import struct
+from array import array
+
+from .control import _ReadCurrentStatus, _ReadElectricityStatus, _ReadPowerFactorStatus, _ReadPowerStatus, _ReadVoltageStatus
+from .device import Device
+from ..helpers.enums import OperateCode, SensorType
+
+_LOGGER = logging.getLogger(__name__)
+
+PHASES = 3
+CHANNELS = 4  # phases 1-3 and total
+
+# Slice of the meter record holding each metric: (start index, number of channels)
+_RECORD_LAYOUT = {
+    SensorType.VOLTAGE: (0, PHASES),
+    SensorType.CURRENT: (3, PHASES),
+    SensorType.POWER_FACTOR: (6, PHASES),
+    SensorType.ACTIVE_POWER: (9, CHANNELS),
+    SensorType.REACTIVE_POWER: (13, CHANNELS),
+    SensorType.APPARENT_POWER: (17, CHANNELS),
+    SensorType.ENERGY: (21, CHANNELS),
+}
+_RECORD_SIZE = 25
+
+# Metrics sent as 16-bit words; the record holds them as doubles, value() hands them back as int
+_INTEGER_METRICS = frozenset((SensorType.ACTIVE_POWER, SensorType.REACTIVE_POWER, SensorType.APPARENT_POWER, SensorType.ENERGY))
+
+METER_SENSOR_TYPES = tuple(_RECORD_LAYOUT)
+
+# Read command per metric; active, reactive and apparent power share one response
+_READ_CONTROLS = {
+    SensorType.VOLTAGE: _ReadVoltageStatus,
+    SensorType.CURRENT: _ReadCurrentStatus,
+    SensorType.POWER_FACTOR: _ReadPowerFactorStatus,
+    SensorType.ACTIVE_POWER: _ReadPowerStatus,
+    SensorType.REACTIVE_POWER: _ReadPowerStatus,
+    SensorType.APPARENT_POWER: _ReadPowerStatus,
+    SensorType.ENERGY: _ReadElectricityStatus,
+}
+
+# Active, reactive and apparent power, four 16-bit words each
+_POWER_STATUS = struct.Struct(">12H")
+_U16 = struct.Struct(">H")
+
+# Scheduler ticks once a second, so polls of one interval may be spread by up to a second
+_READ_TOLERANCE = 1.0
+
+
+def _decode_decimal(payload, offset):
+    """Decode the four-digit decimal encoding used by the meter (tens, units, tenths, hundredths)."""
+    return round((payload[offset] * 10.0) + payload[offset + 1] + (payload[offset + 2] / 10.0) + (payload[offset + 3] / 100.0), 2)
+
+
+def get_energy_meter(buspro, device_address):
+    """Return the EnergyMeter shared by all entities of the meter at device_address."""
+    device_address = tuple(device_address)
+    key = ("energy_meter", device_address)
+    return buspro.get_shared_device(key, lambda: EnergyMeter(buspro, device_address))
+
+
+class EnergyMeter(Device):
+    """HDL Buspro energy meter.
+
+    Every response carries all phases of a metric, so it is decoded once into an array-backed
+    record and all attached entities are notified. Reads are issued once per metric per interval
+    no matter how many entities poll the meter.
+    """
+
+    def __init__(self, buspro, device_address, name=""):
+        super().__init__(buspro, device_address, name)
+        self._buspro = buspro
+        self._device_address = device_address
+        self._record = array('d', [math.nan]) * _RECORD_SIZE
+        self._metrics = set()
+        self._last_read = {}
+        self._init_read_scheduled = False
+
+        self.register_telegram_received_cb(self._telegram_received_cb)
+
+    def _telegram_received_cb(self, telegram):
+        handler = self._TELEGRAM_HANDLERS.get(telegram.operate_code)
+        if handler is not None:
+            handler(self, telegram)
+
+    def _handle_decimal(self, telegram, sensor_type):
+        payload = telegram.payload
+        start, _ = _RECORD_LAYOUT[sensor_type]
+        for phase in range(min(PHASES, len(payload) // 4)):
+            self._record[start + phase] = _decode_decimal(payload, phase * 4)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"{sensor_type.value} received for meter {self._device_address}: {list(self._record[start:start + PHASES])}")
+        self._call_device_updated()
+
+    def _handle_voltage(self, telegram):
+        self._handle_decimal(telegram, SensorType.VOLTAGE)
+
+    def _handle_current(self, telegram):
+        self._handle_decimal(telegram, SensorType.CURRENT)
+
+    def _handle_power_factor(self, telegram):
+        self._handle_decimal(telegram, SensorType.POWER_FACTOR)
+
+    def _handle_power(self, telegram):
+        if len(telegram.payload) < _POWER_STATUS.size:
+            _LOGGER.warning(f"Short power status from meter {self._device_address}: {telegram.payload}")
+            return
+        start, _ = _RECORD_LAYOUT[SensorType.ACTIVE_POWER]
+        self._record[start:start + 12] = array('d', _POWER_STATUS.unpack_from(bytes(telegram.payload)))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Power received for meter {self._device_address}: active:{list(self._record[9:13])}W,"
+                          f" reactive:{list(self._record[13:17])}VAr, apparent:{list(self._record[17:21])}VA")
+        self._call_device_updated()
+
+    def _handle_energy(self, telegram):
+        data = bytes(telegram.payload)
+        start, _ = _RECORD_LAYOUT[SensorType.ENERGY]
+        for channel in range(min(CHANNELS, len(data) // 2)):
+            self._record[start + channel] = _U16.unpack_from(data, channel * 2)[0]
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Energy received for meter {self._device_address}: {list(self._record[start:start + CHANNELS])}")
+        self._call_device_updated()
+
+    _TELEGRAM_HANDLERS = {
+        OperateCode.ReadVoltageResponse: _handle_voltage,
+        OperateCode.ReadCurrentResponse: _handle_current,
+        OperateCode.ReadPowerFactorStatusResponse: _handle_power_factor,
+        OperateCode.ReadPowerStatusResponse: _handle_power,
+        OperateCode.ReadElectricityStatusResponse: _handle_energy,
+    }
+
+    def value(self, sensor_type, channel_number):
+        """Return the last value of a metric for a channel (1-3 phases, 4 total), or None if unknown."""
+        start, count = _RECORD_LAYOUT[sensor_type]
+        if channel_number is None or not 1 <= channel_number <= count:
+            return None
+        value = self._record[start + channel_number - 1]
+        if math.isnan(value):
+            return None
+        if sensor_type in _INTEGER_METRICS:
+            return int(value)
+        return value
+
+    def attach(self, sensor_type):
+        """Register that an entity reads sensor_type, scheduling one initial read for the whole meter."""
+        self._metrics.add(SensorType(sensor_type))
+        if not self._init_read_scheduled:
+            self._init_read_scheduled = True
+            self._call_read_metrics(run_from_init=True)
+
+    async def read_metric(self, sensor_type, interval=0):
+        """Read one metric unless the same read was already sent within the last interval seconds."""
+        control_class = _READ_CONTROLS[SensorType(sensor_type)]
+        now = self._buspro.loop.time()
+        last_read = self._last_read.get(control_class)
+        if last_read is not None and now - last_read < interval - _READ_TOLERANCE:
+            return
+        self._last_read[control_class] = now
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Reading {control_class.__name__} for meter {self._device_address}")
+        control = control_class(self._buspro, self._device_address)
+        await control.send()
+
+    async def read_sensor_status(self):
+        """Read every metric used by attached entities, one read per response type."""
+        for control_class in {_READ_CONTROLS[metric] for metric in self._metrics}:
+            control = control_class(self._buspro, self._device_address)
+            self._last_read[control_class] = self._buspro.loop.time()
+            await control.send()
+
+    def _call_read_metrics(self, run_from_init=False):
+
+        async def read_metrics():
+            if run_from_init:
+                await asyncio.sleep(5)
+            await self.read_sensor_status()
+
+        asyncio.ensure_future(read_metrics(), loop=self._buspro.loop)
@@ -1,19 +1,35 @@
 ﻿from .control import _SingleChannelControl, _ReadStatusOfChannels
 from .device import Device
+from .module_status import get_module_status
+from .optimistic import OptimisticLevel
 from ..helpers.enums import *
 from ..helpers.generics import Generics
 
+# Seconds between local state refreshes while a ramp runs; no frames are sent for them
+RAMP_REFRESH_SECONDS = 1.0
+
 
 class Light(Device):
-    def __init__(self, hass, device_address, channel_number, name="", delay_read_current_state_seconds=0):
-        super().__init__(hass, device_address, name)
+    def __init__(self, buspro, device_address, channel_number, name="", delay_read_current_state_seconds=0):
+        super().__init__(buspro, device_address, name)
         # device_address = (subnet_id, device_id, channel_number)
 
-        self._hass = hass
+        self._buspro = buspro
         self._device_address = device_address
         self._channel_number = channel_number
         self._brightness = 0
         self._previous_brightness = None
+        # Native ramp towards self._brightness: (start level, start loop time, duration seconds)
+        self._ramp = None
+        self._ramp_timer = None
+        self._optimistic = OptimisticLevel(
+            self._buspro.loop,
+            self._buspro.optimistic_stats,
+            self._call_read_current_status_of_channels,
+            self._revert_brightness,
+        )
+        # Scene responses are answered by one debounced status read per module
+        get_module_status(buspro, device_address)
         self.register_telegram_received_cb(self._telegram_received_cb)
         self._call_read_current_status_of_channels(run_from_init=True)
 
@@ -27,16 +43,32 @@ class Light(Device):
             # success = telegram.payload[1]
             brightness = telegram.payload[2]
             if channel == self._channel_number:
+                self._optimistic.control_response(brightness)
+                if brightness != self._brightness:
+                    self._cancel_ramp()
                 self._brightness = brightness
                 self._set_previous_brightness(self._brightness)
                 self._call_device_updated()
         elif telegram.operate_code == OperateCode.ReadStatusOfChannelsResponse:
             if self._channel_number <= telegram.payload[0]:
-                self._brightness = telegram.payload[self._channel_number]
+                brightness = telegram.payload[self._channel_number]
+                if self._ramp_passes(brightness):
+                    # Mid-ramp reading: the module is on its way to the target. The level stays
+                    # pending; its confirmation window already covers the whole ramp
+                    self._reanchor_ramp(brightness)
+                    if self._ramp is None:
+                        # Read exactly at the target, so the ramp is done
+                        self._optimistic.status_response(brightness)
+                    self._call_device_updated(should_reschedule=False)
+                    return
+                if not self._optimistic.status_response(brightness):
+                    return
+                self._cancel_ramp()
+                self._brightness = brightness
                 self._set_previous_brightness(self._brightness)
                 self._call_device_updated()
         elif telegram.operate_code == OperateCode.SceneControlResponse:
-            self._call_read_current_status_of_channels()
+            self._cancel_ramp()
 
     async def set_on(self, running_time_seconds=0):
         intensity = 100
@@ -50,7 +82,7 @@ class Light(Device):
         await self._set(intensity, running_time_seconds)
 
     async def read_status(self):
-        rsoch = _ReadStatusOfChannels(self._hass, self._device_address)        
+        rsoch = _ReadStatusOfChannels(self._buspro, self._device_address)        
         await rsoch.send()
 
     @property
@@ -67,23 +99,37 @@ class Light(Device):
 
     @property
     def current_brightness(self):
-        return self._brightness
+        if self._ramp is None:
+            return self._brightness
+        start_level, start_time, duration = self._ramp
+        elapsed = self._buspro.loop.time() - start_time
+        if elapsed >= duration:
+            return self._brightness
+        return round(start_level + (self._brightness - start_level) * elapsed / duration)
+
+    @property
+    def ramp_in_progress(self):
+        return self._ramp is not None
 
     @property
     def is_on(self):
-        if self._brightness == 0:
+        if self.current_brightness == 0:
             return False
         else:
             return True
 
     async def _set(self, intensity, running_time_seconds):
+        self._optimistic.start(intensity, self._brightness, running_time_seconds)
+        start_level = self.current_brightness
         self._brightness = intensity
+        self._start_ramp(start_level, running_time_seconds)
         self._set_previous_brightness(self._brightness)
+        self._call_device_updated()
 
         generics = Generics()
         (minutes, seconds) = generics.calculate_minutes_seconds(running_time_seconds)
 
-        scc = _SingleChannelControl(self._hass, self._device_address)        
+        scc = _SingleChannelControl(self._buspro, self._device_address)        
         scc.channel_number = self._channel_number
         scc.channel_level = intensity
         scc.running_time_minutes = minutes
@@ -93,3 +139,55 @@ class Light(Device):
     def _set_previous_brightness(self, brightness):
         if self.supports_brightness and brightness > 0:
             self._previous_brightness = brightness
+
+    def _revert_brightness(self, brightness):
+        self._cancel_ramp()
+        self._brightness = brightness
+        self._call_device_updated()
+
+    def _start_ramp(self, start_level, duration):
+        """Predict the module's native ramp from start_level to self._brightness."""
+        self._cancel_ramp()
+        if duration <= 0 or start_level == self._brightness:
+            return
+        self._ramp = (start_level, self._buspro.loop.time(), duration)
+        self._schedule_ramp_refresh(duration)
+
+    def _ramp_passes(self, level):
+        """Return True if level lies on the running ramp, between its start and target levels."""
+        if self._ramp is None:
+            return False
+        start_level, start_time, duration = self._ramp
+        if self._buspro.loop.time() - start_time >= duration:
+            return False
+        return min(start_level, self._brightness) <= level <= max(start_level, self._brightness)
+
+    def _reanchor_ramp(self, level):
+        """Continue the prediction from a level read back from the module."""
+        _, start_time, duration = self._ramp
+        now = self._buspro.loop.time()
+        if level == self._brightness:
+            self._cancel_ramp()
+            return
+        self._ramp = (level, now, start_time + duration - now)
+
+    def _schedule_ramp_refresh(self, remaining):
+        self._ramp_timer = self._buspro.loop.call_later(min(RAMP_REFRESH_SECONDS, remaining), self._ramp_refresh)
+
+    def _ramp_refresh(self):
+        self._ramp_timer = None
+        if self._ramp is None:
+            return
+        _, start_time, duration = self._ramp
+        remaining = start_time + duration - self._buspro.loop.time()
+        if remaining > 0:
+            self._schedule_ramp_refresh(remaining)
+        else:
+            self._ramp = None
+        self._call_device_updated(should_reschedule=False)
+
+    def _cancel_ramp(self):
+        self._ramp = None
+        if self._ramp_timer is not None:
+            self._ramp_timer.cancel()
+            self._ramp_timer = None
@@ -0,0 +1,175 @@
+"""Channel status refresh shared by all channels of one module."""
+import asyncio
+import logging
+
+from .control import _ReadStatusOfChannels
+from .device import Device
+from ..core.telegram import Telegram
+from ..helpers.enums import OperateCode
+
+_LOGGER = logging.getLogger(__name__)
+
+# Scene events from one module within this many seconds are answered by a single status read
+SCENE_REFRESH_DELAY_SECONDS = 0.5
+# A scene with a running time is still fading when it is first read, so its levels are only
+# learned once two reads this many seconds apart agree; after SCENE_SETTLE_READS it is skipped
+SCENE_SETTLE_SECONDS = 2.0
+SCENE_SETTLE_READS = 3
+# Seconds to wait for the module to answer a learning read
+STATUS_RESPONSE_TIMEOUT = 2.0
+
+
+def get_module_status(buspro, device_address):
+    """Return the ModuleStatus shared by all Light and Switch channels of the module at device_address."""
+    device_address = tuple(device_address)
+    key = ("module_status", device_address)
+    return buspro.get_shared_device(key, lambda: ModuleStatus(buspro, device_address))
+
+
+class ModuleStatus(Device):
+    """Scene handling for the channels of one module.
+
+    Every channel of a module sees the module's SceneControlResponse. Instead of each channel
+    reading the module back, scene events are handled here once and debounced into a single
+    ReadStatusOfChannels. The read is skipped if a status response arrived after the last scene
+    event anyway, since the channels have already been updated from it.
+
+    The levels are learned into the bus SceneTable from this debounced read only, never from a
+    status response some channel asked for, and only once a second read SCENE_SETTLE_SECONDS
+    later reports the same levels, so a scene still running its fade is not learned half-way.
+    When a learned scene runs again its levels are dispatched to the channels as a status
+    response right away; no read is sent unless the entry is stale, in which case the read
+    verifies and refreshes it.
+    """
+
+    def __init__(self, buspro, device_address, name=""):
+        super().__init__(buspro, device_address, name)
+        self._buspro = buspro
+        self._device_address = device_address
+        self._last_scene_at = None
+        self._last_status_at = None
+        self._refresh_timer = None
+        self._scene_table = buspro.scene_table
+        # Scene whose levels the debounced read will teach the scene table
+        self._learning = None
+        self._dispatching = False
+        self.reads_sent = 0
+        self.reads_skipped = 0
+        self.scenes_applied = 0
+        self.scenes_unsettled = 0
+
+        self.register_telegram_received_cb(self._telegram_received_cb)
+
+    def _telegram_received_cb(self, telegram):
+        if self._dispatching:
+            return
+        if telegram.operate_code == OperateCode.SceneControlResponse:
+            self._last_scene_at = self._buspro.loop.time()
+            if len(telegram.payload) >= 2 and self._apply_learned_scene(telegram.payload[0], telegram.payload[1]):
+                return
+            self._schedule_refresh()
+        elif telegram.operate_code == OperateCode.ReadStatusOfChannelsResponse:
+            self._last_status_at = self._buspro.loop.time()
+
+    def _apply_learned_scene(self, area_number, scene_number):
+        """Update the channels from a learned scene; return True if no status read is needed."""
+        entry = self._scene_table.get(self._device_address, area_number, scene_number)
+        self._learning = (area_number, scene_number)
+        if entry is None:
+            return False
+
+        levels, fresh = entry
+        status = Telegram()
+        status.source_address = self._device_address
+        status.target_address = self._device_address
+        status.operate_code = OperateCode.ReadStatusOfChannelsResponse
+        status.payload = [len(levels), *levels]
+        self._dispatching = True
+        try:
+            self._buspro.dispatch_device_telegram(status)
+        finally:
+            self._dispatching = False
+        self.scenes_applied += 1
+
+        if not fresh:
+            return False
+        # A read pending for an earlier scene of a burst would now teach the wrong scene
+        self._learning = None
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        return True
+
+    def _schedule_refresh(self):
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        self._refresh_timer = self._buspro.loop.call_later(SCENE_REFRESH_DELAY_SECONDS, self._refresh)
+
+    def _refresh(self):
+        self._refresh_timer = None
+        learning = self._learning
+        self._learning = None
+        if self._last_status_at is not None and self._last_status_at >= self._last_scene_at:
+            # Not learned this time: the status that arrived was not read for the scene
+            self.reads_skipped += 1
+            return
+
+        self.reads_sent += 1
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Reading channel status of {self._device_address} after scene")
+        if learning is None:
+            self._call_read_current_status_of_channels()
+        else:
+            asyncio.ensure_future(self._read_and_learn(*learning), loop=self._buspro.loop)
+
+    async def _read_and_learn(self, area_number, scene_number):
+        """Read the module until two reads agree, then learn the levels for the scene."""
+        scene_at = self._last_scene_at
+        levels = await self._read_levels()
+        for _ in range(SCENE_SETTLE_READS):
+            if levels is None:
+                return
+            await asyncio.sleep(SCENE_SETTLE_SECONDS)
+            if self._last_scene_at != scene_at:
+                # Another scene ran meanwhile; its own read learns it
+                return
+            settled = await self._read_levels()
+            if settled == levels:
+                self._scene_table.learn(self._device_address, area_number, scene_number, levels)
+                return
+            levels = settled
+
+        self.scenes_unsettled += 1
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Scene {area_number}/{scene_number} of {self._device_address} did not settle, not learned")
+
+    async def _read_levels(self):
+        """Send a status read and return the channel levels of its response, None if unanswered."""
+        operate_code = OperateCode.ReadStatusOfChannelsResponse.value
+        network_interface = self._buspro.network_interface
+        if network_interface is None:
+            return None
+        response = self._buspro.expect_response(self._device_address, operate_code)
+        # Without the coalesce key: a channel's read queued later must not take this read's place
+        sent = await network_interface.send_telegram(_ReadStatusOfChannels(self._buspro, self._device_address).telegram)
+        sent_at = await sent if sent is not None else None
+        if sent_at is None:
+            self._buspro.discard_response(self._device_address, operate_code, response)
+            return None
+
+        deadline = sent_at + STATUS_RESPONSE_TIMEOUT
+        while True:
+            try:
+                telegram, received_at = await asyncio.wait_for(response, max(deadline - self._buspro.loop.time(), 0))
+            except asyncio.TimeoutError:
+                self._buspro.discard_response(self._device_address, operate_code, response)
+                return None
+            if received_at >= sent_at:
+                break
+            # Answered a read that went out before this one
+            response = self._buspro.expect_response(self._device_address, operate_code)
+
+        payload = telegram.payload
+        if not payload:
+            return None
+        return tuple(payload[1:payload[0] + 1])
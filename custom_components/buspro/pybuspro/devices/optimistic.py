@@ -0,0 +1,111 @@
+"""Optimistic channel level tracking with reconciliation against module responses."""
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for a module to confirm a commanded level before re-reading it
+PENDING_CONFIRMATION_SECONDS = 2.0
+
+
+def new_optimistic_stats():
+    """Return the counters shared by all OptimisticLevel instances of one bus."""
+    return {
+        "published": 0,   # levels published at command time
+        "confirmed": 0,   # module reported the published level
+        "corrected": 0,   # module reported a different level
+        "timed_out": 0,   # no confirmation within the window, status re-read
+        "reverted": 0,    # re-read went unanswered, last confirmed level restored
+    }
+
+
+class OptimisticLevel:
+    """Commanded level of one channel, pending until the module confirms it.
+
+    The device publishes the commanded level immediately. A control response settles it
+    (confirm or correct). Status responses only settle it when they agree with the pending
+    level, or once the window has expired and a re-read was requested, so a status read that
+    was already in flight cannot undo a fresh command. If the re-read is not answered either,
+    the last confirmed level is restored.
+    """
+
+    def __init__(self, loop, stats, reread_cb, revert_cb, timeout=PENDING_CONFIRMATION_SECONDS):
+        self._loop = loop
+        self._stats = stats
+        self._reread_cb = reread_cb
+        self._revert_cb = revert_cb
+        self._timeout = timeout
+        self._pending = None
+        self._confirmed = None
+        self._rereading = False
+        self._timer = None
+
+    @property
+    def pending(self):
+        return self._pending is not None
+
+    def start(self, level, confirmed_level, running_time_seconds=0):
+        """Mark level as published and pending confirmation.
+
+        A native ramp of running_time_seconds extends the window by its length, so a ramp whose
+        control response was lost is re-read once at its end rather than while it runs.
+        """
+        if self._pending is None:
+            self._confirmed = confirmed_level
+        self._pending = level
+        self._rereading = False
+        self._stats["published"] += 1
+        self._restart_timer(max(self._timeout, running_time_seconds + self._timeout))
+
+    def control_response(self, level):
+        """Settle the pending level with the level reported by a control response."""
+        if self._pending is not None:
+            self._settle(level)
+
+    def status_response(self, level):
+        """Return True if a status response may update the channel level."""
+        if self._pending is None:
+            self._confirmed = level
+            return True
+        if level == self._pending or self._rereading:
+            self._settle(level)
+            return True
+        return False
+
+    def _settle(self, level):
+        if level == self._pending:
+            self._stats["confirmed"] += 1
+        else:
+            self._stats["corrected"] += 1
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(f"Optimistic level {self._pending} corrected to {level}")
+        self._pending = None
+        self._confirmed = level
+        self._rereading = False
+        self._cancel_timer()
+
+    def _expired(self):
+        self._timer = None
+        if self._pending is None:
+            return
+        if not self._rereading:
+            self._stats["timed_out"] += 1
+            self._rereading = True
+            self._restart_timer()
+            self._reread_cb()
+            return
+
+        self._stats["reverted"] += 1
+        level = self._confirmed
+        self._pending = None
+        self._rereading = False
+        if level is not None:
+            self._revert_cb(level)
+
+    def _restart_timer(self, timeout=None):
+        self._cancel_timer()
+        self._timer = self._loop.call_later(self._timeout if timeout is None else timeout, self._expired)
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
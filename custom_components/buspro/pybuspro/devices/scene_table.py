@@ -0,0 +1,69 @@
+"""Learned channel levels of module scenes."""
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds after which a learned scene is verified with a status read the next time it runs
+SCENE_TABLE_MAX_AGE_SECONDS = 24 * 3600
+
+
+def _address_key(address):
+    return ".".join(str(part) for part in address)
+
+
+def _address_from_key(key):
+    return tuple(int(part) for part in key.split("."))
+
+
+class SceneTable:
+    """Channel levels each (module, area, scene) left behind when it was last observed.
+
+    Entries are learned from the status read that follows a scene and stamped with wall-clock
+    time so they survive restarts. on_change, if set, is called after every learn(), also when
+    the levels are unchanged, since the timestamp is renewed; load() does not call it. as_dict()
+    and load() convert to and from a JSON-friendly dict.
+    """
+
+    def __init__(self, max_age=SCENE_TABLE_MAX_AGE_SECONDS):
+        self._max_age = max_age
+        self._entries = {}
+        self.on_change = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, device_address, area_number, scene_number):
+        """Return (levels, fresh) for a scene, or None if it has not been learned."""
+        entry = self._entries.get((tuple(device_address), area_number, scene_number))
+        if entry is None:
+            return None
+        levels, learned_at = entry
+        return levels, time.time() - learned_at < self._max_age
+
+    def learn(self, device_address, area_number, scene_number, levels):
+        """Record the levels observed after a scene."""
+        key = (tuple(device_address), area_number, scene_number)
+        levels = tuple(levels)
+        previous = self._entries.get(key)
+        self._entries[key] = (levels, time.time())
+        if previous is not None and previous[0] != levels and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Scene {area_number}/{scene_number} of {key[0]} changed from {previous[0]} to {levels}")
+        if self.on_change is not None:
+            self.on_change()
+
+    def as_dict(self):
+        data = {}
+        for (device_address, area_number, scene_number), (levels, learned_at) in self._entries.items():
+            data.setdefault(_address_key(device_address), {})[f"{area_number}.{scene_number}"] = {
+                "levels": list(levels),
+                "learned_at": learned_at,
+            }
+        return data
+
+    def load(self, data):
+        for address_key, scenes in data.items():
+            device_address = _address_from_key(address_key)
+            for scene_key, entry in scenes.items():
+                area_number, scene_number = _address_from_key(scene_key)
+                self._entries[(device_address, area_number, scene_number)] = (tuple(entry["levels"]), entry["learned_at"])
@@ -3,19 +3,58 @@ import logging
 import struct
 from enum import Enum
 
-from .control import _Read12in1SensorStatus, _ReadCurrentStatus, _ReadElectricityStatus, _ReadPowerFactorStatus, _ReadPowerStatus, _ReadStatusOfUniversalSwitch, _ReadStatusOfChannels, _ReadFloorHeatingStatus, \
-    _ReadDryContactStatus, _ReadSensorsInOneStatus, _ReadTemperatureStatus, _ReadVoltageStatus
+from .control import _Read12in1SensorStatus, _ReadStatusOfUniversalSwitch, _ReadStatusOfChannels, _ReadFloorHeatingStatus, \
+    _ReadDryContactStatus, _ReadSensorsInOneStatus, _ReadTemperatureStatus
 from .device import Device
 from ..helpers.enums import *
 
 _LOGGER = logging.getLogger(__name__)
 
+# Precompiled unpackers for the multi-byte fields of sensor responses
+_FLOAT_LE = struct.Struct("<f")
+# success, temperature, brightness, motion, sonic, dry contact 1, dry contact 2
+_TWELVE_IN_ONE_STATUS = struct.Struct(">BBHBBBB")
+# temperature, brightness, humidity, motion, dry contact 1, dry contact 2
+_SENSORS_IN_ONE_STATUS = struct.Struct(">xBHBxxBBB")
+
+# Families whose status frame carries every value of the module, so one Sensor serves all sensor types.
+SHARED_FAMILIES = (DeviceFamily.TWELVE_IN_ONE, DeviceFamily.SENSORS_IN_ONE, DeviceFamily.DLP)
+# Sensor types read and decoded the same way whatever family the module is configured with
+FAMILY_INDEPENDENT_TYPES = (SensorType.SINGLE_CHANNEL, SensorType.UNIVERSAL_SWITCH)
+
+
+def get_shared_sensor(buspro, device_address, device_family=None, sensor_type=None, universal_switch_number=None,
+                      channel_number=None, switch_number=None):
+    """Return the Sensor shared by all entities reading the same values from one module.
+
+    Entities on the same (address, family) get a single Sensor, so the module has one telegram
+    callback, one initial status read and one decode per frame regardless of how many entities use it.
+    Relay channels and universal switches ignore the family, so a climate's relay and a
+    binary_sensor on the same channel share one Sensor whatever family the binary_sensor names.
+    """
+    device_address = tuple(device_address)
+    sensor_type = SensorType(sensor_type) if sensor_type is not None else None
+    if sensor_type in FAMILY_INDEPENDENT_TYPES:
+        # A family would also make the Sensor read the family's status instead of the channel's
+        device_family = None
+    device_family = DeviceFamily(device_family) if device_family is not None else None
+    key_type = None if device_family in SHARED_FAMILIES else sensor_type
+    key = ("sensor", device_address, device_family, key_type, channel_number, switch_number, universal_switch_number)
+
+    def factory():
+        return Sensor(buspro, device_address, device_family=device_family, sensor_type=sensor_type,
+                      universal_switch_number=universal_switch_number, channel_number=channel_number,
+                      switch_number=switch_number)
+
+    return buspro.get_shared_device(key, factory)
+
+
 class Sensor(Device):
-    def __init__(self, hass, device_address, device_family=None, sensor_type=None, universal_switch_number=None, channel_number=None, device=None,
+    def __init__(self, buspro, device_address, device_family=None, sensor_type=None, universal_switch_number=None, channel_number=None, device=None,
                  switch_number=None, name="", delay_read_current_state_seconds=0):
-        super().__init__(hass, device_address, name)
+        super().__init__(buspro, device_address, name)
 
-        self._hass = hass
+        self._buspro = buspro
         self._device_address = device_address
         self._sensor_type = SensorType(sensor_type) if sensor_type is not None else None
         self._device_family = DeviceFamily(device_family) if device_family is not None else None
@@ -35,235 +74,150 @@ class Sensor(Device):
         self._channel_status = 0
         self._switch_status = 0
 
-        # Add new properties for power measurement
-        self._current = None
-        self._voltage = None
-        self._active_power = None
-        self._reactive_power = None
-        self._apparent_power = None
-        self._power_factor = None
-        self._energy = None
-
         self.register_telegram_received_cb(self._telegram_received_cb)
         self._call_read_current_status_of_sensor(run_from_init=True)
 
     def _telegram_received_cb(self, telegram):
-        if telegram.operate_code in [OperateCode.Read12in1SensorStatusResponse,OperateCode.Broadcast12in1SensorStatusAutoResponse]:
-            success_or_fail = telegram.payload[0]
-            if success_or_fail == SuccessOrFailure.Success:
-                self._current_temperature = telegram.payload[1] - 20
-                self._brightness =  (telegram.payload[2] * 256) + telegram.payload[3]            
-                self._motion_sensor = telegram.payload[4]
-                self._sonic = telegram.payload[5]
-                self._dry_contact_1_status = telegram.payload[6]
-                self._dry_contact_2_status = telegram.payload[7]
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    _LOGGER.debug(f"12in1 sensor data received - temp:{self._current_temperature}, brightness:{self._brightness}, motion:{self._motion_sensor}, sonic:{self._sonic}, dc1:{self._dry_contact_1_status}, dc2:{self._dry_contact_2_status}")
-                self._call_device_updated()
-            else:
-                _LOGGER.error(f"12in1 sensor data failed to receive - {telegram.payload}")
+        handler = self._TELEGRAM_HANDLERS.get(telegram.operate_code)
+        if handler is not None:
+            handler(self, telegram)
+
+    def _handle_12in1_status(self, telegram):
+        payload = telegram.payload
+        if payload[0] == SuccessOrFailure.Success:
+            (_, temperature, self._brightness, self._motion_sensor, self._sonic,
+             self._dry_contact_1_status, self._dry_contact_2_status) = _TWELVE_IN_ONE_STATUS.unpack_from(bytes(payload))
+            self._current_temperature = temperature - 20
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 msg_type = "broadcast" if telegram.operate_code == OperateCode.Broadcast12in1SensorStatusAutoResponse else "data"
                 _LOGGER.debug(f"12in1 sensor {msg_type} received - temp:{self._current_temperature}, brightness:{self._brightness}, motion:{self._motion_sensor}, sonic:{self._sonic}, dc1:{self._dry_contact_1_status}, dc2:{self._dry_contact_2_status}")
+            self._call_device_updated()
+        else:
+            _LOGGER.error(f"12in1 sensor data failed to receive - {payload}")
+
+    def _handle_sensors_in_one_status(self, telegram):
+        (temperature, self._brightness, self._current_humidity, self._motion_sensor,
+         self._dry_contact_1_status, self._dry_contact_2_status) = _SENSORS_IN_ONE_STATUS.unpack_from(bytes(telegram.payload))
+        self._current_temperature = temperature - 20
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            msg_type = "broadcast" if telegram.operate_code == OperateCode.BroadcastSensorsInOneStatusResponse else "data"
+            _LOGGER.debug(f"Sensors-in-one {msg_type} received - temp:{self._current_temperature}, brightness:{self._brightness}, humidity:{self._current_humidity}, motion:{self._motion_sensor}, dc1:{self._dry_contact_1_status}, dc2:{self._dry_contact_2_status}")
+        self._call_device_updated()
+
+    def _handle_floor_heating_status(self, telegram):
+        self._current_temperature = telegram.payload[1]
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"Floor heating temperature received - temp:{self._current_temperature}")
+        self._call_device_updated()
+
+    def _handle_temperature(self, telegram):
+        payload = telegram.payload
+        if self._channel_number is None or self._channel_number != payload[0]:
+            return
+
+        self._current_temperature = payload[1]
+        if len(payload) >= 6 and any(payload[2:6]):
+            try:
+                float_temp = _FLOAT_LE.unpack_from(bytes(payload), 2)[0]
+                if -100 < float_temp < 100:
+                    self._current_temperature = float_temp
+            except (struct.error, ValueError):
+                pass
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            msg_type = "broadcast" if telegram.operate_code == OperateCode.BroadcastTemperatureResponse else "data"
+            _LOGGER.debug(f"Temperature {msg_type} received - temp: {self._current_temperature}")
+        self._call_device_updated()
+
+    def _handle_channel_status(self, telegram):
+        if self._sensor_type == SensorType.SINGLE_CHANNEL and self._channel_number is not None and self._channel_number <= telegram.payload[0]:
+            self._channel_status = telegram.payload[self._channel_number]
+            self._call_device_updated()
+
+    def _handle_single_channel_control(self, telegram):
+        if self._sensor_type == SensorType.SINGLE_CHANNEL and self._channel_number == telegram.payload[0]:
+            self._channel_status = telegram.payload[2]
+            self._call_device_updated()
 
-        # elif telegram.operate_code == OperateCode.Broadcast12in1SensorStatusAutoResponse:
-        #     self._current_temperature = telegram.payload[0] - 20
-        #     brightness_high = telegram.payload[1]
-        #     brightness_low = telegram.payload[2]
-        #     self._motion_sensor = telegram.payload[3]
-        #     self._sonic = telegram.payload[4]
-        #     self._dry_contact_1_status = telegram.payload[5]
-        #     self._dry_contact_2_status = telegram.payload[6]
-        #     self._brightness = brightness_high + brightness_low
-        #     _LOGGER.debug(f"12in1 broadcast data received - temp:{self._current_temperature}, brightness:{self._brightness}, motion:{self._motion_sensor}, sonic:{self._sonic}, dc1:{self._dry_contact_1_status}, dc2:{self._dry_contact_2_status}")       
-        #     self._call_device_updated()
-
-        elif telegram.operate_code in [OperateCode.ReadSensorsInOneStatusResponse,OperateCode.BroadcastSensorsInOneStatusResponse]:
-            self._current_temperature = telegram.payload[1] - 20
-            self._brightness = (telegram.payload[2] * 256) + telegram.payload[3]
-            self._current_humidity = telegram.payload[4]
-            self._motion_sensor = telegram.payload[7]
-            self._dry_contact_1_status = telegram.payload[8]
-            self._dry_contact_2_status = telegram.payload[9]
+    def _handle_universal_switch_status(self, telegram):
+        switch_number = telegram.payload[0]
+        if switch_number == self._universal_switch_number:
+            self._universal_switch_status = SwitchStatusOnOff(telegram.payload[1])
             if _LOGGER.isEnabledFor(logging.DEBUG):
-                msg_type = "broadcast" if telegram.operate_code == OperateCode.BroadcastSensorsInOneStatusResponse else "data"
-                _LOGGER.debug(f"Sensors-in-one {msg_type} received - temp:{self._current_temperature}, brightness:{self._brightness}, humidity:{self._current_humidity}, motion:{self._motion_sensor}, dc1:{self._dry_contact_1_status}, dc2:{self._dry_contact_2_status}")        
+                _LOGGER.debug(f"Universal switch status updated for switch {switch_number} - status:{self._universal_switch_status}")
             self._call_device_updated()
 
-        elif telegram.operate_code == OperateCode.DLPReadFloorHeatingStatusResponse:
-            self._current_temperature = telegram.payload[1]
+    def _handle_universal_switch_broadcast(self, telegram):
+        if self._universal_switch_number is not None and self._universal_switch_number <= telegram.payload[0]:
+            self._universal_switch_status = SwitchStatusOnOff(telegram.payload[self._universal_switch_number])
             if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Floor heating temperature received - temp:{self._current_temperature}")        
+                _LOGGER.debug(f"Universal switch broadcast received for switch {self._universal_switch_number} - status:{self._universal_switch_status}")
             self._call_device_updated()
 
-        elif telegram.operate_code in [OperateCode.BroadcastTemperatureResponse, OperateCode.ReadTemperatureStatusResponse]:
-            if self._channel_number is not None and self._channel_number == telegram.payload[0]:
-                self._current_temperature = telegram.payload[1]
-                
-                if len(telegram.payload) >= 6:
-                    if not all(b == 0 for b in telegram.payload[2:6]):
-                        try:
-                            float_bytes = bytes(telegram.payload[2:6])
-                            float_temp = struct.unpack("<f", float_bytes)[0]
-                            
-                            if -100 < float_temp < 100:
-                                self._current_temperature = float_temp                                
-
-                        except (struct.error, ValueError, IndexError) as e:
-                            pass
-                
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    msg_type = "broadcast" if telegram.operate_code == OperateCode.BroadcastTemperatureResponse else "data"
-                    _LOGGER.debug(f"Temperature {msg_type} received - temp: {self._current_temperature}")
-                self._call_device_updated()
-
-        elif telegram.operate_code in [OperateCode.ReadStatusOfUniversalSwitchResponse, OperateCode.UniversalSwitchControlResponse]:
-            switch_number = telegram.payload[0]
-            status_enum = SwitchStatusOnOff(telegram.payload[1])
-            if switch_number == self._universal_switch_number:
-                self._universal_switch_status = status_enum
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    _LOGGER.debug(f"Universal switch status updated for switch {switch_number} - status:{status_enum}")
-                self._call_device_updated()
-
-        elif telegram.operate_code == OperateCode.BroadcastStatusOfUniversalSwitch:
-            if self._universal_switch_number is not None and self._universal_switch_number <= telegram.payload[0]:
-                self._universal_switch_status = SwitchStatusOnOff(telegram.payload[self._universal_switch_number])                
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    _LOGGER.debug(f"Universal switch broadcast received for switch {self._universal_switch_number} - status:{self._universal_switch_status}")
-                self._call_device_updated()
-
-        elif telegram.operate_code in [OperateCode.ReadDryContactStatusResponse, OperateCode.ReadDryContactBroadcastStatusResponse]:
-            if self._switch_number == telegram.payload[1]:
-                self._switch_status = telegram.payload[2]
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    msg_type = "broadcast" if telegram.operate_code == OperateCode.ReadDryContactBroadcastStatusResponse else "data"
-                    _LOGGER.debug(f"Dry contact {msg_type} received for switch {self._switch_number} - status:{self._switch_status}")            
-                self._call_device_updated()            
-        
-        elif telegram.operate_code == OperateCode.ReadVoltageResponse:
-            if self._channel_number is not None and 1 <= self._channel_number <= 3:
-                offset = (self._channel_number - 1) * 4
-                self._voltage = round((telegram.payload[offset] * 10.0) + (telegram.payload[offset + 1] ) + (telegram.payload[offset + 2] / 10.0) + (telegram.payload[offset + 3] / 100.0),2)                
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    _LOGGER.debug(f"Voltage received for device {self._device_address} channel {self._channel_number} - voltage:{self._voltage}")
-                self._call_device_updated()
-
-        elif telegram.operate_code == OperateCode.ReadCurrentResponse:
-            if self._channel_number is not None and 1 <= self._channel_number <= 3:
-                offset = (self._channel_number - 1) * 4
-                self._current = round((telegram.payload[offset] * 10.0) + (telegram.payload[offset + 1] ) + (telegram.payload[offset + 2] / 10.0) + (telegram.payload[offset + 3] / 100.0),2)                
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    _LOGGER.debug(f"Current received for device {self._device_address} channel {self._channel_number} - current:{self._current}")
-                self._call_device_updated()
-
-        elif telegram.operate_code == OperateCode.ReadPowerStatusResponse:
-            if self._channel_number is not None and 1 <= self._channel_number <= 4:
-                offset = (self._channel_number - 1) * 2                
-                self._active_power = (telegram.payload[offset] * 256) + telegram.payload[offset + 1]
-                
-                offset += 8
-                self._reactive_power = (telegram.payload[offset] * 256) + telegram.payload[offset + 1]
-                
-                offset += 8
-                self._apparent_power = (telegram.payload[offset] * 256) + telegram.payload[offset + 1]
-                
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    phase = "total" if self._channel_number == 4 else f"phase {self._channel_number}"
-                    _LOGGER.debug(f"Power received for device {self._device_address} {phase}:"
-                                 f" active:{self._active_power}W,"
-                                 f" reactive:{self._reactive_power}VAr,"
-                                 f" apparent:{self._apparent_power}VA")
-                self._call_device_updated()
-
-        elif telegram.operate_code == OperateCode.ReadPowerFactorStatusResponse:
-            if self._channel_number is not None and 1 <= self._channel_number <= 3:
-                offset = (self._channel_number - 1) * 4
-                self._power_factor = round((telegram.payload[offset] * 10.0) + (telegram.payload[offset + 1] ) + (telegram.payload[offset + 2] / 10.0) + (telegram.payload[offset + 3] / 100.0),2)                
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    _LOGGER.debug(f"Power factor received for device {self._device_address} channel {self._channel_number} - power factor:{self._power_factor }")
-                self._call_device_updated()
-
-        elif telegram.operate_code == OperateCode.ReadElectricityStatusResponse:
-            if self._channel_number is not None and 1 <= self._channel_number <= 4:
-                offset = (self._channel_number - 1) * 2
-                self._energy = (telegram.payload[offset] * 256) + telegram.payload[offset + 1]
-                if _LOGGER.isEnabledFor(logging.DEBUG):
-                    _LOGGER.debug(f"Energy received for device {self._device_address} channel {self._channel_number} - energy:{self._energy}")
-                self._call_device_updated()
+    def _handle_dry_contact(self, telegram):
+        if self._switch_number == telegram.payload[1]:
+            self._switch_status = telegram.payload[2]
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                msg_type = "broadcast" if telegram.operate_code == OperateCode.ReadDryContactBroadcastStatusResponse else "data"
+                _LOGGER.debug(f"Dry contact {msg_type} received for switch {self._switch_number} - status:{self._switch_status}")
+            self._call_device_updated()
 
+    _TELEGRAM_HANDLERS = {
+        OperateCode.Read12in1SensorStatusResponse: _handle_12in1_status,
+        OperateCode.Broadcast12in1SensorStatusAutoResponse: _handle_12in1_status,
+        OperateCode.ReadSensorsInOneStatusResponse: _handle_sensors_in_one_status,
+        OperateCode.BroadcastSensorsInOneStatusResponse: _handle_sensors_in_one_status,
+        OperateCode.DLPReadFloorHeatingStatusResponse: _handle_floor_heating_status,
+        OperateCode.BroadcastTemperatureResponse: _handle_temperature,
+        OperateCode.ReadTemperatureStatusResponse: _handle_temperature,
+        OperateCode.ReadStatusOfChannelsResponse: _handle_channel_status,
+        OperateCode.SingleChannelControlResponse: _handle_single_channel_control,
+        OperateCode.ReadStatusOfUniversalSwitchResponse: _handle_universal_switch_status,
+        OperateCode.UniversalSwitchControlResponse: _handle_universal_switch_status,
+        OperateCode.BroadcastStatusOfUniversalSwitch: _handle_universal_switch_broadcast,
+        OperateCode.ReadDryContactStatusResponse: _handle_dry_contact,
+        OperateCode.ReadDryContactBroadcastStatusResponse: _handle_dry_contact,
+    }
 
     async def read_sensor_status(self):
         if self._device_family is not None and self._device_family == DeviceFamily.DLP:
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(f"Reading DLP floor heating status for device {self._device_address}")
-            rfhs = _ReadFloorHeatingStatus(self._hass, self._device_address)            
+            rfhs = _ReadFloorHeatingStatus(self._buspro, self._device_address)            
             await rfhs.send()
         elif self._device_family is not None and self._device_family == DeviceFamily.SENSORS_IN_ONE:
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(f"Reading sensors-in-one status for device {self._device_address}")
-            rsios = _ReadSensorsInOneStatus(self._hass, self._device_address)            
+            rsios = _ReadSensorsInOneStatus(self._buspro, self._device_address)            
             await rsios.send()
         elif self._device_family is not None and self._device_family == DeviceFamily.TWELVE_IN_ONE:
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(f"Reading 12-in-1 sensor status for device {self._device_address}")
-            rsios = _Read12in1SensorStatus(self._hass, self._device_address)
+            rsios = _Read12in1SensorStatus(self._buspro, self._device_address)
             await rsios.send()            
         elif self._sensor_type is not None and self._sensor_type == SensorType.DRY_CONTACT:
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(f"Reading dry contact status for device {self._device_address}, switch {self._switch_number}")
-            rdcs = _ReadDryContactStatus(self._hass, self._device_address)            
+            rdcs = _ReadDryContactStatus(self._buspro, self._device_address)            
             rdcs.switch_number = self._switch_number
             await rdcs.send()
         elif self._universal_switch_number is not None:
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(f"Reading universal switch status for device {self._device_address}, switch {self._universal_switch_number}")
-            rsous = _ReadStatusOfUniversalSwitch(self._hass, self._device_address)            
+            rsous = _ReadStatusOfUniversalSwitch(self._buspro, self._device_address)            
             rsous.switch_number = self._universal_switch_number
             await rsous.send()
         elif self._sensor_type is not None and self._sensor_type == SensorType.TEMPERATURE:
             channel = self._channel_number if self._channel_number is not None else 1
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(f"Reading temperature status for device {self._device_address}, channel {channel}")
-            rts = _ReadTemperatureStatus(self._hass, self._device_address)            
+            rts = _ReadTemperatureStatus(self._buspro, self._device_address)            
             rts.channel_number = channel
             await rts.send()
-        elif self._sensor_type is not None and self._sensor_type == SensorType.VOLTAGE and self._channel_number is not None:            
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading voltage status for device {self._device_address}, channel {self._channel_number}")
-            rps = _ReadVoltageStatus(self._hass, self._device_address)                        
-            rps.channel_number = self._channel_number
-            await rps.send()
-        elif self._sensor_type is not None and self._sensor_type == SensorType.CURRENT and self._channel_number is not None:            
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading current status for device {self._device_address}, channel {self._channel_number}")
-            rps = _ReadCurrentStatus(self._hass, self._device_address)                        
-            rps.channel_number = self._channel_number
-            await rps.send()
-        elif self._sensor_type is not None and self._sensor_type == SensorType.ACTIVE_POWER and self._channel_number is not None:            
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading voltage status for device {self._device_address}, channel {self._channel_number}")
-            rps = _ReadPowerStatus(self._hass, self._device_address)                        
-            rps.channel_number = self._channel_number
-            await rps.send()
-        elif self._sensor_type is not None and self._sensor_type == SensorType.POWER_FACTOR and self._channel_number is not None:            
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading voltage status for device {self._device_address}, channel {self._channel_number}")
-            rpfs = _ReadPowerFactorStatus(self._hass, self._device_address)                        
-            rpfs.channel_number = self._channel_number
-            await rpfs.send()
-        elif self._sensor_type is not None and self._sensor_type == SensorType.ENERGY and self._channel_number is not None:            
-            if _LOGGER.isEnabledFor(logging.DEBUG):
-                _LOGGER.debug(f"Reading voltage status for device {self._device_address}, channel {self._channel_number}")
-            res = _ReadElectricityStatus(self._hass, self._device_address)                        
-            res.channel_number = self._channel_number
-            await res.send()
-
-
         elif self._sensor_type is not None and self._channel_number is not None:
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(f"Reading channel status for device {self._device_address}")
-            rsoc = _ReadStatusOfChannels(self._hass, self._device_address)            
+            rsoc = _ReadStatusOfChannels(self._buspro, self._device_address)            
             await rsoc.send()
 
 
@@ -284,11 +238,11 @@ class Sensor(Device):
 
     @property
     def movement(self):
-        if self._sensor_type is None:
-            return None
-        if self._sensor_type == SensorType.SONIC:
-            return self._sonic
-        return self._motion_sensor        
+        return self._motion_sensor
+
+    @property
+    def sonic(self):
+        return self._sonic
 
     @property
     def dry_contact_1_is_on(self):
@@ -330,4 +284,4 @@ class Sensor(Device):
                 await asyncio.sleep(5)
             await self.read_sensor_status()
 
-        asyncio.ensure_future(read_current_status_of_sensor(), loop=self._hass.loop)
+        asyncio.ensure_future(read_current_status_of_sensor(), loop=self._buspro.loop)
@@ -1,18 +1,28 @@
 from .control import _SingleChannelControl, _ReadStatusOfSwitch
 from .device import Device
+from .module_status import get_module_status
+from .optimistic import OptimisticLevel
 from ..helpers.enums import *
 from ..helpers.generics import Generics
 
 
 class Switch(Device):
-    def __init__(self, hass, device_address, channel_number, name="", delay_read_current_state_seconds=0):
-        super().__init__(hass, device_address, name)
+    def __init__(self, buspro, device_address, channel_number, name="", delay_read_current_state_seconds=0):
+        super().__init__(buspro, device_address, name)
         # device_address = (subnet_id, device_id, channel_number)
 
-        self._hass = hass
+        self._buspro = buspro
         self._device_address = device_address
         self._channel_number = channel_number
         self._brightness = 0
+        self._optimistic = OptimisticLevel(
+            self._buspro.loop,
+            self._buspro.optimistic_stats,
+            self._call_read_current_status_of_channels,
+            self._revert_level,
+        )
+        # Scene responses are answered by one debounced status read per module
+        get_module_status(buspro, device_address)
         self.register_telegram_received_cb(self._telegram_received_cb)
         self._call_read_current_status_of_channels(run_from_init=True)
 
@@ -22,14 +32,16 @@ class Switch(Device):
             # success = telegram.payload[1]
             brightness = telegram.payload[2]
             if channel == self._channel_number:
+                self._optimistic.control_response(brightness)
                 self._brightness = brightness
                 self._call_device_updated()
         elif telegram.operate_code == OperateCode.ReadStatusOfChannelsResponse:
             if self._channel_number <= telegram.payload[0]:
-                self._brightness = telegram.payload[self._channel_number]
+                brightness = telegram.payload[self._channel_number]
+                if not self._optimistic.status_response(brightness):
+                    return
+                self._brightness = brightness
                 self._call_device_updated()
-        elif telegram.operate_code == OperateCode.SceneControlResponse:
-            self._call_read_current_status_of_channels()
 
     async def set_on(self):
         intensity = 100
@@ -40,7 +52,7 @@ class Switch(Device):
         await self._set(intensity, 0)
 
     async def read_status(self):
-        rsos = _ReadStatusOfSwitch(self._hass, self._device_address)        
+        rsos = _ReadStatusOfSwitch(self._buspro, self._device_address)        
         await rsos.send()
 
     @property
@@ -55,14 +67,20 @@ class Switch(Device):
             return True
 
     async def _set(self, intensity, running_time_seconds):
+        self._optimistic.start(intensity, self._brightness)
         self._brightness = intensity
+        self._call_device_updated()
 
         generics = Generics()
         (minutes, seconds) = generics.calculate_minutes_seconds(running_time_seconds)
 
-        scc = _SingleChannelControl(self._hass, self._device_address)        
+        scc = _SingleChannelControl(self._buspro, self._device_address)        
         scc.channel_number = self._channel_number
         scc.channel_level = intensity
         scc.running_time_minutes = minutes
         scc.running_time_seconds = seconds
         await scc.send()
+
+    def _revert_level(self, level):
+        self._brightness = level
+        self._call_device_updated()
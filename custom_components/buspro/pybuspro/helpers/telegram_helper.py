@@ -3,7 +3,7 @@ from struct import *
 
 import crcmod
 
-from .enums import DeviceType
+from .enums import DeviceType, OperateCode
 from .generics import Generics
 from ..core.telegram import Telegram
 from ..devices.control import *
@@ -21,9 +21,10 @@ class TelegramHelper:
     CONTENT_LENGTH_OFFSET = 11
     HDL_HEADER = b'\xC0\xA8\x01\x0FHDLMIRACLE\xAA\xAA'
     
-    def __init__(self):
-        """Initialize the telegram helper."""
+    def __init__(self, metrics=None):
+        """Initialize the telegram helper; failed decodes are counted in metrics if given."""
         self.crc16func = crcmod.mkCrcFun(0x11021, initCrc=0, rev=False, xorOut=0)
+        self._metrics = metrics
 
     def build_telegram_from_udp_data(self, data, address):
         """Build telegram from UDP data."""
@@ -63,12 +64,17 @@ class TelegramHelper:
 
             # Validate CRC
             if not self._check_crc(telegram):
-                _LOGGER.error("CRC check failed")
+                if self._metrics is not None:
+                    self._metrics.crc_failures += 1
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(f"CRC check failed: {bytes(data).hex()}")
                 return None
 
             return telegram
             
         except Exception as e:
+            if self._metrics is not None:
+                self._metrics.dropped_frames += 1
             _LOGGER.error(f"Error building telegram: {traceback.format_exc()}")
             return None
 
@@ -107,7 +113,9 @@ class TelegramHelper:
         send_buf[19:21] = b'\xFF\xFC'
         
         # Insert operate code
-        operate_code_hex = telegram.operate_code.value
+        # Generic messages may carry an operate code that is not in OperateCode as raw bytes
+        operate_code = telegram.operate_code
+        operate_code_hex = operate_code.value if isinstance(operate_code, OperateCode) else operate_code
         send_buf[21:23] = bytes(operate_code_hex)
         
         # Insert target address
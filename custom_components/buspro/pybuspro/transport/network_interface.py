@@ -1,28 +1,78 @@
 import logging
 
-from custom_components.buspro.const import DATA_BUSPRO
 from .udp_client import UDPClient
+from .threaded_udp_client import ThreadedUDPClient
+from .send_queue import SendQueue
+from ..core.frame_log import DIRECTION_RX, DIRECTION_TX
 from ..helpers.telegram_helper import TelegramHelper
 # from ..devices.control import Control
 import time
 #_LOGGER = logging.getLogger(__name__)
 
+# Default of _udp_request_received's telegram: the frame has not been decoded yet
+_NOT_DECODED = object()
+
 class NetworkInterface:
-    def __init__(self, hass, gateway_address_send_receive):
-        self._hass = hass
+    def __init__(self, gateway_address_send_receive, loop, metrics=None, latency=None, utilisation=None, frame_log=None, logger=None,
+                 io_thread=False):
+        self._loop = loop
+        self._io_thread = io_thread
+        self._logger = logger or logging.getLogger("buspro.log")
+        self._metrics = metrics
+        self._latency = latency
+        self._utilisation = utilisation
+        self._frame_log = frame_log
         self.gateway_address_send_receive = gateway_address_send_receive
         self.udp_client = None
         self.callback = None
         self._init_udp_client()
-        self._th = TelegramHelper()
+        self._th = TelegramHelper(metrics)
+        self.send_queue = SendQueue(self._send_message, loop)
+        self.send_queue.utilisation = utilisation
 
     def _init_udp_client(self):
-        self.udp_client = UDPClient(self._hass, self.gateway_address_send_receive, self._udp_request_received)
+        if self._io_thread:
+            # The I/O thread decodes with a helper of its own; only its failure and drop counters touch metrics
+            self.udp_client = ThreadedUDPClient(self.gateway_address_send_receive, self._udp_batch_received, self._loop,
+                                                TelegramHelper(self._metrics).build_telegram_from_udp_data, self._logger,
+                                                metrics=self._metrics)
+        else:
+            self.udp_client = UDPClient(self.gateway_address_send_receive, self._udp_request_received, self._logger)
+
+    def _udp_batch_received(self, batch):
+        """Handle (data, address, telegram) frames already decoded by the I/O thread."""
+        received = self._udp_request_received
+        for data, address, telegram in batch:
+            received(data, address, telegram)
+
+    def _udp_request_received(self, data, address, telegram=_NOT_DECODED):
+        if self.callback is None:
+            return
+        if self._frame_log is not None:
+            self._frame_log.record(DIRECTION_RX, data)
+        if self._utilisation is not None:
+            self._utilisation.add_frame(len(data))
+        metrics = self._metrics
+        if metrics is not None:
+            metrics.frames_received += 1
+            metrics.bytes_received += len(data)
 
-    def _udp_request_received(self, data, address):
-        if self.callback is not None:
+        if telegram is _NOT_DECODED:
             telegram = self._th.build_telegram_from_udp_data(data, address)
+        if telegram is None:
+            return
+        if metrics is None:
             self.callback(telegram)
+            return
+
+        operate_code = (data[21] << 8) | data[22]
+        if self._latency is not None:
+            self._latency.response_received(telegram.source_address, operate_code)
+        if telegram.operate_code is None:
+            metrics.unknown_opcodes += 1
+        started = time.perf_counter()
+        self.callback(telegram)
+        metrics.record_received(operate_code, telegram.source_address, time.perf_counter() - started)
 
     """
     public methods
@@ -32,22 +82,58 @@ class NetworkInterface:
 
     async def start(self):
         await self.udp_client.start()
+        self.send_queue.start()
 
     async def stop(self):
+        await self.send_queue.stop()
         if self.udp_client is not None:
             await self.udp_client.stop()
             self.udp_client = None
 
-    async def send_telegram(self, telegram):
-        #start_time = time.perf_counter_ns()
+    async def send_telegram(self, telegram, coalesce_key=None):
+        """Queue a telegram for paced sending and return a future resolved when it is on the wire.
+
+        A queued telegram with the same coalesce_key is replaced by this one.
+        """
         message = self._th.build_send_buffer(telegram)
-        #end_time = time.perf_counter_ns()
-        #duration = end_time - start_time
-        #_LOGGER.debug(f"Time to build send buffer: {duration} ns")
-        gateway_address_send, _ = self.gateway_address_send_receive
-        await self.udp_client.send_message(message)
-
-        
-        if self._hass.data[DATA_BUSPRO].hdl.logger.level == logging.DEBUG:
-            self._hass.data[DATA_BUSPRO].hdl.logger.debug(self._th.build_telegram_from_udp_data(message, gateway_address_send))
-            
+        if message is None:
+            return None
+        future = self.send_queue.enqueue(message, coalesce_key)
+
+        if self._logger.level == logging.DEBUG:
+            gateway_address_send, _ = self.gateway_address_send_receive
+            self._logger.debug(self._th.build_telegram_from_udp_data(message, gateway_address_send))
+        return future
+
+    async def send_telegrams(self, telegrams, coalesce_keys=None):
+        """Encode telegrams up front and queue them back-to-back as one batch.
+
+        Returns one future per telegram, in order, as send_telegram does; None for a telegram
+        that could not be encoded.
+        """
+        if coalesce_keys is None:
+            coalesce_keys = [None] * len(telegrams)
+        entries = []
+        positions = []
+        for position, (telegram, coalesce_key) in enumerate(zip(telegrams, coalesce_keys)):
+            message = self._th.build_send_buffer(telegram)
+            if message is not None:
+                entries.append((message, coalesce_key))
+                positions.append(position)
+
+        futures = [None] * len(telegrams)
+        for position, future in zip(positions, self.send_queue.enqueue_batch(entries)):
+            futures[position] = future
+        return futures
+
+    async def _send_message(self, message):
+        if self.udp_client is not None:
+            await self.udp_client.send_message(message)
+            if self._metrics is not None:
+                self._metrics.record_sent(len(message))
+            if self._frame_log is not None:
+                self._frame_log.record(DIRECTION_TX, message)
+            if self._utilisation is not None:
+                self._utilisation.add_frame(len(message))
+            if self._latency is not None:
+                self._latency.request_sent((message[23], message[24]), (message[21] << 8) | message[22])
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+from collections import deque
+
+_LOGGER = logging.getLogger(__name__)
+
+# The HDL bus runs at 9600 baud with 10 bits per byte (start, 8 data, stop)
+BUS_BAUD_RATE = 9600
+BUS_BITS_PER_BYTE = 10
+# Of the 16 byte UDP header only the 0xAAAA lead-in is sent on the bus
+UDP_HEADER_LENGTH = 14
+
+
+def bus_frame_seconds(udp_frame_length):
+    """Return the time a UDP frame occupies the 9600 baud bus once the gateway forwards it."""
+    return max(udp_frame_length - UDP_HEADER_LENGTH, 0) * BUS_BITS_PER_BYTE / BUS_BAUD_RATE
+
+
+class SendQueue:
+    """Paced FIFO of outgoing frames.
+
+    Frames leave no faster than the bus can carry them. A frame queued with a coalesce key
+    replaces a queued frame with the same key in place (latest wins), so only the newest
+    value for that key reaches the wire and the queue stays bounded under bursts.
+
+    enqueue() returns a future resolved with the loop time the frame was written, or None
+    if the frame was superseded before it was sent.
+    """
+
+    def __init__(self, send_cb, loop=None):
+        self._send_cb = send_cb
+        self._loop = loop or asyncio.get_event_loop()
+        self._queue = deque()
+        self._keyed = {}
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.sent = 0
+        self.coalesced = 0
+        self.backoffs = 0
+        # Optional BusUtilisation, and the occupancy (percent, last second) at or above which the
+        # gap after each frame is doubled; None never backs off
+        self.utilisation = None
+        self.backoff_occupancy = None
+
+    def __len__(self):
+        return len(self._queue)
+
+    def start(self):
+        if self._task is None:
+            self._task = self._loop.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._queue:
+            _, _, future = self._queue.popleft()
+            if not future.done():
+                future.set_result(None)
+        self._keyed.clear()
+
+    def enqueue(self, message, coalesce_key=None):
+        future = self._loop.create_future()
+        if coalesce_key is not None:
+            entry = self._keyed.get(coalesce_key)
+            if entry is not None:
+                # Replace the queued frame, keeping its place in the queue
+                superseded = entry[2]
+                entry[1] = message
+                entry[2] = future
+                if not superseded.done():
+                    superseded.set_result(None)
+                self.coalesced += 1
+                return future
+
+        entry = [coalesce_key, message, future]
+        if coalesce_key is not None:
+            self._keyed[coalesce_key] = entry
+        self._queue.append(entry)
+        self._wakeup.set()
+        return future
+
+    def enqueue_batch(self, entries):
+        """Queue (message, coalesce_key) pairs back-to-back and return their futures in order."""
+        return [self.enqueue(message, coalesce_key) for message, coalesce_key in entries]
+
+    async def _run(self):
+        while True:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            coalesce_key, message, future = self._queue.popleft()
+            if coalesce_key is not None:
+                del self._keyed[coalesce_key]
+
+            try:
+                await self._send_cb(message)
+                self.sent += 1
+                if not future.done():
+                    future.set_result(self._loop.time())
+            except Exception as e:
+                _LOGGER.error(f"Error sending queued frame: {e}")
+                if not future.done():
+                    future.set_result(None)
+
+            gap = bus_frame_seconds(len(message))
+            if (self.backoff_occupancy is not None and self.utilisation is not None
+                    and self.utilisation.occupancy(1) >= self.backoff_occupancy):
+                self.backoffs += 1
+                gap *= 2
+            await asyncio.sleep(gap)
@@ -0,0 +1,151 @@
+"""UDP client that receives and decodes on a dedicated I/O thread."""
+import logging
+import select
+import socket
+import threading
+import time
+from collections import deque
+
+from .udp_client import UDPClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Frames read from the socket per batch at most
+DEFAULT_BATCH_SIZE = 256
+# Batches waiting for the event loop before the oldest are dropped
+MAX_PENDING_BATCHES = 1000
+# Minimum seconds between two warnings about dropped batches
+DROP_WARNING_INTERVAL = 60.0
+
+
+class ThreadedUDPClient(UDPClient):
+    """Receive on a thread that owns the socket, drains it in batches and decodes every frame.
+
+    Each batch is a list of (data, address, telegram) handed to the event loop in one
+    call_soon_threadsafe; while the loop has not picked up earlier batches, new ones join them
+    without another wakeup. The loop only runs batch_callback, so CRC checks and decoding no
+    longer take loop time. Sending stays on the loop and writes to the same socket, which the
+    kernel allows from any thread.
+
+    decode(data, address) runs on the I/O thread and must not touch loop state. Frames of batches
+    dropped because the loop fell MAX_PENDING_BATCHES behind are added to metrics.dropped_frames,
+    also from the I/O thread.
+    """
+
+    def __init__(self, gateway_address_send_receive, batch_callback, loop, decode, logger=None, batch_size=DEFAULT_BATCH_SIZE,
+                 metrics=None):
+        super().__init__(gateway_address_send_receive, batch_callback, logger)
+        self._loop = loop
+        self._decode = decode
+        self._batch_size = batch_size
+        self._metrics = metrics
+        self._sock = None
+        self._thread = None
+        self._wakeup_receive = None
+        self._wakeup_send = None
+        self._stopping = False
+        self._pending = deque()
+        self._scheduled = False
+        self.batches = 0
+        self.dropped_batches = 0
+        self._drop_warned_at = None
+
+    async def _connect(self):
+        sock = self._create_broadcast_sock()
+        if sock is None:
+            _LOGGER.warning("Socket is None")
+            return
+        self._sock = sock
+        self._wakeup_receive, self._wakeup_send = socket.socketpair()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="buspro_io", daemon=True)
+        self._thread.start()
+
+    async def stop(self):
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._wakeup_send.send(b"\0")
+        await self._loop.run_in_executor(None, self._thread.join)
+        self._thread = None
+        for sock in (self._sock, self._wakeup_receive, self._wakeup_send):
+            sock.close()
+        self._sock = self._wakeup_receive = self._wakeup_send = None
+
+    async def send_message(self, message):
+        if self._sock is not None:
+            try:
+                self._sock.sendto(message, self._gateway_address_send)
+            except OSError as e:
+                self._logger.warning('Error sending: %s', e)
+                return
+            if self._recorder is not None:
+                self._recorder.record_tx(message, self._gateway_address_send)
+        else:
+            self._logger.info("Could not send message. Socket is None.")
+
+    # I/O thread
+
+    def _run(self):
+        sock = self._sock
+        readers = [sock, self._wakeup_receive]
+        decode = self._decode
+        batch_size = self._batch_size
+        while not self._stopping:
+            try:
+                readable, _, _ = select.select(readers, [], [])
+            except (OSError, ValueError) as e:
+                self._logger.warning('Error received: %s', e)
+                return
+            if sock not in readable:
+                continue
+            batch = []
+            while len(batch) < batch_size:
+                try:
+                    data, address = sock.recvfrom(2048)
+                except BlockingIOError:
+                    break
+                except OSError as e:
+                    self._logger.warning('Error received: %s', e)
+                    break
+                batch.append((data, address, decode(data, address)))
+            if batch:
+                self._hand_over(batch)
+
+    def _hand_over(self, batch):
+        pending = self._pending
+        if len(pending) >= MAX_PENDING_BATCHES:
+            self._drop(pending.popleft())
+        pending.append(batch)
+        if not self._scheduled:
+            self._scheduled = True
+            try:
+                self._loop.call_soon_threadsafe(self._deliver)
+            except RuntimeError:
+                # The loop is closed; nothing will read the batches any more
+                self._stopping = True
+
+    def _drop(self, batch):
+        self.dropped_batches += 1
+        if self._metrics is not None:
+            self._metrics.dropped_frames += len(batch)
+        now = time.monotonic()
+        if self._drop_warned_at is None or now - self._drop_warned_at >= DROP_WARNING_INTERVAL:
+            self._drop_warned_at = now
+            self._logger.warning('Event loop is %d batches behind the I/O thread; %d batches dropped so far',
+                                 MAX_PENDING_BATCHES, self.dropped_batches)
+
+    # Event loop
+
+    def _deliver(self):
+        # Cleared before taking the batches, so a batch added after this sees it and schedules again
+        self._scheduled = False
+        pending = self._pending
+        recorder = self._recorder
+        while pending:
+            batch = pending.popleft()
+            self.batches += 1
+            if recorder is not None:
+                for data, address, _ in batch:
+                    recorder.record_rx(data, address)
+            self.callback(batch)
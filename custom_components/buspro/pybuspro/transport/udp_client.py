@@ -1,8 +1,6 @@
 import asyncio
 import socket
 import logging
-from custom_components.buspro.const import DATA_BUSPRO
-
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -10,29 +8,45 @@ class UDPClient:
 
     class UDPClientFactory(asyncio.DatagramProtocol):
 
-        def __init__(self, hass, data_received_callback=None):
-            self.hass = hass  # Přejmenované pro konzistenci
+        def __init__(self, logger, data_received_callback=None):
+            self.logger = logger
             self.transport = None
             self.data_received_callback = data_received_callback
+            self.recorder = None
 
         def connection_made(self, transport):
             self.transport = transport
 
         def datagram_received(self, data, address):
+            if self.recorder is not None:
+                self.recorder.record_rx(data, address)
             if self.data_received_callback is not None:
                 self.data_received_callback(data, address)
 
         def error_received(self, exc):
-            self.hass.data[DATA_BUSPRO].hdl.logger.warning('Error received: %s', exc)
+            self.logger.warning('Error received: %s', exc)
 
         def connection_lost(self, exc):
-            self.hass.data[DATA_BUSPRO].hdl.logger.info('closing transport %s', exc)
+            self.logger.info('closing transport %s', exc)
 
-    def __init__(self, hass, gateway_address_send_receive, callback):
-        self._hass = hass
+    def __init__(self, gateway_address_send_receive, callback, logger=None):
+        self._logger = logger or _LOGGER
         self._gateway_address_send, self._gateway_address_receive = gateway_address_send_receive
         self.callback = callback
         self.transport = None
+        self._factory = None
+        self._recorder = None
+
+    @property
+    def recorder(self):
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder):
+        """Set the CaptureRecorder that receives every frame sent and received, None to stop."""
+        self._recorder = recorder
+        if self._factory is not None:
+            self._factory.recorder = recorder
 
     def _data_received_callback(self, data, address):
         self.callback(data, address)
@@ -52,9 +66,11 @@ class UDPClient:
     async def _connect(self):
         try:
             udp_client_factory = UDPClient.UDPClientFactory(
-                self._hass,
+                self._logger,
                 data_received_callback=self._data_received_callback
             )
+            udp_client_factory.recorder = self._recorder
+            self._factory = udp_client_factory
 
             sock = self._create_broadcast_sock()
             if sock is None:
@@ -82,5 +98,7 @@ class UDPClient:
     async def send_message(self, message):
         if self.transport is not None:
             self.transport.sendto(message, self._gateway_address_send)
+            if self._recorder is not None:
+                self._recorder.record_tx(message, self._gateway_address_send)
         else:
-            self._hass.data[DATA_BUSPRO].hdl.logger.info("Could not send message. Transport is None.")
+            self._logger.info("Could not send message. Transport is None.")
@@ -6,6 +6,7 @@ import heapq
 from datetime import timedelta
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.core import callback, HomeAssistant
+from .const import DATA_BUSPRO
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,8 +29,12 @@ class Scheduler:
         self._optional_heap = []    # heap for entities without scan interval
         self.entities_map = {}       # map for quick entity access
         self.default_read_interval = 10  # seconds
+        # Ticks skipped because the bus was at or above the backoff occupancy
+        self.skipped_busy = 0
         self._now = self.hass.loop.time()
         self._cancel_timer = None
+        # Set when device_updated moved entries, so the heap tops may not be the next due entities
+        self._reordered = False
 
     async def add_entity(self, entity) -> None:
         """Add entity to scheduler.
@@ -71,6 +76,13 @@ class Scheduler:
         @callback
         async def _process_entities(*_):
             self._now = self.hass.loop.time()
+            if self._bus_busy():
+                self.skipped_busy += 1
+                return
+            if self._reordered:
+                self._reordered = False
+                heapq.heapify(self._periodic_heap)
+                heapq.heapify(self._optional_heap)
             
             # Process one entity with interval if available and due
             if self._periodic_heap and self._periodic_heap[0].next_read_time <= self._now:
@@ -93,6 +105,13 @@ class Scheduler:
             timedelta(seconds=1)
         )
 
+    def _bus_busy(self) -> bool:
+        """Return True while bus occupancy over 10 s is at or above the configured backoff occupancy."""
+        module = self.hass.data.get(DATA_BUSPRO)
+        if module is None or module.hdl.backoff_occupancy is None:
+            return False
+        return module.hdl.utilisation.occupancy(10) >= module.hdl.backoff_occupancy
+
     async def stop(self) -> None:
         """Stop the scheduler."""
         if self._cancel_timer:
@@ -132,3 +151,5 @@ class Scheduler:
         info = self.entities_map[entity_id]
         interval = info.scan_interval if info.scan_interval > 0 else self.default_read_interval
         info.next_read_time = self._now + interval
+        # The entry moved within its heap; the next tick restores the heap order
+        self._reordered = True
@@ -6,6 +6,7 @@ https://home-assistant.io/components/...
 """
 
 import logging
+from datetime import timedelta
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -34,10 +35,12 @@ from homeassistant.const import (
     PERCENTAGE,
 )
 from homeassistant.core import callback
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity import Entity, EntityCategory
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator, UpdateFailed
 
 from custom_components.buspro.helpers import wait_for_buspro
 from .pybuspro.devices.sensor import SensorType, DeviceFamily
+from .pybuspro.devices.energy_meter import METER_SENSOR_TYPES
 from .pybuspro.helpers.enums import validate_device_family
 from ..buspro import DATA_BUSPRO
 
@@ -84,10 +87,12 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
 async def async_setup_platform(hass, config, async_add_entites, discovery_info=None):
     """Set up Buspro sensor devices."""
     # noinspection PyUnresolvedReferences
-    from .pybuspro.devices import Sensor
+    from .pybuspro.devices.sensor import get_shared_sensor
+    from .pybuspro.devices.energy_meter import get_energy_meter
 
     if not await wait_for_buspro(hass):
         return False    
+    buspro = hass.data[DATA_BUSPRO].hdl
     
     devices = []
 
@@ -124,20 +129,85 @@ async def async_setup_platform(hass, config, async_add_entites, discovery_info=N
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(f"Adding sensor '{name}' with address {device_address}, sensor type '{sensor_type}'")
-        sensor = Sensor(hass, device_address, device_family=device_family, sensor_type=sensor_type, name=name, channel_number=channel_number)
-        devices.append(BusproSensor(hass, sensor, sensor_type, scan_interval, offset, device_class))
+        if sensor_type in METER_SENSOR_TYPES:
+            sensor = get_energy_meter(buspro, device_address)
+            sensor.attach(sensor_type)
+        else:
+            sensor = get_shared_sensor(buspro, device_address, device_family=device_family, sensor_type=sensor_type, channel_number=channel_number)
+        devices.append(BusproSensor(hass, sensor, name, sensor_type, scan_interval, offset, device_class, channel_number))
 
 
     async_add_entites(devices)
 
 
+# (stats key, name, unit, state class) of the bus diagnostic sensors
+BUS_STATS_SENSORS = (
+    ("frames_received", "Bus frames received", None, SensorStateClass.TOTAL_INCREASING),
+    ("frames_sent", "Bus frames sent", None, SensorStateClass.TOTAL_INCREASING),
+    ("received_per_second", "Bus receive rate", "frames/s", SensorStateClass.MEASUREMENT),
+    ("sent_per_second", "Bus send rate", "frames/s", SensorStateClass.MEASUREMENT),
+    ("crc_failures", "Bus CRC failures", None, SensorStateClass.TOTAL_INCREASING),
+    ("unknown_opcodes", "Bus unknown operate codes", None, SensorStateClass.TOTAL_INCREASING),
+    ("dropped_frames", "Bus dropped frames", None, SensorStateClass.TOTAL_INCREASING),
+    ("dispatch_average_ms", "Bus dispatch time", "ms", SensorStateClass.MEASUREMENT),
+    ("bus_occupancy_1s", "Bus occupancy 1 s", PERCENTAGE, SensorStateClass.MEASUREMENT),
+    ("bus_occupancy_10s", "Bus occupancy 10 s", PERCENTAGE, SensorStateClass.MEASUREMENT),
+    ("bus_occupancy_60s", "Bus occupancy 60 s", PERCENTAGE, SensorStateClass.MEASUREMENT),
+)
+
+
+# Interval between two BusproModule.stats() snapshots shared by the bus diagnostic sensors
+STATS_SCAN_INTERVAL = timedelta(seconds=30)
+
+
+async def async_setup_entry(hass, config_entry, async_add_entities):
+    """Set up the bus diagnostic sensors of a config entry."""
+
+    async def async_update_stats():
+        if DATA_BUSPRO not in hass.data:
+            raise UpdateFailed("Buspro is not running")
+        return hass.data[DATA_BUSPRO].stats()
+
+    # One stats() snapshot per interval, read by every diagnostic sensor
+    coordinator = DataUpdateCoordinator(
+        hass, _LOGGER, name=f"{DATA_BUSPRO} stats", update_method=async_update_stats, update_interval=STATS_SCAN_INTERVAL)
+    await coordinator.async_refresh()
+    async_add_entities(
+        BusproStatsSensor(coordinator, config_entry.entry_id, key, name, unit, state_class)
+        for key, name, unit, state_class in BUS_STATS_SENSORS
+    )
+
+
+# noinspection PyAbstractClass
+class BusproStatsSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor showing one bus metric."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator, entry_id, key, name, unit, state_class):
+        super().__init__(coordinator)
+        self._key = key
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+        self._attr_unique_id = f"{entry_id}-{key}"
+
+    @property
+    def native_value(self):
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data[self._key]
+
+
 # noinspection PyAbstractClass
 class BusproSensor(SensorEntity):
     """Representation of a Buspro sensor."""
 
-    def __init__(self, hass, device, sensor_type, scan_interval, offset, device_class=None):
+    def __init__(self, hass, device, name, sensor_type, scan_interval, offset, device_class=None, channel_number=None):
         self._hass = hass
         self._device = device
+        self._name = name
+        self._channel_number = channel_number
         self._sensor_type = sensor_type        
         self._offset = offset        
         self._scan_interval = scan_interval
@@ -147,7 +217,7 @@ class BusproSensor(SensorEntity):
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
         if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug("Added sensor '{}' scan interval {}".format(self._device.name, self.scan_interval))
+            _LOGGER.debug("Added sensor '{}' scan interval {}".format(self._name, self.scan_interval))
         await self._hass.data[DATA_BUSPRO].entity_initialized(self)
 
     @callback
@@ -167,12 +237,16 @@ class BusproSensor(SensorEntity):
         return False
 
     async def async_update(self):
+        if self._sensor_type in METER_SENSOR_TYPES:
+            interval = self.scan_interval or self._hass.data[DATA_BUSPRO].scheduler.default_read_interval
+            await self._device.read_metric(self._sensor_type, interval)
+            return
         await self._device.read_sensor_status()
 
     @property
     def name(self):
-        """Return the display name of this light."""
-        return self._device.name
+        """Return the display name of this sensor."""
+        return self._name
 
     @property
     def available(self):
@@ -185,20 +259,8 @@ class BusproSensor(SensorEntity):
             return connected and self._device._current_humidity is not None
         if self._sensor_type == SensorType.ILLUMINANCE:
             return connected and self._device._brightness is not None        
-        if self._sensor_type == SensorType.CURRENT:
-            return connected and self._device._current is not None
-        if self._sensor_type == SensorType.VOLTAGE:
-            return connected and self._device._voltage is not None
-        if self._sensor_type == SensorType.POWER_FACTOR:
-            return connected and self._device._power_factor is not None
-        if self._sensor_type == SensorType.ENERGY:
-            return connected and self._device._energy is not None
-        if self._sensor_type == SensorType.ACTIVE_POWER:
-            return connected and self._device._active_power is not None
-        if self._sensor_type == SensorType.REACTIVE_POWER:
-            return connected and self._device._reactive_power is not None
-        if self._sensor_type == SensorType.APPARENT_POWER:
-            return connected and self._device._apparent_power is not None
+        if self._sensor_type in METER_SENSOR_TYPES:
+            return connected and self._device.value(self._sensor_type, self._channel_number) is not None
 
     @property
     def state(self):
@@ -209,20 +271,8 @@ class BusproSensor(SensorEntity):
             return self._device._brightness
         if self._sensor_type == SensorType.HUMIDITY:
             return self._device._current_humidity
-        if self._sensor_type == SensorType.CURRENT:
-            return self._device._current
-        if self._sensor_type == SensorType.VOLTAGE:
-            return self._device._voltage
-        if self._sensor_type == SensorType.ACTIVE_POWER:
-            return self._device._active_power
-        if self._sensor_type == SensorType.REACTIVE_POWER:
-            return self._device._reactive_power
-        if self._sensor_type == SensorType.APPARENT_POWER:
-            return self._device._apparent_power
-        if self._sensor_type == SensorType.POWER_FACTOR:
-            return self._device._power_factor
-        if self._sensor_type == SensorType.ENERGY:
-            return self._device._energy
+        if self._sensor_type in METER_SENSOR_TYPES:
+            return self._device.value(self._sensor_type, self._channel_number)
 
     @property
     def _current_temperature(self):
@@ -299,7 +349,7 @@ class BusproSensor(SensorEntity):
         elif self._sensor_type == SensorType.SINGLE_CHANNEL:
             channel = getattr(self._device, "_channel_number", "N") 
         elif self._sensor_type in [SensorType.CURRENT, SensorType.VOLTAGE, SensorType.ACTIVE_POWER, SensorType.POWER_FACTOR, SensorType.ENERGY]:
-            channel = getattr(self._device, "_channel_number", "N")
+            channel = self._channel_number
         else:
             channel = "N"
         
@@ -50,6 +50,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     """Set up Buspro switch devices."""
     if not await wait_for_buspro(hass):
         return False        
+    buspro = hass.data[DATA_BUSPRO].hdl
     
     devices = []
 
@@ -65,18 +66,18 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
             channel_number = int(address2[2])
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(f"Adding panel switch '{name}' with address {device_address} and channel {channel_number}")
-            device = Panel(hass, device_address, channel_number, name)
+            device = Panel(buspro, device_address, channel_number, name)
         else:  # relay device type
             if switch_type == SwitchType.UNIVERSAL_SWITCH.value:
                 switch_number = int(address2[2])
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(f"Adding universal switch '{name}' with address {device_address} and number {switch_number}")
-                device = UniversalSwitch(hass, device_address, switch_number, name)
+                device = UniversalSwitch(buspro, device_address, switch_number, name)
             else:  # relay switch type
                 channel_number = int(address2[2])
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(f"Adding relay switch '{name}' with address {device_address} and channel {channel_number}")
-                device = Switch(hass, device_address, channel_number, name)
+                device = Switch(buspro, device_address, channel_number, name)
 
         devices.append(BusproSwitch(hass, device, scan_interval))
 
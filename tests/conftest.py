@@ -0,0 +1,27 @@
+"""Tests import pybuspro on its own, so Home Assistant is not needed to run them."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "custom_components", "buspro"))
+
+from pybuspro.core.telegram import Telegram  # noqa: E402
+from pybuspro.helpers.telegram_helper import TelegramHelper  # noqa: E402
+
+_helper = TelegramHelper()
+
+
+def received_frame(source, opcode, target, payload):
+    """Return the bytes of a frame sent by the module at source.
+
+    build_send_buffer always writes the PyBusPro source address, so the source is patched in and
+    the CRC recomputed.
+    """
+    telegram = Telegram()
+    telegram.source_address = source
+    telegram.target_address = target
+    telegram.operate_code = opcode
+    telegram.payload = payload
+    frame = _helper.build_send_buffer(telegram)
+    frame[17], frame[18] = source
+    frame[-2:] = _helper.crc16func(bytes(frame[16:-2])).to_bytes(2, "big")
+    return bytes(frame)
@@ -0,0 +1,38 @@
+import asyncio
+
+from conftest import received_frame
+from pybuspro.buspro import Buspro
+from pybuspro.core.telegram_filter import TelegramFilter, TelegramRule
+from pybuspro.helpers.enums import OperateCode
+from pybuspro.helpers.telegram_helper import TelegramHelper
+
+GATEWAY = ("192.168.10.250", 6000)
+MODULE_ADDRESS = (1, 10)
+
+
+def _received_telegram():
+    frame = received_frame(MODULE_ADDRESS, OperateCode.SceneControlResponse, (1, 254), [1, 3])
+    return TelegramHelper().build_telegram_from_udp_data(frame, GATEWAY)
+
+
+def _fail(*args):
+    raise RuntimeError("consumer failed")
+
+
+def test_failing_consumers_do_not_skip_device_dispatch():
+    async def run():
+        buspro = Buspro(GATEWAY)
+        received = []
+        buspro.register_telegram_received_device_cb(received.append, MODULE_ADDRESS)
+        buspro.callback_all_messages = _fail
+        buspro.subscribe(key=_fail, policy="latest_per_key")
+        healthy = buspro.subscribe()
+        buspro.register_telegram_filter(TelegramFilter([TelegramRule(source=MODULE_ADDRESS)], buspro.loop.time), _fail)
+
+        buspro._callback_all_messages(_received_telegram())
+        return received, len(healthy)
+
+    received, queued = asyncio.run(run())
+
+    assert len(received) == 1
+    assert queued == 1
@@ -0,0 +1,79 @@
+import asyncio
+
+from pybuspro.buspro import Buspro
+from pybuspro.devices.channel_group import set_channel_levels
+from pybuspro.devices.control import _SingleChannelControl
+from pybuspro.transport.send_queue import bus_frame_seconds
+
+GATEWAY = ("192.168.10.250", 6000)
+MODULES = 5
+CHANNELS = 6
+# SingleChannelControl frames are 31 bytes
+FRAME_SECONDS = bus_frame_seconds(31)
+
+
+class _RecordingUDPClient:
+    def __init__(self, loop):
+        self._loop = loop
+        self.written = []
+
+    async def send_message(self, message):
+        self.written.append((self._loop.time(), message))
+
+    async def stop(self):
+        pass
+
+
+def _targets():
+    # Requested in channel-major order, so module order is not the request order
+    return [((1, 10 + module), channel, 50) for channel in range(1, CHANNELS + 1) for module in range(MODULES)]
+
+
+async def _one_by_one(buspro, targets):
+    futures = []
+    for device_address, channel_number, level in targets:
+        scc = _SingleChannelControl(buspro, device_address)
+        scc.channel_number, scc.channel_level = channel_number, level
+        scc.running_time_minutes, scc.running_time_seconds = 0, 0
+        futures.append(await scc.send())
+    return max(await asyncio.gather(*futures))
+
+
+def send(group):
+    """Send _targets() as a group or one by one; return (seconds to the last frame, written frames)."""
+    async def run():
+        loop = asyncio.get_running_loop()
+        buspro = Buspro(GATEWAY)
+        network_interface = buspro._new_network_interface()
+        network_interface.udp_client = _RecordingUDPClient(loop)
+        network_interface.send_queue.start()
+        buspro.network_interface = network_interface
+        started = loop.time()
+        if group:
+            last_sent = await set_channel_levels(buspro, _targets())
+        else:
+            last_sent = await _one_by_one(buspro, _targets())
+        written = network_interface.udp_client.written
+        await network_interface.stop()
+        return last_sent - started, [message for _, message in written]
+
+    return asyncio.run(run())
+
+
+def test_group_is_bus_bound_and_in_module_order():
+    elapsed, written = send(group=True)
+
+    assert len(written) == MODULES * CHANNELS
+    # asyncio.sleep overshoots every gap a little, more so on a loaded machine
+    assert elapsed < len(written) * FRAME_SECONDS * 1.25
+    # Target address at bytes 23-24, channel at 25
+    order = [(message[23], message[24], message[25]) for message in written]
+    assert order == sorted(order)
+
+
+def test_group_completes_no_later_than_one_by_one():
+    group_elapsed, _ = send(group=True)
+    single_elapsed, written = send(group=False)
+
+    assert len(written) == MODULES * CHANNELS
+    assert group_elapsed <= single_elapsed + FRAME_SECONDS
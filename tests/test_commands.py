@@ -0,0 +1,93 @@
+import asyncio
+
+from conftest import received_frame
+from pybuspro.buspro import Buspro
+from pybuspro.devices import commands
+from pybuspro.helpers.enums import OperateCode
+from pybuspro.helpers.telegram_helper import TelegramHelper
+from pybuspro.transport import send_queue
+
+GATEWAY = ("192.168.10.250", 6000)
+CALLS = 10_000
+BATCHES = 50
+BATCH_SIZE = 4
+
+
+class _GatewayClient:
+    """Answers the commands sent to odd device ids like a module would; even ones never answer."""
+
+    def __init__(self, network_interface):
+        self._network_interface = network_interface
+        self._helper = TelegramHelper()
+
+    async def send_message(self, message):
+        request = self._helper.build_telegram_from_udp_data(bytes(message), GATEWAY)
+        if request.target_address[1] % 2 == 0:
+            return
+        if request.operate_code == OperateCode.ReadStatusOfChannels:
+            response_code, payload = OperateCode.ReadStatusOfChannelsResponse, [1, 50]
+        elif request.operate_code == OperateCode.SceneControl:
+            response_code, payload = OperateCode.SceneControlResponse, request.payload
+        elif request.operate_code == OperateCode.UniversalSwitchControl:
+            response_code, payload = OperateCode.UniversalSwitchControlResponse, request.payload
+        else:
+            return
+        frame = received_frame(request.target_address, response_code, (1, 254), payload)
+        asyncio.get_running_loop().call_soon(self._network_interface._udp_request_received, frame, GATEWAY)
+
+    async def stop(self):
+        pass
+
+
+def _registry_sizes(buspro):
+    return (len(buspro._telegram_received_cbs), len(buspro._shared_devices),
+            sum(len(waiters) for waiters in buspro._response_waiters.values()))
+
+
+def test_commands_leave_no_callbacks_or_waiters(monkeypatch):
+    # Pacing is covered by the SendQueue tests; here it would only make the test slow
+    monkeypatch.setattr(send_queue, "bus_frame_seconds", lambda udp_frame_length: 0)
+
+    async def run():
+        buspro = Buspro(GATEWAY)
+        network_interface = buspro._new_network_interface()
+        network_interface.udp_client = _GatewayClient(network_interface)
+        network_interface.send_queue.start()
+        buspro.network_interface = network_interface
+        before = _registry_sizes(buspro)
+
+        sent = [await commands.send_message(buspro, (1, 10 + call % 50), OperateCode.ReadStatusOfChannels, [])
+                for call in range(CALLS)]
+        await asyncio.gather(*sent)
+        after_single = _registry_sizes(buspro)
+
+        switched = [await commands.set_universal_switch(buspro, (1, 10 + call % 50), call % 200 + 1, call % 2 == 0)
+                    for call in range(CALLS)]
+        await asyncio.gather(*switched)
+        after_switches = _registry_sizes(buspro)
+
+        scenes = [await commands.activate_scene(buspro, (1, 10 + call % 50), call % 4 + 1, call % 16 + 1)
+                  for call in range(CALLS)]
+        await asyncio.gather(*scenes)
+        # Let the last responses of the fake gateway arrive
+        await asyncio.sleep(0.01)
+        after_scenes = _registry_sizes(buspro)
+
+        outcomes = []
+        for batch in range(BATCHES):
+            messages = [((1, 10 + batch % 10 + index), OperateCode.ReadStatusOfChannels, []) for index in range(BATCH_SIZE)]
+            outcomes += await commands.send_messages(buspro, messages, await_response=True, timeout=0.05)
+        after_batches = _registry_sizes(buspro)
+
+        await network_interface.stop()
+        return before, after_single, after_switches, after_scenes, after_batches, outcomes
+
+    before, after_single, after_switches, after_scenes, after_batches, outcomes = asyncio.run(run())
+
+    assert before == (0, 0, 0)
+    assert after_single == (0, 0, 0)
+    assert after_switches == (0, 0, 0)
+    assert after_scenes == (0, 0, 0)
+    assert after_batches == (0, 0, 0)
+    statuses = [outcome["status"] for outcome in outcomes]
+    assert statuses.count("response") == statuses.count("timeout") == BATCHES * BATCH_SIZE // 2
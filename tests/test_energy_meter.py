@@ -0,0 +1,47 @@
+import asyncio
+
+from pybuspro.buspro import Buspro
+from pybuspro.core.telegram import Telegram
+from pybuspro.devices.energy_meter import EnergyMeter
+from pybuspro.helpers.enums import OperateCode, SensorType
+
+GATEWAY = ("192.168.10.250", 6000)
+METER_ADDRESS = (1, 30)
+
+
+def _telegram(operate_code, payload):
+    telegram = Telegram()
+    telegram.source_address = METER_ADDRESS
+    telegram.target_address = (255, 255)
+    telegram.operate_code = operate_code
+    telegram.payload = payload
+    return telegram
+
+
+def _meter():
+    async def run():
+        meter = EnergyMeter(Buspro(GATEWAY), METER_ADDRESS)
+        meter._telegram_received_cb(_telegram(OperateCode.ReadVoltageResponse, [23, 0, 1, 5] * 3))
+        meter._telegram_received_cb(_telegram(OperateCode.ReadPowerStatusResponse, [0, 12] * 12))
+        meter._telegram_received_cb(_telegram(OperateCode.ReadElectricityStatusResponse, [1, 0] * 4))
+        return meter
+
+    return asyncio.run(run())
+
+
+def test_word_metrics_keep_int_type():
+    meter = _meter()
+
+    for sensor_type in (SensorType.ACTIVE_POWER, SensorType.REACTIVE_POWER, SensorType.APPARENT_POWER):
+        value = meter.value(sensor_type, 4)
+        assert value == 12 and type(value) is int
+    energy = meter.value(SensorType.ENERGY, 1)
+    assert energy == 256 and type(energy) is int
+
+
+def test_decimal_metrics_are_float_and_unknown_is_none():
+    meter = _meter()
+
+    assert meter.value(SensorType.VOLTAGE, 1) == 230.15
+    assert meter.value(SensorType.CURRENT, 1) is None
+    assert meter.value(SensorType.VOLTAGE, 4) is None
@@ -0,0 +1,86 @@
+import asyncio
+
+from pybuspro.buspro import Buspro
+from pybuspro.core.telegram import Telegram
+from pybuspro.devices import optimistic
+from pybuspro.devices.light import Light
+from pybuspro.helpers.enums import OperateCode
+
+GATEWAY = ("192.168.10.250", 6000)
+DIMMER_ADDRESS = (1, 10)
+
+
+def _status(levels):
+    telegram = Telegram()
+    telegram.source_address = DIMMER_ADDRESS
+    telegram.target_address = (1, 254)
+    telegram.operate_code = OperateCode.ReadStatusOfChannelsResponse
+    telegram.payload = [len(levels)] + levels
+    return telegram
+
+
+def _ramp(*readings):
+    """Ramp channel 1 from 0 to 100 over 10 seconds and feed it the status readings."""
+    async def run():
+        buspro = Buspro(GATEWAY)
+        light = Light(buspro, DIMMER_ADDRESS, 1)
+        await light.set_brightness(100, running_time_seconds=10)
+        for level in readings:
+            light._telegram_received_cb(_status([level, 0]))
+        result = dict(buspro.optimistic_stats), light._optimistic.pending, light.ramp_in_progress
+        light._optimistic._cancel_timer()
+        light._cancel_ramp()
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+        return result
+
+    return asyncio.run(run())
+
+
+def test_mid_ramp_read_keeps_level_pending():
+    stats, pending, ramping = _ramp(30)
+
+    assert stats["confirmed"] == 0
+    assert stats["corrected"] == 0
+    assert pending
+    assert ramping
+
+
+def test_read_at_target_confirms_level():
+    stats, pending, ramping = _ramp(30, 100)
+
+    assert stats["confirmed"] == 1
+    assert not pending
+    assert not ramping
+
+
+def test_lost_control_response_rereads_once_at_ramp_end():
+    async def run():
+        buspro = Buspro(GATEWAY)
+        light = Light(buspro, DIMMER_ADDRESS, 1)
+        reads = []
+        # A 0.2 s confirmation window instead of PENDING_CONFIRMATION_SECONDS keeps the test short
+        light._optimistic = optimistic.OptimisticLevel(
+            buspro.loop, buspro.optimistic_stats, lambda: reads.append(buspro.loop.time() - started),
+            light._revert_brightness, timeout=0.2)
+        started = buspro.loop.time()
+        # The SingleChannelControlResponse never arrives; status replies show the ramp moving
+        await light.set_brightness(100, running_time_seconds=1)
+        for level in (20, 40, 60, 80):
+            await asyncio.sleep(0.2)
+            light._telegram_received_cb(_status([level, 0]))
+        reads_during_ramp = len(reads)
+        await asyncio.sleep(0.5)
+        light._optimistic._cancel_timer()
+        light._cancel_ramp()
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+        return reads_during_ramp, reads
+
+    reads_during_ramp, reads = asyncio.run(run())
+
+    assert reads_during_ramp == 0
+    assert len(reads) == 1
+    assert 1.1 < reads[0] < 1.4
@@ -0,0 +1,93 @@
+import asyncio
+
+from conftest import received_frame
+from pybuspro.buspro import Buspro
+from pybuspro.devices import module_status
+from pybuspro.devices.module_status import get_module_status
+from pybuspro.helpers.enums import OperateCode
+from pybuspro.helpers.telegram_helper import TelegramHelper
+from pybuspro.transport import send_queue
+
+GATEWAY = ("192.168.10.250", 6000)
+MODULE_ADDRESS = (1, 10)
+AREA, SCENE = 1, 3
+
+
+class _DimmerClient:
+    """Answers each ReadStatusOfChannels with the next levels of a script; the last ones repeat."""
+
+    def __init__(self, network_interface, levels):
+        self._network_interface = network_interface
+        self._levels = list(levels)
+        self._helper = TelegramHelper()
+        self.reads = 0
+
+    async def send_message(self, message):
+        request = self._helper.build_telegram_from_udp_data(bytes(message), GATEWAY)
+        if request.operate_code != OperateCode.ReadStatusOfChannels:
+            return
+        levels = self._levels[min(self.reads, len(self._levels) - 1)]
+        self.reads += 1
+        asyncio.get_running_loop().call_soon(self.receive, OperateCode.ReadStatusOfChannelsResponse, [len(levels), *levels])
+
+    def receive(self, operate_code, payload):
+        self._network_interface._udp_request_received(received_frame(MODULE_ADDRESS, operate_code, (1, 254), payload), GATEWAY)
+
+    async def stop(self):
+        pass
+
+
+def _run_scene(monkeypatch, levels, foreign_status=None):
+    """Run the scene once against a dimmer answering levels; return (scene table entry, status, client)."""
+    monkeypatch.setattr(send_queue, "bus_frame_seconds", lambda udp_frame_length: 0)
+    monkeypatch.setattr(module_status, "SCENE_REFRESH_DELAY_SECONDS", 0.01)
+    monkeypatch.setattr(module_status, "SCENE_SETTLE_SECONDS", 0.01)
+
+    async def run():
+        buspro = Buspro(GATEWAY)
+        network_interface = buspro._new_network_interface()
+        client = _DimmerClient(network_interface, levels)
+        network_interface.udp_client = client
+        network_interface.send_queue.start()
+        buspro.network_interface = network_interface
+        status = get_module_status(buspro, MODULE_ADDRESS)
+
+        client.receive(OperateCode.SceneControlResponse, [AREA, SCENE])
+        if foreign_status is not None:
+            # A channel's own read answered between the scene and the debounced read
+            client.receive(OperateCode.ReadStatusOfChannelsResponse, [len(foreign_status), *foreign_status])
+        await asyncio.sleep(0.3)
+        await network_interface.stop()
+        return buspro.scene_table.get(MODULE_ADDRESS, AREA, SCENE), status, client
+
+    return asyncio.run(run())
+
+
+def test_scene_learned_from_its_own_settled_read(monkeypatch):
+    entry, status, client = _run_scene(monkeypatch, [(100, 0, 50)])
+
+    assert entry == ((100, 0, 50), True)
+    assert client.reads == 2
+
+
+def test_fading_scene_learned_once_it_settles(monkeypatch):
+    entry, status, client = _run_scene(monkeypatch, [(20, 0, 10), (60, 0, 30), (100, 0, 50)])
+
+    assert entry == ((100, 0, 50), True)
+    assert client.reads == 4
+
+
+def test_scene_that_never_settles_is_not_learned(monkeypatch):
+    entry, status, client = _run_scene(monkeypatch, [(level, 0, 0) for level in range(10, 100, 10)])
+
+    assert entry is None
+    assert status.scenes_unsettled == 1
+    assert client.reads == 1 + module_status.SCENE_SETTLE_READS
+
+
+def test_foreign_status_response_is_not_learned(monkeypatch):
+    entry, status, client = _run_scene(monkeypatch, [(100, 0, 50)], foreign_status=(30, 0, 0))
+
+    assert entry is None
+    assert status.reads_skipped == 1
+    assert client.reads == 0
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from conftest import received_frame
+from pybuspro.buspro import Buspro
+from pybuspro.core.capture import CaptureRecorder
+from pybuspro.core import replay
+from pybuspro.devices.light import Light
+from pybuspro.helpers.enums import OperateCode
+
+GATEWAY = ("192.168.10.250", 6000)
+DIMMER_ADDRESS = (1, 10)
+FRAMES = 25
+
+
+def _status_frame(level):
+    return received_frame(DIMMER_ADDRESS, OperateCode.ReadStatusOfChannelsResponse, (1, 254), [2, level, 0])
+
+
+def _capture(path):
+    async def run():
+        recorder = CaptureRecorder(str(path), asyncio.get_running_loop())
+        for level in range(FRAMES):
+            recorder.record_rx(_status_frame(level), GATEWAY)
+            recorder.record_tx(_status_frame(100), GATEWAY)
+        await recorder.close()
+
+    asyncio.run(run())
+
+
+def test_replay_on_separate_client_reads_in_batches(tmp_path, monkeypatch):
+    path = tmp_path / "capture.bin"
+    _capture(path)
+    # Smaller than the capture, so several executor reads are needed
+    monkeypatch.setattr(replay, "READ_BATCH_RECORDS", 7)
+
+    async def run():
+        buspro = Buspro(GATEWAY)
+        light = Light(buspro, DIMMER_ADDRESS, 1)
+        result = await buspro.replay(str(path))
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+        return result, light.current_brightness, buspro.network_interface, buspro.metrics.frames_received
+
+    result, brightness, network_interface, frames_received = asyncio.run(run())
+
+    assert result["frames"] == FRAMES
+    assert "peak_traced_kb" not in result
+    assert brightness == FRAMES - 1
+    assert network_interface is None
+    assert frames_received == FRAMES
+
+
+def test_replay_refuses_a_started_client(tmp_path):
+    path = tmp_path / "capture.bin"
+    _capture(path)
+
+    async def run():
+        buspro = Buspro(GATEWAY)
+        buspro.network_interface = buspro._new_network_interface()
+        await buspro.replay(str(path))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
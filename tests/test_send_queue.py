@@ -0,0 +1,109 @@
+import asyncio
+
+from pybuspro.buspro import Buspro
+from pybuspro.devices.control import _ReadStatusOfChannels, _SingleChannelControl
+from pybuspro.helpers.telegram_helper import TelegramHelper
+from pybuspro.transport.send_queue import SendQueue, bus_frame_seconds
+
+GATEWAY = ("192.168.10.250", 6000)
+DIMMER_ADDRESS = (1, 10)
+CHANNELS = 4
+RATE_HZ = 50
+SECONDS = 1.0
+# asyncio may run a timer up to its clock resolution early
+TOLERANCE = 0.002
+
+
+def test_fifty_hz_levels_are_paced_and_latest_wins():
+    helper = TelegramHelper()
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        buspro = Buspro(GATEWAY)
+        written = []
+
+        async def send_cb(message):
+            written.append((loop.time(), message))
+
+        queue = SendQueue(send_cb, loop)
+        queue.start()
+        last_levels = {}
+        started = loop.time()
+        for step in range(int(RATE_HZ * SECONDS)):
+            # Every channel moves at 50 Hz, four times what the bus carries one by one
+            for channel in range(1, CHANNELS + 1):
+                control = _SingleChannelControl(buspro, DIMMER_ADDRESS)
+                control.channel_number, control.channel_level = channel, step % 101
+                control.running_time_minutes, control.running_time_seconds = 0, 0
+                queue.enqueue(bytes(helper.build_send_buffer(control.telegram)), control.coalesce_key)
+                last_levels[channel] = control.channel_level
+            await asyncio.sleep(1 / RATE_HZ)
+        while len(queue):
+            await asyncio.sleep(0.01)
+        elapsed = loop.time() - started
+        await queue.stop()
+        return written, last_levels, elapsed, queue.coalesced
+
+    written, last_levels, elapsed, coalesced = asyncio.run(run())
+
+    frame_seconds = bus_frame_seconds(len(written[0][1]))
+    assert len(written) <= elapsed / frame_seconds + 1
+    for (previous, _), (current, _) in zip(written, written[1:]):
+        assert current - previous >= frame_seconds - TOLERANCE
+    assert coalesced == RATE_HZ * SECONDS * CHANNELS - len(written)
+
+    final = {}
+    for _, message in written:
+        telegram = helper.build_telegram_from_udp_data(message, GATEWAY)
+        final[telegram.payload[0]] = telegram.payload[1]
+    assert final == last_levels
+
+
+class _BusyBus:
+    def occupancy(self, window):
+        return 90
+
+
+def _backoffs(backoff_occupancy):
+    async def run():
+        async def send_cb(message):
+            pass
+
+        queue = SendQueue(send_cb, asyncio.get_running_loop())
+        queue.utilisation = _BusyBus()
+        queue.backoff_occupancy = backoff_occupancy
+        queue.start()
+        for _ in range(3):
+            queue.enqueue(bytes(20))
+        while len(queue):
+            await asyncio.sleep(0.01)
+        await queue.stop()
+        return queue.backoffs
+
+    return asyncio.run(run())
+
+
+def test_backoff_is_off_unless_configured():
+    assert _backoffs(None) == 0
+    assert _backoffs(95) == 0
+    assert _backoffs(75) >= 2
+
+
+def test_status_reads_coalesce_per_module():
+    helper = TelegramHelper()
+
+    async def run():
+        buspro = Buspro(GATEWAY)
+
+        async def send_cb(message):
+            pass
+
+        # Not started, so everything stays queued
+        queue = SendQueue(send_cb, asyncio.get_running_loop())
+        for device_id in (10, 11):
+            for _ in range(12):
+                control = _ReadStatusOfChannels(buspro, (1, device_id))
+                queue.enqueue(bytes(helper.build_send_buffer(control.telegram)), control.coalesce_key)
+        return len(queue), queue.coalesced
+
+    assert asyncio.run(run()) == (2, 22)
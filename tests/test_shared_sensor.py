@@ -0,0 +1,61 @@
+"""Entities on one module share a Sensor: one callback and one initial status read per module."""
+import asyncio
+
+from pybuspro.buspro import Buspro
+from pybuspro.devices.sensor import Sensor, get_shared_sensor
+from pybuspro.helpers.enums import DeviceFamily, SensorType
+
+GATEWAY = (("127.0.0.1", 6000), ("", 6000))
+MODULES = 50
+ENTITY_TYPES = (SensorType.TEMPERATURE, SensorType.ILLUMINANCE, SensorType.MOTION, SensorType.SONIC, SensorType.DRY_CONTACT_1)
+
+
+def _count(create):
+    async def run():
+        buspro = Buspro(GATEWAY)
+        sensors = [
+            create(buspro, (1, 10 + module), device_family=DeviceFamily.TWELVE_IN_ONE, sensor_type=sensor_type.value)
+            for module in range(MODULES)
+            for sensor_type in ENTITY_TYPES
+        ]
+        # Every Sensor schedules its initial status read as a task when it is created
+        reads = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        callbacks = sum(len(cbs) for cbs in buspro._telegram_received_cbs.values())
+        for task in reads:
+            task.cancel()
+        return len(sensors), len({id(sensor) for sensor in sensors}), callbacks, len(reads)
+
+    return asyncio.run(run())
+
+
+def test_fifty_12in1_modules_with_five_entities_each():
+    entities, devices, callbacks, reads = _count(get_shared_sensor)
+
+    assert entities == 250
+    assert devices == 50
+    assert callbacks == 50
+    assert reads == 50
+
+
+def test_one_sensor_per_entity_for_comparison():
+    # What every entity creating its own Sensor, as before the shared registry, costs
+    assert _count(Sensor) == (250, 250, 250, 250)
+
+
+def test_relay_channel_shared_whatever_the_family():
+    async def run():
+        buspro = Buspro(GATEWAY)
+        # A climate's relay sensor, and binary_sensors on the same channel with and without a family
+        relay = get_shared_sensor(buspro, (1, 20), sensor_type=SensorType.SINGLE_CHANNEL, channel_number=3)
+        with_family = get_shared_sensor(buspro, (1, 20), device_family=DeviceFamily.TWELVE_IN_ONE.value,
+                                        sensor_type=SensorType.SINGLE_CHANNEL.value, channel_number=3)
+        without_family = get_shared_sensor(buspro, (1, 20), sensor_type=SensorType.SINGLE_CHANNEL.value, channel_number=3)
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+        return relay, with_family, without_family
+
+    relay, with_family, without_family = asyncio.run(run())
+
+    assert relay is with_family is without_family
+    assert relay._device_family is None
@@ -0,0 +1,33 @@
+import asyncio
+import logging
+
+from pybuspro.buspro import Buspro
+from pybuspro.transport import threaded_udp_client
+
+GATEWAY = ("192.168.10.250", 6000)
+BATCHES = 10
+FRAMES_PER_BATCH = 3
+
+
+def test_dropped_batches_count_as_dropped_frames(monkeypatch, caplog):
+    monkeypatch.setattr(threaded_udp_client, "MAX_PENDING_BATCHES", 4)
+
+    async def run():
+        buspro = Buspro((GATEWAY, ("", GATEWAY[1])), io_thread=True)
+        network_interface = buspro._new_network_interface()
+        client = network_interface.udp_client
+        # Hand batches over while the loop is busy, as the I/O thread would
+        for _ in range(BATCHES):
+            client._hand_over([(b"", GATEWAY, None)] * FRAMES_PER_BATCH)
+        dropped_before_delivery = buspro.metrics.dropped_frames
+        await asyncio.sleep(0)
+        return client, dropped_before_delivery, buspro.stats()
+
+    with caplog.at_level(logging.WARNING):
+        client, dropped_frames, stats = asyncio.run(run())
+
+    assert client.dropped_batches == BATCHES - 4
+    assert dropped_frames == (BATCHES - 4) * FRAMES_PER_BATCH
+    assert stats["dropped_frames"] == dropped_frames
+    assert client.batches == 4
+    assert sum("batches dropped" in record.getMessage() for record in caplog.records) == 1
@@ -0,0 +1,284 @@
+"""Microbenchmarks for the pybuspro hot paths.
+
+Covers frame decoding (TelegramHelper.build_telegram_from_udp_data), encoding (build_send_buffer),
+control to telegram conversion (_Control.build_telegram_from_control), dispatch of received
+telegrams (Buspro._callback_all_messages) to a realistic set of device callbacks, the whole
+receive path of a frame (NetworkInterface._udp_request_received) with and without the bus metrics,
+and the Sensor decoders. Frames are synthetic, one per operate code family.
+
+pybuspro is imported on its own from custom_components/buspro, so Home Assistant is not needed.
+Run from the repository root:
+
+    python tools/benchmark.py --output before.json
+    python tools/benchmark.py --output after.json --compare before.json --threshold 10
+
+--compare prints the change of every benchmark against a baseline and exits with status 1 when
+any throughput dropped by more than --threshold percent. --input compares two saved files without
+running anything. Compare runs from the same idle machine; on shared or frequency-scaled CPUs
+raise --repeat and --min-time, since each figure is the best repeat.
+
+Devices schedule their update callbacks as tasks; those tasks are created inside the timed code
+and run between repeats, so the figures include task creation but not the callbacks themselves.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import timeit
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "custom_components", "buspro"))
+
+from pybuspro.buspro import Buspro  # noqa: E402
+from pybuspro.core.telegram import Telegram  # noqa: E402
+from pybuspro.devices import control  # noqa: E402
+from pybuspro.devices.light import Light  # noqa: E402
+from pybuspro.devices.sensor import Sensor  # noqa: E402
+from pybuspro.helpers.enums import DeviceFamily, OperateCode, SensorType, WorkType  # noqa: E402
+from pybuspro.helpers.telegram_helper import TelegramHelper  # noqa: E402
+from pybuspro.transport.network_interface import NetworkInterface  # noqa: E402
+
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 10.0
+
+GATEWAY = ("192.168.10.250", 6000)
+SENSOR_ADDRESS = (1, 100)
+# Dimmer modules with 12 channels each; every channel is a Light
+DIMMER_MODULES = 20
+CHANNELS_PER_MODULE = 12
+
+_HELPER = TelegramHelper()
+
+# (family, operate code, payload) of the frames the decode benchmarks use
+FRAMES = [
+    ("channel_control", OperateCode.SingleChannelControlResponse, [1, 248, 50, 12, 1, 0]),
+    ("channel_status", OperateCode.ReadStatusOfChannelsResponse, [12] + [0, 25, 50, 75, 100, 0] * 2),
+    ("scene", OperateCode.SceneControlResponse, [1, 3]),
+    ("universal_switch", OperateCode.UniversalSwitchControlResponse, [5, 1]),
+    ("universal_switch_broadcast", OperateCode.BroadcastStatusOfUniversalSwitch, [10] + [0, 1] * 5),
+    ("12in1", OperateCode.Broadcast12in1SensorStatusAutoResponse, [248, 42, 1, 44, 1, 0, 0, 0]),
+    ("sensors_in_one", OperateCode.BroadcastSensorsInOneStatusResponse, [0, 41, 0, 250, 45, 0, 0, 1, 0, 0]),
+    ("temperature", OperateCode.BroadcastTemperatureResponse, [1, 22, 0, 0, 0, 0]),
+    ("dlp_floor_heating", OperateCode.DLPReadFloorHeatingStatusResponse, [0, 22, 1, 1, 22, 23, 19, 16]),
+    ("fhm_floor_heating", OperateCode.FHMResponseReadFloorHeatingStatus, [1, 1, 0, 1, 22, 23, 19, 16, 0, 21, 1]),
+    ("curtain", OperateCode.ReadStatusofCurtainSwitchResponse, [1, 1]),
+    ("security", OperateCode.ReadSecurityModuleResponse, [1, 6]),
+    ("dry_contact", OperateCode.ReadDryContactBroadcastStatusResponse, [1, 1, 1]),
+    ("panel", OperateCode.PanelControlResponse, [1, 1, 1]),
+    ("time_broadcast", OperateCode.BroadcastSystemDateandTimeEveryMinute, [26, 10, 19, 12, 0, 0, 1]),
+    ("electricity", OperateCode.ReadElectricityStatusResponse, [248] + [0, 0, 200, 66] * 3),
+    ("unknown_opcode", b'\x12\x34', [1, 2, 3]),
+]
+
+
+def _telegram(source_address, operate_code, payload, target_address=(255, 255)):
+    telegram = Telegram()
+    telegram.source_address = source_address
+    telegram.target_address = target_address
+    telegram.operate_code = operate_code
+    telegram.payload = payload
+    return telegram
+
+
+def received_frame(source, opcode, target, payload):
+    """Return the bytes of a frame sent by the module at source, as tests/conftest.py builds them.
+
+    build_send_buffer always writes the PyBusPro source address, so the source is patched in and
+    the CRC recomputed.
+    """
+    frame = _HELPER.build_send_buffer(_telegram(source, opcode, payload, target))
+    frame[17], frame[18] = source
+    frame[-2:] = _HELPER.crc16func(bytes(frame[16:-2])).to_bytes(2, "big")
+    return bytes(frame)
+
+
+def _controls(buspro):
+    address = (1, 10)
+    single_channel = control._SingleChannelControl(buspro, address)
+    single_channel.channel_number, single_channel.channel_level = 1, 50
+    single_channel.running_time_minutes, single_channel.running_time_seconds = 0, 2
+    scene = control._SceneControl(buspro, address)
+    scene.area_number, scene.scene_number = 1, 3
+    fhm = control._FHMControlFloorHeatingStatus(buspro, address)
+    fhm.channel_number, fhm.status, fhm.temperature_type, fhm.mode = 1, 1, 0, 1
+    fhm.work_type = WorkType.HEATING
+    fhm.normal_temperature, fhm.day_temperature, fhm.night_temperature, fhm.away_temperature = 22, 23, 19, 16
+    curtain = control._CurtainSwitchControl(buspro, address)
+    curtain.channel, curtain.state = 1, 1
+    time_sync = control._ModifySystemDateandTime(buspro, address)
+    time_sync.custom_datetime = datetime(2026, 1, 1, 12, 0, 0)
+    generic = control._GenericControl(buspro, address)
+    generic.operate_code, generic.payload = OperateCode.ReadStatusOfChannels, []
+    return {
+        "single_channel": single_channel,
+        "scene": scene,
+        "read_status": control._ReadStatusOfChannels(buspro, address),
+        "fhm_control": fhm,
+        "curtain": curtain,
+        "time_sync": time_sync,
+        "generic": generic,
+    }
+
+
+def _sensors(buspro):
+    """Return {name: (Sensor, FRAMES family it decodes)}, one per Sensor handler."""
+    universal_switch = Sensor(buspro, SENSOR_ADDRESS, universal_switch_number=5)
+    single_channel = Sensor(buspro, SENSOR_ADDRESS, sensor_type=SensorType.SINGLE_CHANNEL, channel_number=1)
+    return {
+        "12in1": (Sensor(buspro, SENSOR_ADDRESS, device_family=DeviceFamily.TWELVE_IN_ONE), "12in1"),
+        "sensors_in_one": (Sensor(buspro, SENSOR_ADDRESS, device_family=DeviceFamily.SENSORS_IN_ONE), "sensors_in_one"),
+        "dlp_floor_heating": (Sensor(buspro, SENSOR_ADDRESS, device_family=DeviceFamily.DLP), "dlp_floor_heating"),
+        "temperature": (Sensor(buspro, SENSOR_ADDRESS, sensor_type=SensorType.TEMPERATURE, channel_number=1), "temperature"),
+        "channel_status": (single_channel, "channel_status"),
+        "channel_control": (single_channel, "channel_control"),
+        "dry_contact": (Sensor(buspro, SENSOR_ADDRESS, sensor_type=SensorType.DRY_CONTACT, switch_number=1), "dry_contact"),
+        "universal_switch": (universal_switch, "universal_switch"),
+        "universal_switch_broadcast": (universal_switch, "universal_switch_broadcast"),
+        "unknown_opcode": (universal_switch, "unknown_opcode"),
+    }
+
+
+def build_benchmarks(buspro):
+    """Return {name: zero-argument callable} for every benchmark."""
+    helper = TelegramHelper()
+    payloads = {family: (operate_code, payload) for family, operate_code, payload in FRAMES}
+    benchmarks = {}
+
+    for family, operate_code, payload in FRAMES:
+        frame = received_frame((1, 10), operate_code, (255, 255), payload)
+        benchmarks[f"decode.{family}"] = lambda frame=frame: helper.build_telegram_from_udp_data(frame, GATEWAY)
+
+    for family, operate_code, payload in FRAMES:
+        telegram = _telegram((1, 10), operate_code, payload, (1, 20))
+        benchmarks[f"encode.{family}"] = lambda telegram=telegram: helper.build_send_buffer(telegram)
+
+    for name, control_object in _controls(buspro).items():
+        benchmarks[f"control.{name}"] = lambda control_object=control_object: control_object.build_telegram_from_control(control_object)
+
+    for module in range(DIMMER_MODULES):
+        for channel in range(1, CHANNELS_PER_MODULE + 1):
+            Light(buspro, (1, 10 + module), channel)
+    for family in ("channel_status", "channel_control", "time_broadcast"):
+        telegram = _telegram((1, 10), *payloads[family])
+        benchmarks[f"dispatch.{family}"] = lambda telegram=telegram: buspro._callback_all_messages(telegram)
+    telegram = _telegram((1, 250), *payloads["channel_status"])
+    benchmarks["dispatch.unregistered_source"] = lambda telegram=telegram: buspro._callback_all_messages(telegram)
+
+    # The receive.* pairs price the metrics, latency, utilisation and frame log updates per frame
+    with_metrics = NetworkInterface(GATEWAY, buspro.loop, buspro.metrics, buspro.latency, buspro.utilisation, buspro.frame_log)
+    without_metrics = NetworkInterface(GATEWAY, buspro.loop)
+    for network_interface in (with_metrics, without_metrics):
+        network_interface.register_callback(buspro._callback_all_messages)
+    for family in ("channel_status", "12in1"):
+        operate_code, payload = payloads[family]
+        frame = received_frame((1, 10), operate_code, (255, 255), payload)
+        benchmarks[f"receive.{family}"] = lambda frame=frame: with_metrics._udp_request_received(frame, GATEWAY)
+        benchmarks[f"receive.{family}.no_metrics"] = lambda frame=frame: without_metrics._udp_request_received(frame, GATEWAY)
+
+    for name, (sensor, family) in _sensors(buspro).items():
+        telegram = _telegram(SENSOR_ADDRESS, *payloads[family])
+        benchmarks[f"sensor.{name}"] = lambda sensor=sensor, telegram=telegram: sensor._telegram_received_cb(telegram)
+
+    return benchmarks
+
+
+async def _drain():
+    """Run the update tasks the timed code scheduled."""
+    current = asyncio.current_task()
+    while any(task is not current for task in asyncio.all_tasks()):
+        await asyncio.sleep(0)
+
+
+def _cancel_background_tasks():
+    current = asyncio.current_task()
+    for task in asyncio.all_tasks():
+        if task is not current:
+            task.cancel()
+
+
+async def run_benchmarks(name_filter=None, min_time=DEFAULT_MIN_TIME, repeat=DEFAULT_REPEAT):
+    loop = asyncio.get_running_loop()
+    buspro = Buspro((GATEWAY, ("", GATEWAY[1])), loop)
+    benchmarks = build_benchmarks(buspro)
+    # Initial status reads scheduled by the devices are not part of any benchmark
+    _cancel_background_tasks()
+    await asyncio.sleep(0)
+
+    results = {}
+    for name, function in benchmarks.items():
+        if name_filter and name_filter not in name:
+            continue
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        number = max(1, int(number * min_time / 0.2))
+        best = None
+        for _ in range(repeat):
+            elapsed = timer.timeit(number)
+            await _drain()
+            best = elapsed if best is None else min(best, elapsed)
+        per_op = best / number
+        results[name] = {"us_per_op": round(per_op * 1e6, 3), "ops_per_second": round(1 / per_op)}
+        print(f"{name:40} {per_op * 1e6:10.3f} us {1 / per_op:14,.0f} /s")
+    return results
+
+
+def compare(baseline, current, threshold):
+    """Print the throughput change of every benchmark; return the names that regressed beyond threshold percent."""
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:40} {'new':>10}")
+            continue
+        change = (result["ops_per_second"] - base["ops_per_second"]) / base["ops_per_second"] * 100
+        regressed = change < -threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:40} {base['ops_per_second']:12,} -> {result['ops_per_second']:12,} /s {change:+7.1f}%{'  REGRESSION' if regressed else ''}")
+    missing = baseline["results"].keys() - current["results"].keys()
+    if missing and not current.get("filter"):
+        print(f"Not in the current results: {', '.join(sorted(missing))}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pybuspro decode, encode and dispatch paths.")
+    parser.add_argument("--output", help="save results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results to compare against")
+    parser.add_argument("--input", help="compare these saved results instead of running the benchmarks")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed throughput drop in percent")
+    parser.add_argument("--filter", help="run only benchmarks whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="seconds per repeat")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input) as file:
+            current = json.load(file)
+    else:
+        results = asyncio.run(run_benchmarks(args.filter, args.min_time, args.repeat))
+        current = {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "filter": args.filter,
+            "results": results,
+        }
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(current, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmarks regressed by more than {args.threshold}%: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
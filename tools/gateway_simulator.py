@@ -0,0 +1,566 @@
+"""HDL Buspro gateway simulator.
+
+Listens for UDP frames like an HDL IP gateway and answers them on behalf of simulated modules:
+dimmers, relays, 12in1 sensors, sensors-in-one, FHM floor heating, curtain and security modules.
+Sensors broadcast their status periodically and --activity adds random channel changes, as if
+someone pressed wall panels. Frames carry the HDL header and CRC the integration expects.
+
+The simulated bus is a single 9600 baud line: requests and responses occupy it one after another,
+so responses are delayed when the integration sends faster than the bus carries frames, and
+requests are dropped once more than --max-backlog seconds of traffic are waiting. --latency,
+--jitter and --loss add module processing time and lost frames.
+
+Run it on its own address and point the integration at it, on a single box:
+
+    python tools/gateway_simulator.py --listen 127.0.0.2:6000 --dimmers 4 --relays 2 --sensors 2
+
+and configure the integration with gateway 127.0.0.2 and port 6000. Module addresses are printed
+at start. Replies go to the address each request came from, broadcasts to every client seen.
+Only the Python standard library is needed.
+"""
+import argparse
+import asyncio
+import logging
+import random
+import signal
+import socket
+import struct
+import time
+
+_LOGGER = logging.getLogger("gateway_simulator")
+
+HDL_HEADER = b'\xC0\xA8\x01\x0FHDLMIRACLE\xAA\xAA'
+# Bytes of a UDP frame that do not travel on the bus (IP address and HDLMIRACLE)
+UDP_HEADER_LENGTH = 14
+BUS_BITS_PER_BYTE = 10
+BROADCAST = (255, 255)
+SUCCESS = 0xF8
+
+
+def _crc_table():
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else crc << 1
+        table.append(crc & 0xFFFF)
+    return table
+
+
+_CRC_TABLE = _crc_table()
+
+
+def crc16(data):
+    """CRC-16/XMODEM, as used by the HDL bus."""
+    crc = 0
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ _CRC_TABLE[(crc >> 8) ^ byte]
+    return crc
+
+
+def build_frame(source_address, device_type, operate_code, target_address, payload):
+    body = bytes([11 + len(payload), source_address[0], source_address[1]]) + device_type \
+        + struct.pack(">H", operate_code) + bytes(target_address) + bytes(payload)
+    return HDL_HEADER + body + struct.pack(">H", crc16(body))
+
+
+def parse_frame(data):
+    """Return (source address, operate code, target address, payload), or None for a bad frame."""
+    # The first four bytes are the IP address of the sender
+    if len(data) < 27 or data[4:16] != HDL_HEADER[4:]:
+        return None
+    length = data[16]
+    if len(data) < 16 + length or crc16(data[16:16 + length - 2]) != struct.unpack_from(">H", data, 16 + length - 2)[0]:
+        return None
+    operate_code = struct.unpack_from(">H", data, 21)[0]
+    return (data[17], data[18]), operate_code, (data[23], data[24]), list(data[25:16 + length - 2])
+
+
+# Operate codes answered by the simulated modules
+SINGLE_CHANNEL_CONTROL = 0x0031
+READ_STATUS_OF_CHANNELS = 0x0033
+SCENE_CONTROL = 0x0002
+UNIVERSAL_SWITCH_CONTROL = 0xE01C
+READ_STATUS_OF_UNIVERSAL_SWITCH = 0xE018
+READ_12IN1_SENSOR_STATUS = 0x1645
+BROADCAST_12IN1_SENSOR_STATUS = 0x1647
+READ_SENSORS_IN_ONE_STATUS = 0x1604
+BROADCAST_SENSORS_IN_ONE_STATUS = 0x1630
+READ_TEMPERATURE_STATUS = 0xE3E7
+FHM_READ_FLOOR_HEATING_STATUS = 0x1C5E
+FHM_CONTROL_FLOOR_HEATING_STATUS = 0x1C5C
+CURTAIN_SWITCH_CONTROL = 0xE3E0
+READ_STATUS_OF_CURTAIN_SWITCH = 0xE3E2
+READ_SECURITY_MODULE = 0x011E
+ARM_SECURITY_MODULE = 0x0104
+MODIFY_SYSTEM_DATE_AND_TIME = 0xDA02
+
+
+class Module:
+    """A simulated module; handle() returns the (operate code, payload) responses to a request."""
+
+    device_type = b'\x00\x00'
+    kind = "module"
+
+    def __init__(self, address):
+        self.address = address
+
+    def handle(self, operate_code, payload):
+        handler = self._handlers.get(operate_code)
+        if handler is None:
+            return []
+        return handler(self, payload)
+
+    def broadcasts(self):
+        """Return the (operate code, payload) frames the module sends unprompted every broadcast interval."""
+        return []
+
+    def activity(self, rng):
+        """Return the frames of a random local change, like a wall panel press."""
+        return []
+
+    def _modify_time(self, payload):
+        return [(MODIFY_SYSTEM_DATE_AND_TIME + 1, [SUCCESS])]
+
+    _handlers = {}
+
+
+class ChannelModule(Module):
+    """Dimmer or relay with numbered output channels, scenes and universal switches."""
+
+    def __init__(self, address, channels, dimmable, initial_level=0):
+        super().__init__(address)
+        self.dimmable = dimmable
+        self.levels = [self._level(initial_level)] * channels
+        self.universal_switches = {}
+        self.device_type = b'\x02\x6D' if dimmable else b'\x01\xAC'
+        self.kind = f"{'dimmer' if dimmable else 'relay'} {channels}ch"
+
+    def _level(self, level):
+        level = max(0, min(level, 100))
+        return level if self.dimmable else (100 if level else 0)
+
+    def _channel_response(self, channel):
+        on_mask = sum(1 << index for index, level in enumerate(self.levels) if level)
+        return (SINGLE_CHANNEL_CONTROL + 1,
+                [channel, SUCCESS, self.levels[channel - 1], len(self.levels)] + list(on_mask.to_bytes((len(self.levels) + 7) // 8, "little")))
+
+    def _single_channel_control(self, payload):
+        channel = payload[0] if payload else 0
+        if not 1 <= channel <= len(self.levels) or len(payload) < 2:
+            return []
+        self.levels[channel - 1] = self._level(payload[1])
+        return [self._channel_response(channel)]
+
+    def _read_status(self, payload):
+        return [(READ_STATUS_OF_CHANNELS + 1, [len(self.levels)] + self.levels)]
+
+    def _scene_control(self, payload):
+        if len(payload) < 2:
+            return []
+        area, scene = payload[0], payload[1]
+        # Scene n of any area sets every channel to a level derived from n; scene 0 is all off
+        for index in range(len(self.levels)):
+            self.levels[index] = self._level((scene * 10 + index * 5) % 101 if scene else 0)
+        return [(SCENE_CONTROL + 1, [area, scene])]
+
+    def _universal_switch(self, payload):
+        if len(payload) < 2:
+            return []
+        self.universal_switches[payload[0]] = 1 if payload[1] else 0
+        return [(UNIVERSAL_SWITCH_CONTROL + 1, [payload[0], self.universal_switches[payload[0]]])]
+
+    def _read_universal_switch(self, payload):
+        if not payload:
+            return []
+        return [(READ_STATUS_OF_UNIVERSAL_SWITCH + 1, [payload[0], self.universal_switches.get(payload[0], 0)])]
+
+    def activity(self, rng):
+        channel = rng.randrange(len(self.levels)) + 1
+        self.levels[channel - 1] = 0 if self.levels[channel - 1] else self._level(rng.randrange(1, 101))
+        return [self._channel_response(channel)]
+
+    _handlers = {
+        SINGLE_CHANNEL_CONTROL: _single_channel_control,
+        READ_STATUS_OF_CHANNELS: _read_status,
+        SCENE_CONTROL: _scene_control,
+        UNIVERSAL_SWITCH_CONTROL: _universal_switch,
+        READ_STATUS_OF_UNIVERSAL_SWITCH: _read_universal_switch,
+        MODIFY_SYSTEM_DATE_AND_TIME: Module._modify_time,
+    }
+
+
+class TwelveInOneSensor(Module):
+    device_type = b'\x01\x34'
+    kind = "12in1 sensor"
+
+    def __init__(self, address):
+        super().__init__(address)
+        self.temperature = 22
+        self.brightness = 300
+        self.motion = 0
+
+    def _status(self):
+        # success, temperature + 20, brightness, motion, sonic, dry contact 1, dry contact 2
+        return list(struct.pack(">BBHBBBB", SUCCESS, self.temperature + 20, self.brightness, self.motion, 0, 0, 0))
+
+    def _read_status(self, payload):
+        return [(READ_12IN1_SENSOR_STATUS + 1, self._status())]
+
+    def broadcasts(self):
+        return [(BROADCAST_12IN1_SENSOR_STATUS, self._status())]
+
+    def activity(self, rng):
+        self.motion = 1 - self.motion
+        self.brightness = rng.randrange(0, 1000)
+        return self.broadcasts()
+
+    _handlers = {READ_12IN1_SENSOR_STATUS: _read_status}
+
+
+class SensorsInOne(Module):
+    device_type = b'\x01\x50'
+    kind = "sensors-in-one"
+
+    def __init__(self, address):
+        super().__init__(address)
+        self.temperature = 21
+        self.brightness = 250
+        self.humidity = 45
+        self.motion = 0
+
+    def _status(self):
+        # pad, temperature + 20, brightness, humidity, 2 pad bytes, motion, dry contact 1, dry contact 2
+        return list(struct.pack(">xBHBxxBBB", self.temperature + 20, self.brightness, self.humidity, self.motion, 0, 0))
+
+    def _read_status(self, payload):
+        return [(READ_SENSORS_IN_ONE_STATUS + 1, self._status())]
+
+    def _read_temperature(self, payload):
+        return [(READ_TEMPERATURE_STATUS + 1, [payload[0] if payload else 1, self.temperature])]
+
+    def broadcasts(self):
+        return [(BROADCAST_SENSORS_IN_ONE_STATUS, self._status())]
+
+    def activity(self, rng):
+        self.motion = 1 - self.motion
+        self.humidity = rng.randrange(30, 70)
+        return self.broadcasts()
+
+    _handlers = {
+        READ_SENSORS_IN_ONE_STATUS: _read_status,
+        READ_TEMPERATURE_STATUS: _read_temperature,
+    }
+
+
+class FloorHeatingModule(Module):
+    device_type = b'\x00\x11'
+    kind = "FHM floor heating 8ch"
+
+    def __init__(self, address, channels=8):
+        super().__init__(address)
+        # work byte (work type << 4 | status), temperature type, mode, normal, day, night, away
+        self.channels = {channel: [0x01, 0, 1, 22, 23, 19, 16] for channel in range(1, channels + 1)}
+        self.current_temperature = 21
+
+    def _status(self, channel, operate_code):
+        work, temperature_type, mode, normal, day, night, away = self.channels[channel]
+        valve = 1 if work & 0x0F and self.current_temperature < normal else 0
+        return (operate_code, [channel, work, temperature_type, mode, normal, day, night, away, 0,
+                               self.current_temperature & 0x7F, valve])
+
+    def _read_status(self, payload):
+        if not payload or payload[0] not in self.channels:
+            return []
+        return [self._status(payload[0], FHM_READ_FLOOR_HEATING_STATUS + 1)]
+
+    def _control(self, payload):
+        if len(payload) < 8 or payload[0] not in self.channels:
+            return []
+        self.channels[payload[0]] = list(payload[1:8])
+        return [self._status(payload[0], FHM_CONTROL_FLOOR_HEATING_STATUS + 1)]
+
+    _handlers = {
+        FHM_READ_FLOOR_HEATING_STATUS: _read_status,
+        FHM_CONTROL_FLOOR_HEATING_STATUS: _control,
+        MODIFY_SYSTEM_DATE_AND_TIME: Module._modify_time,
+    }
+
+
+class CurtainModule(Module):
+    device_type = b'\x02\xD8'
+    kind = "curtain 2ch"
+
+    def __init__(self, address):
+        super().__init__(address)
+        self.states = {1: 0, 2: 0}
+
+    def _control(self, payload):
+        if len(payload) < 2:
+            return []
+        # Channels 3 and 4 step channels 1 and 2
+        channel = payload[0] - 2 if payload[0] in (3, 4) else payload[0]
+        if channel not in self.states:
+            return []
+        self.states[channel] = payload[1]
+        return [(CURTAIN_SWITCH_CONTROL + 1, [channel, payload[1]])]
+
+    def _read_status(self, payload):
+        if not payload or payload[0] not in self.states:
+            return []
+        return [(READ_STATUS_OF_CURTAIN_SWITCH + 1, [payload[0], self.states[payload[0]]])]
+
+    _handlers = {
+        CURTAIN_SWITCH_CONTROL: _control,
+        READ_STATUS_OF_CURTAIN_SWITCH: _read_status,
+    }
+
+
+class SecurityModule(Module):
+    device_type = b'\x0B\xE9'
+    kind = "security 8 areas"
+
+    def __init__(self, address):
+        super().__init__(address)
+        # area -> status; 6 is disarmed
+        self.areas = {area: 6 for area in range(1, 9)}
+
+    def _read_status(self, payload):
+        if not payload or payload[0] not in self.areas:
+            return []
+        return [(READ_SECURITY_MODULE + 1, [payload[0], self.areas[payload[0]]])]
+
+    def _arm(self, payload):
+        if len(payload) < 2 or payload[0] not in self.areas:
+            return []
+        self.areas[payload[0]] = payload[1]
+        return [(ARM_SECURITY_MODULE + 1, [payload[0], payload[1]])]
+
+    _handlers = {
+        READ_SECURITY_MODULE: _read_status,
+        ARM_SECURITY_MODULE: _arm,
+        MODIFY_SYSTEM_DATE_AND_TIME: Module._modify_time,
+    }
+
+
+class GatewaySimulator(asyncio.DatagramProtocol):
+    """UDP endpoint answering for the simulated modules over a rate-limited bus."""
+
+    def __init__(self, modules, loop, latency=0.02, jitter=0.0, loss=0.0, baud_rate=9600,
+                 max_backlog=1.0, broadcast_interval=30.0, activity=0.0, seed=None):
+        self.modules = {module.address: module for module in modules}
+        self._loop = loop
+        self._latency = latency
+        self._jitter = jitter
+        self._loss = loss
+        self._baud_rate = baud_rate
+        self._max_backlog = max_backlog
+        self._broadcast_interval = broadcast_interval
+        self._activity = activity
+        self._rng = random.Random(seed)
+        self._transport = None
+        self._clients = set()
+        self._bus_free_at = 0.0
+        self._tasks = []
+        self.stats = {"received": 0, "bad_frames": 0, "answered": 0, "sent": 0, "lost": 0, "overflow": 0, "bus_seconds": 0.0}
+        self._started = time.monotonic()
+
+    def connection_made(self, transport):
+        self._transport = transport
+        if self._broadcast_interval:
+            self._tasks.append(self._loop.create_task(self._broadcast_loop()))
+        if self._activity:
+            self._tasks.append(self._loop.create_task(self._activity_loop()))
+
+    def connection_lost(self, exc):
+        for task in self._tasks:
+            task.cancel()
+
+    def _occupy_bus(self, frame_length, not_before):
+        """Reserve the bus for a frame from not_before on; return when it has passed, or None if the backlog is full."""
+        now = self._loop.time()
+        start = max(not_before, self._bus_free_at, now)
+        if start - now > self._max_backlog:
+            self.stats["overflow"] += 1
+            return None
+        duration = max(frame_length - UDP_HEADER_LENGTH, 0) * BUS_BITS_PER_BYTE / self._baud_rate if self._baud_rate else 0.0
+        self._bus_free_at = start + duration
+        self.stats["bus_seconds"] += duration
+        return self._bus_free_at
+
+    def _lost(self):
+        if self._loss and self._rng.random() < self._loss:
+            self.stats["lost"] += 1
+            return True
+        return False
+
+    def datagram_received(self, data, address):
+        self.stats["received"] += 1
+        parsed = parse_frame(data)
+        if parsed is None:
+            self.stats["bad_frames"] += 1
+            return
+        self._clients.add(address)
+        source_address, operate_code, target_address, payload = parsed
+        if self._lost():
+            return
+        delivered_at = self._occupy_bus(len(data), self._loop.time())
+        if delivered_at is None:
+            return
+
+        if target_address == BROADCAST:
+            return
+        module = self.modules.get(target_address)
+        if module is None:
+            return
+        responses = module.handle(operate_code, payload)
+        if responses:
+            self.stats["answered"] += 1
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(f"{target_address[0]}.{target_address[1]} does not answer 0x{operate_code:04X} {payload}")
+        delay = self._latency + (self._rng.uniform(0, self._jitter) if self._jitter else 0.0)
+        for response_code, response_payload in responses:
+            frame = build_frame(module.address, module.device_type, response_code, source_address, response_payload)
+            self._send_on_bus(frame, [address], delivered_at + delay)
+
+    def _send_on_bus(self, frame, addresses, not_before):
+        if self._lost():
+            return
+        on_wire_at = self._occupy_bus(len(frame), not_before)
+        if on_wire_at is None:
+            return
+        self._loop.call_at(on_wire_at, self._send, frame, addresses)
+
+    def _send(self, frame, addresses):
+        for address in addresses:
+            self._transport.sendto(frame, address)
+        self.stats["sent"] += 1
+
+    def _emit(self, module, frames):
+        if not self._clients:
+            return
+        for operate_code, payload in frames:
+            frame = build_frame(module.address, module.device_type, operate_code, BROADCAST, payload)
+            self._send_on_bus(frame, list(self._clients), self._loop.time())
+
+    async def _broadcast_loop(self):
+        while True:
+            await asyncio.sleep(self._broadcast_interval)
+            for module in self.modules.values():
+                self._emit(module, module.broadcasts())
+
+    async def _activity_loop(self):
+        modules = [module for module in self.modules.values() if type(module).activity is not Module.activity]
+        if not modules:
+            return
+        while True:
+            await asyncio.sleep(self._rng.expovariate(self._activity))
+            module = self._rng.choice(modules)
+            self._emit(module, module.activity(self._rng))
+
+    def report(self):
+        elapsed = time.monotonic() - self._started
+        occupancy = self.stats["bus_seconds"] / elapsed * 100 if elapsed > 0 else 0.0
+        return f"{', '.join(f'{key} {value}' for key, value in self.stats.items() if key != 'bus_seconds')}, bus occupancy {occupancy:.1f}%"
+
+
+def build_modules(args):
+    """Create the modules args ask for, numbered from --first-device and continuing on the next subnet after device 254."""
+    modules = []
+    subnet_id = args.subnet
+    device_id = args.first_device
+
+    def add(module_type, count, *extra):
+        nonlocal subnet_id, device_id
+        for _ in range(count):
+            if device_id > 254:
+                subnet_id += 1
+                device_id = args.first_device
+            modules.append(module_type((subnet_id, device_id), *extra))
+            device_id += 1
+
+    add(ChannelModule, args.dimmers, args.dimmer_channels, True, args.initial_level)
+    add(ChannelModule, args.relays, args.relay_channels, False, args.initial_level)
+    add(TwelveInOneSensor, args.sensors)
+    add(SensorsInOne, args.sensors_in_one)
+    add(FloorHeatingModule, args.floor_heating)
+    add(CurtainModule, args.curtains)
+    add(SecurityModule, args.security)
+    if subnet_id > 254:
+        raise SystemExit("Too many modules")
+    return modules
+
+
+def _address(value):
+    host, _, port = value.rpartition(":")
+    return host or "0.0.0.0", int(port)
+
+
+async def run(args):
+    loop = asyncio.get_running_loop()
+    modules = build_modules(args)
+    for module in modules:
+        print(f"{module.address[0]}.{module.address[1]}: {module.kind}")
+    simulator = GatewaySimulator(
+        modules, loop, latency=args.latency / 1000, jitter=args.jitter / 1000, loss=args.loss,
+        baud_rate=args.baud, max_backlog=args.max_backlog, broadcast_interval=args.broadcast_interval,
+        activity=args.activity, seed=args.seed)
+    # SO_REUSEADDR lets the simulator share the port with an integration bound to all addresses
+    # on the same box; datagrams to the simulator's own address still reach only the simulator
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    sock.bind(_address(args.listen))
+    transport, _ = await loop.create_datagram_endpoint(lambda: simulator, sock=sock)
+    print(f"Listening on {args.listen}", flush=True)
+
+    stop = asyncio.Event()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, stop.set)
+    try:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), args.report_interval or None)
+            except asyncio.TimeoutError:
+                print(simulator.report())
+    finally:
+        transport.close()
+        print(simulator.report())
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Simulate an HDL Buspro gateway and modules over UDP.")
+    parser.add_argument("--listen", default="127.0.0.2:6000", help="address:port to listen on")
+    parser.add_argument("--subnet", type=int, default=1)
+    parser.add_argument("--first-device", type=int, default=10, help="device id of the first module")
+    parser.add_argument("--dimmers", type=int, default=2)
+    parser.add_argument("--dimmer-channels", type=int, default=6)
+    parser.add_argument("--relays", type=int, default=2)
+    parser.add_argument("--relay-channels", type=int, default=12)
+    parser.add_argument("--initial-level", type=int, default=0, help="level all dimmer and relay channels start at")
+    parser.add_argument("--sensors", type=int, default=1, help="12in1 sensors")
+    parser.add_argument("--sensors-in-one", type=int, default=1)
+    parser.add_argument("--floor-heating", type=int, default=1)
+    parser.add_argument("--curtains", type=int, default=1)
+    parser.add_argument("--security", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=20.0, help="module processing time in ms")
+    parser.add_argument("--jitter", type=float, default=10.0, help="random extra processing time in ms")
+    parser.add_argument("--loss", type=float, default=0.0, help="probability of losing each frame")
+    parser.add_argument("--baud", type=int, default=9600, help="bus rate, 0 for unlimited")
+    parser.add_argument("--max-backlog", type=float, default=1.0, help="seconds of queued bus traffic before frames are dropped")
+    parser.add_argument("--broadcast-interval", type=float, default=30.0, help="seconds between sensor broadcasts, 0 to disable")
+    parser.add_argument("--activity", type=float, default=0.0, help="random local changes per second")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--report-interval", type=float, default=10.0, help="seconds between statistics lines, 0 to disable")
+    parser.add_argument("--verbose", action="store_true")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
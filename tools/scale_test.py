@@ -0,0 +1,322 @@
+"""End-to-end scale test of the integration against the gateway simulator.
+
+Boots a headless Home Assistant in a temporary config directory, starts tools/gateway_simulator.py
+in a subprocess with enough modules for the requested entity counts, sets up buspro with generated
+light, switch, sensor and climate configurations pointing at the simulator, and measures:
+
++ time to hydrate: from the start of setup until every entity shows the state the simulated
+  modules hold (lights and switches on, sensors with a value, climates with a temperature)
++ steady-state CPU: process CPU time per second of wall time over --steady-seconds once hydrated
++ memory per entity: growth of the resident set from the empty Home Assistant to hydration
++ poll lag: how far behind its schedule the oldest due entity of the Scheduler is, sampled every
+  second of the steady window
++ command latency: time from a light.turn_on call to the module's SingleChannelControlResponse
+
+Run from the repository root where Home Assistant is installed:
+
+    python tools/scale_test.py --lights 1200 --switches 480 --sensors 200 --climates 120 --output scale.json
+
+Needs Home Assistant 2025.4 or later (the sensor platform imports UnitOfReactivePower), its
+frontend package and crcmod installed, for example
+`pip install homeassistant home-assistant-frontend crcmod` in a Python 3.13 environment.
+
+Entities hydrate at the pace of the Scheduler, one entity read per second plus whatever the
+responses and broadcasts of the modules fill in, so hydration can take up to about a second per
+entity. Without --hydrate-timeout the harness waits HYDRATE_SECONDS_PER_ENTITY per entity, at
+least MIN_HYDRATE_TIMEOUT; if that still runs out, hydrate_seconds is null and
+hydrated_entities says how far it got.
+
+The simulator gets the gateway options of the test (--latency, --loss, --baud, ...) through
+--simulator-args, for example --simulator-args="--loss 0.01 --jitter 20". Linux only: memory is
+read from /proc.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(TOOLS_DIR)
+sys.path.insert(0, TOOLS_DIR)
+
+import gateway_simulator  # noqa: E402
+
+NAME_PREFIX = "scale"
+SINGLE_CHANNEL_CONTROL_RESPONSE = b'\x00\x32'
+# Level the simulated channels start at, so hydrated lights and switches are on
+INITIAL_LEVEL = 50
+# Default hydration timeout: the Scheduler reads one entity per second, plus headroom
+HYDRATE_SECONDS_PER_ENTITY = 1.5
+MIN_HYDRATE_TIMEOUT = 600.0
+
+
+def rss_bytes():
+    with open("/proc/self/statm") as file:
+        return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _percentiles(values):
+    if not values:
+        return {"p50": None, "p95": None, "max": None}
+    values = sorted(values)
+    return {
+        "p50": round(statistics.median(values), 3),
+        "p95": round(values[min(len(values) - 1, int(len(values) * 0.95))], 3),
+        "max": round(values[-1], 3),
+    }
+
+
+def simulator_arguments(args):
+    """Return the simulator command line for the modules the entity counts need."""
+    per_dimmer = args.dimmer_channels
+    per_relay = args.relay_channels
+    return [
+        "--listen", f"{args.gateway}:{args.port}",
+        "--dimmers", str(-(-args.lights // per_dimmer)),
+        "--dimmer-channels", str(per_dimmer),
+        "--relays", str(-(-args.switches // per_relay)),
+        "--relay-channels", str(per_relay),
+        "--initial-level", str(INITIAL_LEVEL),
+        # Two sensor entities (temperature and illuminance) per 12in1 module
+        "--sensors", str(-(-args.sensors // 2)),
+        "--sensors-in-one", "0",
+        "--floor-heating", str(-(-args.climates // 8)),
+        "--curtains", "0",
+        "--security", "0",
+        "--report-interval", "0",
+    ] + args.simulator_args.split()
+
+
+def build_config(modules, args):
+    """Return (platform configurations by domain, expected entity names by domain)."""
+    lights, switches, sensors, climates = {}, {}, [], []
+    for module in modules:
+        subnet_id, device_id = module.address
+        if isinstance(module, gateway_simulator.ChannelModule):
+            target, wanted = (lights, args.lights) if module.dimmable else (switches, args.switches)
+            for channel in range(1, len(module.levels) + 1):
+                if len(target) < wanted:
+                    kind = "light" if module.dimmable else "switch"
+                    target[f"{subnet_id}.{device_id}.{channel}"] = {"name": f"{NAME_PREFIX} {kind} {subnet_id} {device_id} {channel}"}
+        elif isinstance(module, gateway_simulator.TwelveInOneSensor):
+            for sensor_type in ("temperature", "illuminance"):
+                if len(sensors) < args.sensors:
+                    sensors.append({"address": f"{subnet_id}.{device_id}", "name": f"{NAME_PREFIX} {sensor_type} {subnet_id} {device_id}",
+                                    "type": sensor_type, "device": "12in1"})
+        elif isinstance(module, gateway_simulator.FloorHeatingModule):
+            for channel in module.channels:
+                if len(climates) < args.climates:
+                    climates.append({"address": f"{subnet_id}.{device_id}.{channel}", "name": f"{NAME_PREFIX} climate {subnet_id} {device_id} {channel}",
+                                     "device": "floor_heating"})
+
+    platforms = {
+        "light": {"platform": "buspro", "devices": lights},
+        "switch": {"platform": "buspro", "devices": switches},
+        "sensor": {"platform": "buspro", "devices": sensors},
+        "climate": {"platform": "buspro", "devices": climates},
+    }
+    names = {
+        "light": [device["name"] for device in lights.values()],
+        "switch": [device["name"] for device in switches.values()],
+        "sensor": [device["name"] for device in sensors],
+        "climate": [device["name"] for device in climates],
+    }
+    return platforms, names
+
+
+def _hydrated(state):
+    if state is None:
+        return False
+    domain = state.domain
+    if domain in ("light", "switch"):
+        return state.state == "on"
+    if domain == "sensor":
+        return state.state not in ("unknown", "unavailable")
+    if domain == "climate":
+        return state.attributes.get("current_temperature") is not None
+    return True
+
+
+def _save(path, result):
+    with open(path, "w") as file:
+        json.dump(result, file, indent=2)
+
+
+async def _setup_hass(config_dir):
+    from homeassistant import bootstrap
+    from homeassistant.runner import RuntimeConfig
+
+    os.makedirs(os.path.join(config_dir, "custom_components"))
+    os.symlink(os.path.join(REPO_DIR, "custom_components", "buspro"), os.path.join(config_dir, "custom_components", "buspro"))
+    with open(os.path.join(config_dir, "configuration.yaml"), "w") as file:
+        file.write("homeassistant:\n  name: Buspro scale test\n  time_zone: UTC\n")
+    hass = await bootstrap.async_setup_hass(RuntimeConfig(config_dir=config_dir, skip_pip=True))
+    if hass is None:
+        raise SystemExit("Home Assistant failed to start")
+    return hass
+
+
+async def _wait_hydrated(hass, entity_ids, timeout):
+    """Return seconds until all entity_ids are hydrated (None on timeout) and how many are."""
+    started = time.monotonic()
+    pending = set(entity_ids)
+    while pending and time.monotonic() - started < timeout:
+        pending = {entity_id for entity_id in pending if not _hydrated(hass.states.get(entity_id))}
+        if pending:
+            await asyncio.sleep(0.5)
+    return (None if pending else time.monotonic() - started), len(entity_ids) - len(pending)
+
+
+def _poll_lag(scheduler, now):
+    """Seconds the oldest due entity of the scheduler is overdue, and how many entities are due.
+
+    Scans the whole heaps: between two Scheduler ticks a heap top need not be the oldest entry.
+    """
+    due_times = [info.next_read_time for heap in (scheduler._periodic_heap, scheduler._optional_heap)
+                 for info in heap if info.next_read_time <= now]
+    return (now - min(due_times) if due_times else 0.0), len(due_times)
+
+
+async def _measure_steady(hass, scheduler, seconds):
+    loop = asyncio.get_running_loop()
+    lags = []
+    due = 0
+    cpu_started = time.process_time()
+    wall_started = time.monotonic()
+    for _ in range(int(seconds)):
+        await asyncio.sleep(1)
+        lag, due = _poll_lag(scheduler, loop.time())
+        lags.append(lag)
+    wall = time.monotonic() - wall_started
+    cpu = time.process_time() - cpu_started
+    return {
+        "cpu_seconds_per_second": round(cpu / wall, 4),
+        "poll_lag_seconds": _percentiles(lags),
+        "due_entities_at_end": due,
+    }
+
+
+async def _measure_commands(hass, hdl, light_ids, addresses, count, timeout):
+    loop = asyncio.get_running_loop()
+    call_times = []
+    latencies = []
+    timeouts = 0
+    for index in range(min(count, len(light_ids))):
+        entity_id = light_ids[index * len(light_ids) // count]
+        address = addresses[entity_id]
+        response = hdl.expect_response(address, SINGLE_CHANNEL_CONTROL_RESPONSE)
+        started = loop.time()
+        await hass.services.async_call("light", "turn_on", {"entity_id": entity_id, "brightness": 50 + index % 200}, blocking=True)
+        call_times.append(loop.time() - started)
+        try:
+            _, received_at = await asyncio.wait_for(asyncio.shield(response), timeout)
+            latencies.append(received_at - started)
+        except asyncio.TimeoutError:
+            hdl.discard_response(address, SINGLE_CHANNEL_CONTROL_RESPONSE, response)
+            timeouts += 1
+        await asyncio.sleep(0.2)
+    return {
+        "commands": len(call_times),
+        "service_call_seconds": _percentiles(call_times),
+        "response_seconds": _percentiles(latencies),
+        "timeouts": timeouts,
+    }
+
+
+async def run(args):
+    from homeassistant.setup import async_setup_component
+    from homeassistant.util import slugify
+
+    simulator_argv = simulator_arguments(args)
+    modules = gateway_simulator.build_modules(gateway_simulator.build_parser().parse_args(simulator_argv))
+    platforms, names = build_config(modules, args)
+    entity_ids = [f"{domain}.{slugify(name)}" for domain, domain_names in names.items() for name in domain_names]
+    light_ids = [f"light.{slugify(name)}" for name in names["light"]]
+    light_addresses = {f"light.{slugify(device['name'])}": tuple(int(part) for part in address.split(".")[:2])
+                       for address, device in platforms["light"]["devices"].items()}
+
+    simulator = subprocess.Popen([sys.executable, os.path.join(TOOLS_DIR, "gateway_simulator.py")] + simulator_argv,
+                                 stdout=subprocess.PIPE, text=True)
+    for line in simulator.stdout:
+        if line.startswith("Listening"):
+            break
+    else:
+        raise SystemExit("Gateway simulator failed to start")
+    config_dir = tempfile.mkdtemp(prefix="buspro_scale_")
+    hass = None
+    try:
+        hass = await _setup_hass(config_dir)
+        rss_empty = rss_bytes()
+        print(f"{len(modules)} simulated modules, {len(entity_ids)} entities; config in {config_dir}")
+
+        setup_started = time.monotonic()
+        if not await async_setup_component(hass, "buspro", {"buspro": {"broadcast_address": args.gateway, "broadcast_port": args.port}}):
+            raise SystemExit("buspro failed to set up")
+        for domain, platform_config in platforms.items():
+            if platform_config["devices"]:
+                await async_setup_component(hass, domain, {domain: [platform_config]})
+        await hass.async_start()
+        setup_seconds = time.monotonic() - setup_started
+
+        hydrate_timeout = args.hydrate_timeout or max(MIN_HYDRATE_TIMEOUT, HYDRATE_SECONDS_PER_ENTITY * len(entity_ids))
+        hydrate_seconds, hydrated = await _wait_hydrated(hass, entity_ids, hydrate_timeout)
+        if hydrate_seconds is not None:
+            hydrate_seconds += setup_seconds
+        rss_hydrated = rss_bytes()
+        print(f"hydrated {hydrated}/{len(entity_ids)} in {hydrate_seconds if hydrate_seconds is not None else '>' + str(hydrate_timeout)} s")
+
+        module = hass.data["buspro"]
+        steady = await _measure_steady(hass, module.scheduler, args.steady_seconds)
+        commands = await _measure_commands(hass, module.hdl, light_ids, light_addresses, args.commands, args.command_timeout)
+
+        result = {
+            "entities": {domain: len(domain_names) for domain, domain_names in names.items()},
+            "modules": len(modules),
+            "setup_seconds": round(setup_seconds, 2),
+            "hydrate_seconds": round(hydrate_seconds, 2) if hydrate_seconds is not None else None,
+            "hydrated_entities": hydrated,
+            "hydrate_timeout_seconds": hydrate_timeout,
+            "rss_empty_mb": round(rss_empty / 1024 / 1024, 1),
+            "rss_hydrated_mb": round(rss_hydrated / 1024 / 1024, 1),
+            "memory_per_entity_kb": round((rss_hydrated - rss_empty) / len(entity_ids) / 1024, 2) if entity_ids else None,
+            **steady,
+            "commands": commands,
+            "bus": module.hdl.stats(),
+        }
+        print(json.dumps({key: value for key, value in result.items() if key != "bus"}, indent=2))
+        if args.output:
+            await hass.async_add_executor_job(_save, args.output, result)
+    finally:
+        if hass is not None:
+            await hass.async_stop()
+        simulator.terminate()
+        simulator.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the integration at scale against the gateway simulator.")
+    parser.add_argument("--lights", type=int, default=1200)
+    parser.add_argument("--switches", type=int, default=480)
+    parser.add_argument("--sensors", type=int, default=200)
+    parser.add_argument("--climates", type=int, default=120)
+    parser.add_argument("--dimmer-channels", type=int, default=12)
+    parser.add_argument("--relay-channels", type=int, default=12)
+    parser.add_argument("--gateway", default="127.0.0.2", help="address the simulator listens on")
+    parser.add_argument("--port", type=int, default=6000)
+    parser.add_argument("--simulator-args", default="", help="extra gateway_simulator.py options")
+    parser.add_argument("--hydrate-timeout", type=float,
+                        help="seconds to wait for hydration (default: HYDRATE_SECONDS_PER_ENTITY per entity, at least MIN_HYDRATE_TIMEOUT)")
+    parser.add_argument("--steady-seconds", type=float, default=60.0)
+    parser.add_argument("--commands", type=int, default=50, help="light.turn_on calls timed after the steady window")
+    parser.add_argument("--command-timeout", type=float, default=5.0)
+    parser.add_argument("--output", help="save results as JSON to this file")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()